@@ -0,0 +1,55 @@
+"""Benchmark `import socials` and CLI startup time.
+
+Run with `python benchmarks/import_time.py`. Each measurement starts a fresh
+interpreter, so the numbers include interpreter startup; compare them against
+the `python -c pass` baseline that is printed first.
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+import time
+
+RUNS = 20
+
+CASES = {
+    "python -c pass": [sys.executable, "-c", "pass"],
+    "import socials": [sys.executable, "-c", "import socials"],
+    "socials.parse(github)": [
+        sys.executable,
+        "-c",
+        "import socials; socials.parse('https://github.com/lorey')",
+    ],
+    "socials check": [
+        sys.executable,
+        "-m",
+        "socials.cli",
+        "check",
+        "https://github.com/lorey",
+    ],
+}
+
+
+def measure(command: list[str], runs: int = RUNS) -> list[float]:
+    """Run a command repeatedly and return wall-clock times in milliseconds."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, capture_output=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    """Print median and p90 startup times for each case."""
+    for name, command in CASES.items():
+        timings = sorted(measure(command))
+        median = statistics.median(timings)
+        p90 = timings[int(len(timings) * 0.9) - 1]
+        print(f"{name:<24} median {median:7.1f} ms   p90 {p90:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
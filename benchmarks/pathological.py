@@ -0,0 +1,78 @@
+"""Benchmark worst-case parse time on adversarial inputs.
+
+Run with `python benchmarks/pathological.py`. For each regex backend that is
+installed, prints the slowest per-URL time over families of junk inputs
+(long paths, repeated dots, deep subdomains) of growing length: once through
+`Extractor.parse()`, which rejects inputs longer than `MAX_URL_LENGTH` before
+any pattern runs, and once through the parsers directly, which shows how the
+engine itself scales.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import TYPE_CHECKING
+
+from socials import Extractor
+from socials.platforms import DEFAULT_PARSERS
+from socials.regex import MAX_URL_LENGTH, set_backend
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+FAMILIES = {
+    "repeated dots": lambda n: "https://" + "a." * n + "linkedin.com/in/x",
+    "deep subdomain": lambda n: "https://" + "a-." * n + "facebook.com/x!",
+    "long username": lambda n: "https://github.com/" + "a" * n + "!",
+    "long path": lambda n: "https://www.linkedin.com/pub/x" + "/a" * n + "!",
+    "long handle": lambda n: "https://twitter.com/" + "_" * n + "/!",
+}
+SIZES = [100, 1_000, 10_000, 100_000]
+
+RUNS = 5
+
+
+def _slowest(parse: Callable[[str], object], urls: list[str]) -> float:
+    """Return the slowest mean time per URL, in microseconds."""
+    for url in urls:
+        parse(url)  # compile the patterns first
+    return (
+        max(timeit.timeit(lambda u=url: parse(u), number=RUNS) / RUNS for url in urls)
+        * 1_000_000
+    )
+
+
+def _parse_direct(url: str) -> object:
+    """Run every HTTP parser's patterns on a URL, skipping routing."""
+    for lazy in DEFAULT_PARSERS.values():
+        if "https" in lazy.schemes:
+            lazy.parse(url)
+    return None
+
+
+def main() -> None:
+    """Print worst-case per-URL times by backend, family and input length."""
+    for backend in ("re", "re2"):
+        try:
+            set_backend(backend)
+        except ImportError:
+            print(f"{backend}: not installed, skipped\n")
+            continue
+        extractor = Extractor()
+        print(f"backend {backend} (MAX_URL_LENGTH={MAX_URL_LENGTH})")
+        print(f"{'family':<16}{'length':>9}{'extractor':>14}{'patterns':>14}")
+        for family, make in FAMILIES.items():
+            for size in SIZES:
+                urls = [make(size)]
+                guarded = _slowest(extractor.parse, urls)
+                direct = _slowest(_parse_direct, urls)
+                print(
+                    f"{family:<16}{len(urls[0]):>9}"
+                    f"{guarded:>11.1f} µs{direct:>11.1f} µs",
+                )
+        print()
+    set_backend("re")
+
+
+if __name__ == "__main__":
+    main()
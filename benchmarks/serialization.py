@@ -0,0 +1,47 @@
+"""Benchmark the wire format against pickle.
+
+Run with `python benchmarks/serialization.py`.
+"""
+
+from __future__ import annotations
+
+import pickle
+import timeit
+
+import socials
+from socials import wire
+
+TEMPLATES = [
+    "https://github.com/user{}",
+    "https://github.com/user{}/socials",
+    "https://twitter.com/user{}",
+    "https://linkedin.com/in/user{}",
+    "https://facebook.com/user{}",
+    "https://youtube.com/@user{}",
+    "mailto:user{}@example.com",
+]
+URLS = [template.format(i) for i in range(1000) for template in TEMPLATES]
+
+RUNS = 5
+
+
+def main() -> None:
+    """Print size and round-trip time for pickle and the wire format."""
+    extraction = socials.parse_all(URLS)
+    cases = {
+        "pickle": (pickle.dumps, pickle.loads),
+        "wire": (wire.dumps_extraction, wire.loads_extraction),
+    }
+    print(f"{len(extraction.all())} results")
+    for name, (dump, load) in cases.items():
+        data = dump(extraction)
+        seconds_dump = timeit.timeit(lambda d=dump: d(extraction), number=RUNS) / RUNS
+        seconds_load = timeit.timeit(lambda f=load, x=data: f(x), number=RUNS) / RUNS
+        print(
+            f"{name:<8} {len(data):>9} bytes   "
+            f"dump {seconds_dump * 1000:7.2f} ms   load {seconds_load * 1000:7.2f} ms",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark threaded batch parsing.
+
+Run with `python benchmarks/threads.py`. Prints throughput of
+`Extractor.parse_batch(urls, threads=N)` for growing N. On a regular (GIL)
+build threads add overhead; on a free-threaded build (e.g. `python3.13t`)
+throughput scales with the number of cores.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import timeit
+
+from socials import Extractor
+
+TEMPLATES = [
+    "https://github.com/user{}",
+    "https://github.com/user{}/socials",
+    "https://twitter.com/user{}",
+    "https://de.linkedin.com/in/user{}",
+    "https://facebook.com/user{}",
+    "https://youtube.com/@user{}",
+    "mailto:user{}@example.com",
+    "https://example.com/page{}",
+]
+URLS = [template.format(i) for i in range(25_000) for template in TEMPLATES]
+
+RUNS = 3
+
+
+def main() -> None:
+    """Print URLs per second and speedup by thread count."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    gil = "enabled" if is_gil_enabled() else "disabled"
+    print(f"Python {sys.version.split()[0]}, GIL {gil}, {os.cpu_count()} CPUs")
+    print(f"{len(URLS)} URLs per run")
+
+    extractor = Extractor()
+    extractor.parse_batch(URLS[: len(TEMPLATES)])  # load parsers and patterns
+    baseline = None
+    for threads in (None, 1, 2, 4, 8):
+        seconds = (
+            timeit.timeit(
+                lambda n=threads: extractor.parse_batch(URLS, threads=n),
+                number=RUNS,
+            )
+            / RUNS
+        )
+        baseline = baseline or seconds
+        label = "sequential" if threads is None else f"{threads} threads"
+        print(
+            f"{label:<12} {len(URLS) / seconds:>12,.0f} URLs/s"
+            f"   {baseline / seconds:5.2f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
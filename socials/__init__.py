@@ -6,15 +6,49 @@ Social Account Detection and Extraction for Python.
 from __future__ import annotations
 
 import warnings
-from importlib.metadata import version
+from typing import TYPE_CHECKING
 
-from socials.extractor import Extraction, Extractor
+from socials.extractor import BatchResult, Extraction, Extractor, ParseFailure
 from socials.protocols import ParseError, PlatformParser, SocialsURL
 
-__version__ = version("socials")
+if TYPE_CHECKING:
+    from socials.compact import CompactExtraction
 
-# Default extractor instance for module-level API
-_default_extractor = Extractor()
+# Default extractor instance for module-level API (created on first use)
+_default_extractor: Extractor | None = None
+
+
+def _get_default_extractor() -> Extractor:
+    """Return the default extractor, creating it on first use."""
+    global _default_extractor  # noqa: PLW0603
+    if _default_extractor is None:
+        _default_extractor = Extractor()
+    return _default_extractor
+
+
+def __getattr__(name: str) -> object:
+    """Resolve `__version__`, `CompactExtraction` and optional helpers lazily.
+
+    importlib.metadata is slow to import, the compact store (and the wire
+    format it uses) is rarely needed, and the vectorized helpers are only
+    usable with the `pandas` extra installed.
+    """
+    if name == "CompactExtraction":
+        from socials.compact import CompactExtraction  # noqa: PLC0415
+
+        return CompactExtraction
+    if name in ("parse_array", "parse_series"):
+        from socials import vectorized  # noqa: PLC0415
+
+        return getattr(vectorized, name)
+    if name == "__version__":
+        from importlib.metadata import version  # noqa: PLC0415
+
+        value = version("socials")
+        globals()["__version__"] = value
+        return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 
 def parse(url: str) -> SocialsURL | None:
@@ -34,7 +68,7 @@ def parse(url: str) -> SocialsURL | None:
         ```
 
     """
-    return _default_extractor.parse(url)
+    return _get_default_extractor().parse(url)
 
 
 def parse_all(urls: list[str]) -> Extraction:
@@ -53,7 +87,7 @@ def parse_all(urls: list[str]) -> Extraction:
         ```
 
     """
-    return _default_extractor.extract(urls)
+    return _get_default_extractor().extract(urls)
 
 
 def extract(urls: list[str]) -> Extraction:
@@ -74,14 +108,17 @@ def extract(urls: list[str]) -> Extraction:
         DeprecationWarning,
         stacklevel=2,
     )
-    return _default_extractor.extract(urls)
+    return _get_default_extractor().extract(urls)
 
 
 __all__ = [
     # Classes
+    "BatchResult",
+    "CompactExtraction",
     "Extraction",
     "Extractor",
     "ParseError",
+    "ParseFailure",
     "PlatformParser",
     "SocialsURL",
     # Metadata
@@ -90,4 +127,6 @@ __all__ = [
     "extract",  # deprecated
     "parse",
     "parse_all",
+    "parse_array",
+    "parse_series",
 ]
@@ -0,0 +1,537 @@
+"""Result caches for `Extractor(cache=...)`."""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import sqlite3
+import struct
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, cast
+
+from socials import wire
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from os import PathLike
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from socials.protocols import SocialsURL
+
+# Marshal format version for cached values (see socials.wire)
+_MARSHAL_VERSION = 4
+
+# Size of the URL digest used as the key of persistent caches
+_KEY_BYTES = 16
+
+
+def _url_key(url: str) -> bytes:
+    """Return the fixed-size digest persistent caches key a URL by."""
+    return hashlib.blake2b(
+        url.encode("utf-8", "surrogatepass"),
+        digest_size=_KEY_BYTES,
+    ).digest()
+
+
+def _encode(value: SocialsURL | str) -> bytes | None:
+    """Encode a result (as its wire tuple) or a failure reason.
+
+    Returns:
+        Encoded bytes, or None for result types without a wire type code.
+
+    """
+    if isinstance(value, str):
+        return marshal.dumps(value, _MARSHAL_VERSION)
+    try:
+        row = wire.to_tuple(value)
+    except ValueError:
+        return None
+    return marshal.dumps(row, _MARSHAL_VERSION)
+
+
+def _decode(data: bytes) -> SocialsURL | str:
+    """Decode a value produced by `_encode()`."""
+    value = marshal.loads(data)  # noqa: S302
+    if isinstance(value, str):
+        return value
+    return wire.from_tuple(value)
+
+
+def parser_stamp() -> str:
+    """Return a stamp identifying the installed parsers.
+
+    Persistent caches compare it with the stamp they were written with and
+    discard their entries when it changed, e.g. after upgrading socials or a
+    plugin, so outdated outcomes are never served.
+
+    Returns:
+        String made of the socials version, the wire format version and the
+        available parsers.
+
+    """
+    from socials import __version__  # noqa: PLC0415
+    from socials.platforms import available_parsers  # noqa: PLC0415
+
+    parsers = ",".join(
+        f"{name}={getattr(parser, 'target', type(parser).__qualname__)}"
+        for name, parser in sorted(available_parsers().items())
+    )
+    return f"socials {__version__}; wire {wire.WIRE_VERSION}; parsers {parsers}"
+
+
+class LRUCache:
+    """Thread-safe, size-bounded cache that evicts the least recently used URL.
+
+    Implements the `ResultCache` protocol and counts hits and misses.
+    """
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of cached URLs.
+
+        Raises:
+            ValueError: If maxsize is not positive.
+
+        """
+        if maxsize <= 0:
+            msg = f"maxsize must be positive, got {maxsize}"
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[str, SocialsURL | str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return (
+            f"LRUCache(maxsize={self.maxsize}, size={len(self._data)}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+    def __len__(self) -> int:
+        """Return the number of cached URLs."""
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a URL is cached (without updating its recency)."""
+        return key in self._data
+
+    def get(self, key: str, /) -> SocialsURL | str | None:
+        """Return the cached outcome for a URL and mark it as recently used.
+
+        Args:
+            key: Input URL.
+
+        Returns:
+            Cached result or failure reason, or None if the URL is not cached.
+
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key: str, value: SocialsURL | str, /) -> None:
+        """Cache the outcome for a URL, evicting the oldest entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class SQLiteCache:
+    """Persistent cache in an SQLite database, shared across runs.
+
+    Implements the `ResultCache` protocol. Entries are keyed by a 128-bit
+    digest of the URL and store the result in the wire format (or the failure
+    reason). The database records the `parser_stamp()` it was written with;
+    when it differs, all entries are discarded on open.
+
+    Writes are buffered and committed in batches of `batch_size`; call
+    `flush()` or `close()` (or use the cache as a context manager) to persist
+    the rest. The cache is thread-safe. Results of plugin types without a
+    wire type code are not persisted.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        *,
+        stamp: str | None = None,
+        batch_size: int = 10_000,
+    ) -> None:
+        """Open or create the cache database.
+
+        Args:
+            path: Database file (created if missing).
+            stamp: Stamp identifying the parsers; defaults to
+                `parser_stamp()`. Include extractor settings (platforms,
+                normalization) if differently configured extractors use
+                the same file.
+            batch_size: Number of writes buffered before committing.
+
+        """
+        self.path = path
+        self.stamp = stamp if stamp is not None else parser_stamp()
+        self.batch_size = batch_size
+        self.hits = 0
+        self.misses = 0
+        self._pending: dict[bytes, bytes] = {}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)",
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key BLOB PRIMARY KEY, value BLOB NOT NULL) WITHOUT ROWID",
+            )
+            row = self._db.execute(
+                "SELECT value FROM meta WHERE key = 'stamp'",
+            ).fetchone()
+            if row is None or row[0] != self.stamp:
+                self._db.execute("DELETE FROM results")
+                self._db.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('stamp', ?)",
+                    (self.stamp,),
+                )
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return (
+            f"SQLiteCache({str(self.path)!r}, hits={self.hits}, misses={self.misses})"
+        )
+
+    def __enter__(self) -> Self:
+        """Return the cache."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Flush pending writes and close the database."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of cached URLs, including pending writes."""
+        with self._lock:
+            self._flush()
+            (count,) = self._db.execute("SELECT COUNT(*) FROM results").fetchone()
+        return int(count)
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a URL is cached."""
+        if not isinstance(key, str):
+            return False
+        with self._lock:
+            return self._lookup(_url_key(key)) is not None
+
+    def _lookup(self, digest: bytes) -> bytes | None:
+        """Return the encoded value for a digest (the lock must be held)."""
+        data = self._pending.get(digest)
+        if data is not None:
+            return data
+        row = self._db.execute(
+            "SELECT value FROM results WHERE key = ?",
+            (digest,),
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def get(self, key: str, /) -> SocialsURL | str | None:
+        """Return the cached outcome for a URL.
+
+        Args:
+            key: Input URL.
+
+        Returns:
+            Cached result or failure reason, or None if the URL is not cached.
+
+        """
+        digest = _url_key(key)
+        with self._lock:
+            data = self._lookup(digest)
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return _decode(data)
+
+    def __setitem__(self, key: str, value: SocialsURL | str, /) -> None:
+        """Cache the outcome for a URL, committing when the batch is full."""
+        data = _encode(value)
+        if data is None:
+            return
+        with self._lock:
+            self._pending[_url_key(key)] = data
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def _flush(self) -> None:
+        """Commit pending writes (the lock must be held)."""
+        if not self._pending:
+            return
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?)",
+                self._pending.items(),
+            )
+        self._pending.clear()
+
+    def flush(self) -> None:
+        """Commit pending writes to disk."""
+        with self._lock:
+            self._flush()
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock, self._db:
+            self._pending.clear()
+            self._db.execute("DELETE FROM results")
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        with self._lock:
+            self._flush()
+            self._db.close()
+
+
+class SharedMemoryCache:
+    """Fixed-size cache in shared memory, shared by forked worker processes.
+
+    Implements the `ResultCache` protocol. The cache is an open-addressing
+    hash table over a `multiprocessing.shared_memory` block: every slot holds
+    a 128-bit digest of the URL, a CRC32 checksum, and the encoded outcome
+    (as in `SQLiteCache`). Create it before forking so all workers read and
+    write the same table; unrelated processes can `attach()` to it by name.
+
+    Processes don't lock each other out. A reader that races a writer sees a
+    checksum mismatch and treats the slot as a miss. When all probed slots
+    are taken, the URL's home slot is overwritten, so the cache never grows.
+    Outcomes that don't fit into a slot are not cached.
+    """
+
+    # Slot: digest, CRC32 of digest and payload, payload length, payload
+    _SLOT_HEADER = struct.Struct(f"<{_KEY_BYTES}sIH")
+    # Table: magic, number of slots, slot size
+    _HEADER = struct.Struct("<8sII")
+    _MAGIC = b"socials" + bytes([wire.WIRE_VERSION])
+    # Slots probed per lookup before giving up (and evicting on insert)
+    _PROBES = 8
+
+    def __init__(
+        self,
+        slots: int = 65536,
+        slot_size: int = 256,
+        *,
+        name: str | None = None,
+    ) -> None:
+        """Create a new shared table, or attach to an existing one.
+
+        Args:
+            slots: Number of slots (maximum number of cached URLs).
+            slot_size: Bytes per slot, including a 22-byte slot header.
+            name: Name of an existing table to attach to; its layout is used
+                and slots and slot_size are ignored.
+
+        Raises:
+            ValueError: If slots is not positive, slot_size is too small, or
+                the named block is not a compatible cache table.
+
+        """
+        from multiprocessing.shared_memory import SharedMemory  # noqa: PLC0415
+
+        self._owner = name is None
+        if name is None:
+            if slots <= 0:
+                msg = f"slots must be positive, got {slots}"
+                raise ValueError(msg)
+            if slot_size <= self._SLOT_HEADER.size:
+                msg = f"slot_size must be larger than {self._SLOT_HEADER.size}"
+                raise ValueError(msg)
+            self._shm = SharedMemory(
+                create=True,
+                size=self._HEADER.size + slots * slot_size,
+            )
+            self._buf = cast("memoryview", self._shm.buf)
+            self._HEADER.pack_into(self._buf, 0, self._MAGIC, slots, slot_size)
+        else:
+            # Only the creator may unlink the block when it exits
+            if sys.version_info >= (3, 13):
+                self._shm = SharedMemory(name=name, track=False)
+            else:
+                self._shm = SharedMemory(name=name)
+                from multiprocessing import resource_tracker  # noqa: PLC0415
+
+                resource_tracker.unregister(self._shm._name, "shared_memory")  # type: ignore[attr-defined]  # noqa: SLF001
+            self._buf = cast("memoryview", self._shm.buf)
+            if self._HEADER.unpack_from(self._buf, 0)[0] != self._MAGIC:
+                self.close()
+                msg = f"Shared memory block {name!r} is not a compatible cache"
+                raise ValueError(msg)
+        _, self.slots, self.slot_size = self._HEADER.unpack_from(self._buf, 0)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def attach(cls, name: str) -> SharedMemoryCache:
+        """Attach to a table created by an unrelated process.
+
+        Forked workers use the inherited cache directly instead, as they share
+        the creator's resource tracker.
+
+        Args:
+            name: `name` of the creating cache.
+
+        Returns:
+            Cache backed by the same shared memory.
+
+        """
+        return cls(name=name)
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block, for `attach()`."""
+        return self._shm.name
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return (
+            f"SharedMemoryCache({self.name!r}, slots={self.slots}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+    def __enter__(self) -> Self:
+        """Return the cache."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the cache, and unlink it if this process created it."""
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def _offsets(self, digest: bytes) -> Iterator[int]:
+        """Yield the byte offsets of the slots probed for a digest."""
+        home = int.from_bytes(digest[:8], "little") % self.slots
+        for probe in range(min(self._PROBES, self.slots)):
+            index = (home + probe) % self.slots
+            yield self._HEADER.size + index * self.slot_size
+
+    def _read(self, offset: int, digest: bytes) -> bytes | None:
+        """Return the verified payload of a slot if it holds the digest."""
+        buf = self._buf
+        key, crc, length = self._SLOT_HEADER.unpack_from(buf, offset)
+        if key != digest or not length:
+            return None
+        start = offset + self._SLOT_HEADER.size
+        payload = bytes(buf[start : start + length])
+        if zlib.crc32(payload, zlib.crc32(key)) != crc:
+            return None  # torn by a concurrent write
+        return payload
+
+    def __len__(self) -> int:
+        """Return the number of occupied slots."""
+        header = self._SLOT_HEADER
+        buf = self._buf
+        return sum(
+            bool(header.unpack_from(buf, self._HEADER.size + index * self.slot_size)[2])
+            for index in range(self.slots)
+        )
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a URL is cached."""
+        if not isinstance(key, str):
+            return False
+        digest = _url_key(key)
+        return any(self._read(offset, digest) for offset in self._offsets(digest))
+
+    def get(self, key: str, /) -> SocialsURL | str | None:
+        """Return the cached outcome for a URL.
+
+        Args:
+            key: Input URL.
+
+        Returns:
+            Cached result or failure reason, or None if the URL is not cached.
+
+        """
+        digest = _url_key(key)
+        for offset in self._offsets(digest):
+            payload = self._read(offset, digest)
+            if payload is not None:
+                self.hits += 1
+                return _decode(payload)
+            if not self._SLOT_HEADER.unpack_from(self._buf, offset)[2]:
+                break  # empty slot ends the probe sequence
+        self.misses += 1
+        return None
+
+    def __setitem__(self, key: str, value: SocialsURL | str, /) -> None:
+        """Cache the outcome for a URL, overwriting a slot if necessary."""
+        payload = _encode(value)
+        if payload is None or len(payload) > self.slot_size - self._SLOT_HEADER.size:
+            return
+        digest = _url_key(key)
+        buf = self._buf
+        offsets = list(self._offsets(digest))
+        target = offsets[0]
+        for offset in offsets:
+            slot_key, _, length = self._SLOT_HEADER.unpack_from(buf, offset)
+            if not length or slot_key == digest:
+                target = offset
+                break
+        start = target + self._SLOT_HEADER.size
+        # Payload first, header last: a reader in between fails the checksum
+        buf[start : start + len(payload)] = payload
+        crc = zlib.crc32(payload, zlib.crc32(digest))
+        self._SLOT_HEADER.pack_into(buf, target, digest, crc, len(payload))
+
+    def clear(self) -> None:
+        """Empty all slots and reset this process's statistics."""
+        size = self.slots * self.slot_size
+        self._buf[self._HEADER.size : self._HEADER.size + size] = bytes(size)
+        self.hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        """Detach this process from the shared memory."""
+        self._buf.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Free the shared memory block (call once, from the creator)."""
+        self._shm.unlink()
@@ -3,19 +3,23 @@
 from __future__ import annotations
 
 import sys
-from typing import Optional
+from pathlib import Path  # noqa: TC003 (typer reads annotations at runtime)
+from typing import TYPE_CHECKING, Optional
 
 import typer
 
 import socials
-from socials.platforms import DEFAULT_PARSERS
+from socials.platforms import DEFAULT_PARSERS, available_parsers
+
+if TYPE_CHECKING:
+    from socials.protocols import SocialsURL
 
 app = typer.Typer(
     help="Extract social media profile URLs from a list of URLs.",
     no_args_is_help=True,
 )
 
-# Get available platform names from default parsers
+# Built-in platform names (plugins are discovered when a command runs)
 AVAILABLE_PLATFORMS = list(DEFAULT_PARSERS.keys())
 
 
@@ -52,6 +56,11 @@ def extract(
         "-p",
         help=f"Filter by platform: {', '.join(AVAILABLE_PLATFORMS)}",
     ),
+    cache: Optional[Path] = typer.Option(
+        None,
+        "--cache",
+        help="SQLite file caching parse outcomes across runs.",
+    ),
 ) -> None:
     """Extract social media URLs from input."""
     if file is None:
@@ -66,33 +75,265 @@ def extract(
         lines = file.read().strip().split("\n")
 
     urls = [line.strip() for line in lines if line.strip()]
-    extraction = socials.extract(urls)
-
-    if platform:
-        if platform not in AVAILABLE_PLATFORMS:
+    if platform and platform not in DEFAULT_PARSERS:
+        available = list(available_parsers().keys())
+        if platform not in available:
             typer.echo(f"Error: Unknown platform '{platform}'", err=True)
-            typer.echo(f"Available: {', '.join(AVAILABLE_PLATFORMS)}", err=True)
+            typer.echo(f"Available: {', '.join(available)}", err=True)
             raise typer.Exit(1)
-        by_plat = extraction.by_platform()
-        for url_obj in by_plat.get(platform, []):
-            typer.echo(url_obj.url)
-    else:
-        for url_obj in extraction.all():
-            typer.echo(f"{url_obj.platform}\t{url_obj.url}")
+
+    # A --cache file means the caller wants this process to parse
+    found = _parse_in_daemon(urls) if cache is None else None
+    if found is None:
+        found = [(r.platform, r.url) for r in _parse_in_process(urls, cache)]
+    for result_platform, url in found:
+        if not platform:
+            typer.echo(f"{result_platform}\t{url}")
+        elif result_platform == platform:
+            typer.echo(url)
+
+
+def _parse_in_daemon(urls: list[str]) -> list[tuple[str, str]] | None:
+    """Return platform and URL of the results from a running daemon, if any."""
+    from socials import daemon  # noqa: PLC0415
+
+    outcomes = daemon.request(urls)
+    if outcomes is None:
+        return None
+    results = (outcome["result"] for outcome in outcomes)
+    return [(result["platform"], result["url"]) for result in results if result]
+
+
+def _parse_in_process(urls: list[str], cache: Path | None) -> list[SocialsURL]:
+    """Parse URLs in this process, optionally through a SQLite cache."""
+    if cache is None:
+        return socials.extract(urls).all()
+    from socials.cache import SQLiteCache  # noqa: PLC0415
+
+    with SQLiteCache(cache) as result_cache:
+        return socials.Extractor(cache=result_cache).extract(urls).all()
 
 
 @app.command()
 def check(
-    url: str = typer.Argument(..., help="URL to check"),
+    urls: Optional[list[str]] = typer.Argument(
+        None,
+        help="URLs to check. Reads --file or stdin if none are given.",
+        show_default=False,
+    ),
+    file: Optional[typer.FileText] = typer.Option(
+        None,
+        "--file",
+        "-f",
+        help="File containing URLs (one per line).",
+    ),
+    summary: bool = typer.Option(
+        False,  # noqa: FBT003
+        "--summary",
+        "-s",
+        help="Print counts per platform to stderr.",
+    ),
+    null: str = typer.Option(
+        "-",
+        "--null",
+        help="Marker printed for unrecognized URLs in batch mode.",
+    ),
 ) -> None:
-    """Check which platform a URL belongs to."""
-    result = socials.parse(url)
-    if result:
-        typer.echo(result.platform)
-    else:
-        typer.echo("unknown", err=True)
+    """Check which platform and entity type URLs belong to.
+
+    A single URL argument prints its platform (or "unknown" on stderr). With
+    several URLs, --file or stdin, each input line gets one output line with
+    the platform and entity type, or the null marker.
+    """
+    if urls and len(urls) == 1 and file is None:
+        (found,) = _check_urls(urls)
+        typer.echo(found[0] if found is not None else "unknown", err=found is None)
+        if summary:
+            _echo_check_summary([found])
+        if found is None:
+            raise typer.Exit(1)
+        return
+
+    lines = list(urls or [])
+    if file is not None:
+        lines.extend(file.read().splitlines())
+    elif not lines:
+        if sys.stdin.isatty():
+            typer.echo(
+                "Error: No input provided. Pipe URLs or specify a file.",
+                err=True,
+            )
+            raise typer.Exit(1)
+        lines = sys.stdin.read().splitlines()
+
+    # Lines stay aligned with the input: blank lines get the null marker too
+    found_all = _check_urls([line.strip() for line in lines])
+    output = [
+        f"{found[0]}\t{found[1]}" if found is not None else null for found in found_all
+    ]
+    if output:
+        typer.echo("\n".join(output))
+    if summary:
+        _echo_check_summary(found_all)
+    if None in found_all:
+        raise typer.Exit(1)
+
+
+def _check_urls(urls: list[str]) -> list[tuple[str, str] | None]:
+    """Return platform and entity type per URL, through the daemon if running."""
+    from socials import daemon  # noqa: PLC0415
+
+    outcomes = daemon.request(urls)
+    if outcomes is not None:
+        results = [outcome["result"] for outcome in outcomes]
+        return [
+            (result["platform"], result["entity_type"]) if result else None
+            for result in results
+        ]
+    batch = socials.Extractor().parse_batch(urls)
+    return [
+        (result.platform, result.entity_type) if result is not None else None
+        for result in batch
+    ]
+
+
+def _echo_check_summary(found_all: list[tuple[str, str] | None]) -> None:
+    """Print the number of URLs checked, recognized and per platform to stderr."""
+    from collections import Counter  # noqa: PLC0415
+
+    platforms = Counter(found[0] for found in found_all if found is not None)
+    recognized = sum(platforms.values())
+    typer.echo(
+        f"{len(found_all)} checked, {recognized} recognized, "
+        f"{len(found_all) - recognized} unknown",
+        err=True,
+    )
+    for name, count in platforms.most_common():
+        typer.echo(f"{name}\t{count}", err=True)
+
+
+@app.command()
+def explain(
+    url: str = typer.Argument(..., help="URL to explain"),
+    normalize: bool = typer.Option(
+        False,  # noqa: FBT003
+        "--normalize",
+        "-n",
+        help="Normalize the URL before parsing.",
+    ),
+    unwrap: bool = typer.Option(
+        False,  # noqa: FBT003
+        "--unwrap",
+        help="Parse the target of redirect wrappers (e.g. l.facebook.com).",
+    ),
+) -> None:
+    """Show how a URL is routed and which patterns it matched."""
+    extractor = socials.Extractor(normalize=normalize, unwrap_redirects=unwrap)
+    explanation = extractor.explain(url)
+    typer.echo(explanation.format())
+    if explanation.result is None:
         raise typer.Exit(1)
 
 
+@app.command()
+def serve(  # noqa: PLR0913, PLR0917
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind."),
+    port: int = typer.Option(8000, "--port", help="Port to listen on."),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        min=1,
+        help="Number of worker processes.",
+    ),
+    cache_size: int = typer.Option(
+        65536,
+        "--cache-size",
+        min=1,
+        help="URLs cached per worker, or in total with --shared-cache.",
+    ),
+    shared_cache: bool = typer.Option(
+        False,  # noqa: FBT003
+        "--shared-cache",
+        help="Share one result cache between workers (in shared memory).",
+    ),
+    normalize: bool = typer.Option(
+        False,  # noqa: FBT003
+        "--normalize",
+        "-n",
+        help="Normalize URLs before parsing.",
+    ),
+    unwrap: bool = typer.Option(
+        False,  # noqa: FBT003
+        "--unwrap",
+        help="Parse the target of redirect wrappers (e.g. l.facebook.com).",
+    ),
+    regex: str = typer.Option(
+        "re",
+        "--regex",
+        help="Regex backend: 're' or 're2' (linear time, needs google-re2).",
+    ),
+) -> None:
+    """Serve the extractor over HTTP (single, batch and NDJSON endpoints)."""
+    from socials.cache import LRUCache  # noqa: PLC0415
+    from socials.regex import set_backend  # noqa: PLC0415
+    from socials.server import serve as run_server  # noqa: PLC0415
+
+    try:
+        set_backend(regex)
+    except (ValueError, ImportError) as e:
+        raise typer.BadParameter(str(e), param_hint="--regex") from e
+
+    typer.echo(f"Serving on http://{host}:{port} with {workers} worker(s)", err=True)
+    if not shared_cache:
+        extractor = socials.Extractor(
+            normalize=normalize,
+            unwrap_redirects=unwrap,
+            cache=LRUCache(cache_size),
+        )
+        run_server(host, port, workers=workers, extractor=extractor)
+        return
+
+    from socials.cache import SharedMemoryCache  # noqa: PLC0415
+
+    # Created before the workers fork, unlinked when the server stops
+    with SharedMemoryCache(slots=cache_size) as result_cache:
+        extractor = socials.Extractor(
+            normalize=normalize,
+            unwrap_redirects=unwrap,
+            cache=result_cache,
+        )
+        run_server(host, port, workers=workers, extractor=extractor)
+
+
+@app.command()
+def daemon(
+    socket_path: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        help="Unix socket path (default: $SOCIALS_SOCKET, "
+        "$XDG_RUNTIME_DIR/socials.sock or a per-user file in the temp dir).",
+    ),
+    cache_size: int = typer.Option(
+        65536,
+        "--cache-size",
+        min=1,
+        help="URLs cached by the daemon.",
+    ),
+) -> None:
+    """Keep a warm extractor on a Unix socket for `check` and `extract`."""
+    from socials import daemon as socials_daemon  # noqa: PLC0415
+    from socials.cache import LRUCache  # noqa: PLC0415
+
+    path = socket_path or socials_daemon.default_socket_path()
+    extractor = socials.Extractor(cache=LRUCache(cache_size))
+    typer.echo(f"Listening on {path}", err=True)
+    try:
+        socials_daemon.serve(path, extractor=extractor)
+    except RuntimeError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from e
+
+
 if __name__ == "__main__":
     app()
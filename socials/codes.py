@@ -0,0 +1,126 @@
+"""Integer codes for platform and entity type names.
+
+Codes are small integers that identify a platform or entity type, so large
+extractions can group and filter on integers (and store them in compact
+arrays) instead of strings. Built-in names have fixed codes; names used by
+plugins are assigned the next free code when first seen, so their codes are
+only stable within a process.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+
+
+class _Interner:
+    """Bidirectional mapping between names and integer codes."""
+
+    def __init__(self, names: list[str]) -> None:
+        self._names: list[str] = []
+        self._codes: dict[str, int] = {}
+        self._lock = threading.Lock()
+        for name in names:
+            self.code(name)
+
+    def code(self, name: str) -> int:
+        """Return the code for a name, assigning one if necessary."""
+        try:
+            return self._codes[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._codes:
+                self._codes[name] = len(self._names)
+                self._names.append(sys.intern(name))
+            return self._codes[name]
+
+    def name(self, code: int) -> str:
+        """Return the name for a code."""
+        try:
+            return self._names[code]
+        except IndexError:
+            msg = f"Unknown code: {code}"
+            raise ValueError(msg) from None
+
+
+_platforms = _Interner(
+    [
+        "github",
+        "twitter",
+        "linkedin",
+        "facebook",
+        "instagram",
+        "youtube",
+        "email",
+        "phone",
+    ],
+)
+_entity_types = _Interner(
+    [
+        "profile",
+        "repo",
+        "company",
+        "channel",
+        "email",
+        "phone",
+    ],
+)
+
+
+def platform_code(name: str) -> int:
+    """Return the integer code of a platform.
+
+    Args:
+        name: Platform name (e.g. 'github').
+
+    Returns:
+        Integer code; plugin platforms are assigned one on first use.
+
+    """
+    return _platforms.code(name)
+
+
+def platform_name(code: int) -> str:
+    """Return the platform name for a code.
+
+    Args:
+        code: Integer code returned by `platform_code()`.
+
+    Returns:
+        Platform name.
+
+    Raises:
+        ValueError: If no platform has this code.
+
+    """
+    return _platforms.name(code)
+
+
+def entity_type_code(name: str) -> int:
+    """Return the integer code of an entity type.
+
+    Args:
+        name: Entity type name (e.g. 'profile').
+
+    Returns:
+        Integer code; plugin entity types are assigned one on first use.
+
+    """
+    return _entity_types.code(name)
+
+
+def entity_type_name(code: int) -> str:
+    """Return the entity type name for a code.
+
+    Args:
+        code: Integer code returned by `entity_type_code()`.
+
+    Returns:
+        Entity type name.
+
+    Raises:
+        ValueError: If no entity type has this code.
+
+    """
+    return _entity_types.name(code)
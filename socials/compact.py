@@ -0,0 +1,273 @@
+"""Columnar, memory-compact store for extraction results.
+
+`CompactExtraction` keeps results as parallel arrays instead of a list of
+model instances: wire type codes, platform and entity type codes, and the
+field values of every result as UTF-8 slices of one shared buffer. URL
+objects are only built when they are accessed.
+
+A stored result costs a few dozen bytes plus its field values, compared to
+roughly a kilobyte for a Pydantic instance with its strings, which makes the
+store suitable for batches of many millions of results.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, overload
+
+from socials import codes, wire
+from socials.extractor import Extraction, _result_codes
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from socials.protocols import SocialsURL
+
+
+class CompactExtraction:
+    """Array-backed alternative to `Extraction` for very large batches.
+
+    Supports the read API of `Extraction` (`all()`, `by_platform()`,
+    `by_type()`, `filter()`, `roots()`, `rollup()`, the code arrays) plus
+    `len()`, iteration and indexing. Results are materialized on access, so
+    accessing the same index twice returns equal but distinct objects.
+    """
+
+    def __init__(self, results: Iterable[SocialsURL] = ()) -> None:
+        """Initialize the store.
+
+        Args:
+            results: Parsed URL objects to add.
+
+        """
+        self._type_codes: array[int] = array("H")
+        self._platform_codes: array[int] = array("H")
+        self._entity_type_codes: array[int] = array("H")
+        # Index of the first field of every result in _ends / _nulls
+        self._rows: array[int] = array("Q", [0])
+        # Field i is _buffer[_ends[i]:_ends[i + 1]], or None if _nulls[i]
+        self._ends: array[int] = array("Q", [0])
+        self._nulls = bytearray()
+        self._buffer = bytearray()
+        self.extend(results)
+
+    @classmethod
+    def from_extraction(cls, extraction: Extraction) -> CompactExtraction:
+        """Build a compact store from an extraction.
+
+        Args:
+            extraction: Extraction to convert.
+
+        Returns:
+            CompactExtraction with the same results.
+
+        """
+        return cls(extraction.all())
+
+    def append(self, result: SocialsURL) -> None:
+        """Add a result.
+
+        Args:
+            result: Parsed URL object.
+
+        Raises:
+            ValueError: If the result type has no wire type code.
+
+        """
+        type_code, *values = wire.to_tuple(result)
+        platform_code, entity_type_code = _result_codes(result)
+        buffer = self._buffer
+        ends = self._ends
+        nulls = self._nulls
+        for value in values:
+            if value is None:
+                nulls.append(1)
+            else:
+                buffer += value.encode()
+                nulls.append(0)
+            ends.append(len(buffer))
+        self._type_codes.append(type_code)
+        self._platform_codes.append(platform_code)
+        self._entity_type_codes.append(entity_type_code)
+        self._rows.append(len(nulls))
+
+    def extend(self, results: Iterable[SocialsURL]) -> None:
+        """Add several results.
+
+        Args:
+            results: Parsed URL objects.
+
+        """
+        for result in results:
+            self.append(result)
+
+    def _materialize(self, index: int) -> SocialsURL:
+        """Build the URL object stored at a (non-negative) index."""
+        buffer = self._buffer
+        ends = self._ends
+        nulls = self._nulls
+        row: list[object] = [self._type_codes[index]]
+        for field in range(self._rows[index], self._rows[index + 1]):
+            if nulls[field]:
+                row.append(None)
+            else:
+                row.append(buffer[ends[field] : ends[field + 1]].decode())
+        return wire.from_tuple(row)
+
+    def __len__(self) -> int:
+        """Return the number of stored results."""
+        return len(self._type_codes)
+
+    def __iter__(self) -> Iterator[SocialsURL]:
+        """Iterate over the results in insertion order."""
+        for index in range(len(self._type_codes)):
+            yield self._materialize(index)
+
+    @overload
+    def __getitem__(self, index: int) -> SocialsURL: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[SocialsURL]: ...
+
+    def __getitem__(self, index: int | slice) -> SocialsURL | list[SocialsURL]:
+        """Return the result(s) at an index or slice."""
+        if isinstance(index, slice):
+            return [self._materialize(i) for i in range(*index.indices(len(self)))]
+        size = len(self._type_codes)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            msg = "CompactExtraction index out of range"
+            raise IndexError(msg)
+        return self._materialize(index)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the approximate memory used by the stored columns."""
+        columns = (
+            self._type_codes,
+            self._platform_codes,
+            self._entity_type_codes,
+            self._rows,
+            self._ends,
+        )
+        return (
+            sum(column.itemsize * len(column) for column in columns)
+            + len(self._nulls)
+            + len(self._buffer)
+        )
+
+    def platform_codes(self) -> array[int]:
+        """Return the platform code of every result.
+
+        Returns:
+            Array of integer codes (see `socials.codes`), in result order.
+
+        """
+        return array("H", self._platform_codes)
+
+    def entity_type_codes(self) -> array[int]:
+        """Return the entity type code of every result.
+
+        Returns:
+            Array of integer codes (see `socials.codes`), in result order.
+
+        """
+        return array("H", self._entity_type_codes)
+
+    def all(self) -> list[SocialsURL]:
+        """Return all results.
+
+        Returns:
+            List of all SocialsURL objects.
+
+        """
+        return list(self)
+
+    def by_platform(self) -> dict[str, list[SocialsURL]]:
+        """Group results by platform.
+
+        Returns:
+            Dictionary mapping platform names to lists of URLs.
+
+        """
+        return self._group(self._platform_codes, codes.platform_name)
+
+    def by_type(self) -> dict[str, list[SocialsURL]]:
+        """Group results by entity type.
+
+        Returns:
+            Dictionary mapping entity types to lists of URLs.
+
+        """
+        return self._group(self._entity_type_codes, codes.entity_type_name)
+
+    def _group(
+        self,
+        keys: array[int],
+        name: Callable[[int], str],
+    ) -> dict[str, list[SocialsURL]]:
+        """Group results by integer code and name the groups."""
+        grouped: dict[int, list[SocialsURL]] = {}
+        for index, code in enumerate(keys):
+            grouped.setdefault(code, []).append(self._materialize(index))
+        return {name(code): group for code, group in grouped.items()}
+
+    def filter(
+        self,
+        *,
+        platform: str | None = None,
+        entity_type: str | None = None,
+    ) -> CompactExtraction:
+        """Return the results matching a platform and/or entity type.
+
+        Matching runs on the code arrays; only matching results are
+        materialized.
+
+        Args:
+            platform: Only keep results of this platform.
+            entity_type: Only keep results of this entity type.
+
+        Returns:
+            New CompactExtraction with the matching results.
+
+        """
+        wanted_platform = None if platform is None else codes.platform_code(platform)
+        wanted_type = (
+            None if entity_type is None else codes.entity_type_code(entity_type)
+        )
+        return CompactExtraction(
+            self._materialize(index)
+            for index, (platform_code, entity_type_code) in enumerate(
+                zip(self._platform_codes, self._entity_type_codes),
+            )
+            if (wanted_platform is None or platform_code == wanted_platform)
+            and (wanted_type is None or entity_type_code == wanted_type)
+        )
+
+    def roots(self) -> list[SocialsURL]:
+        """Return the distinct root entities of all results.
+
+        Returns:
+            List of root URLs, deduplicated and in order of first appearance.
+
+        """
+        return list(self.rollup())
+
+    def rollup(self) -> dict[SocialsURL, list[SocialsURL]]:
+        """Group results by their root entity.
+
+        Returns:
+            Dictionary mapping each root URL to the results below it.
+
+        """
+        return self.to_extraction().rollup()
+
+    def to_extraction(self) -> Extraction:
+        """Materialize all results into a regular `Extraction`.
+
+        Returns:
+            Extraction with the same results.
+
+        """
+        return Extraction(self.all())
@@ -0,0 +1,254 @@
+"""Warm parsing daemon for the command line, over a Unix socket.
+
+Each `socials check` or `socials extract` run pays for starting Python and
+loading the parsers. `socials daemon` keeps a warm extractor (with a result
+cache) listening on a local Unix socket, and the CLI commands send their URLs
+there when it is running, falling back to parsing in-process otherwise.
+
+The protocol is NDJSON, as in the HTTP server's batch endpoint: the client
+writes one JSON string (URL) per line and shuts down its side of the
+connection; the daemon answers with one `{"url", "result", "reason"}` object
+per line, in input order.
+
+The client side only uses the standard library, so asking the daemon doesn't
+load any parser; the extractor is imported when the daemon starts.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from socials.extractor import Extractor
+
+# Environment variable overriding the socket path
+SOCKET_ENV = "SOCIALS_SOCKET"
+# Environment variable that, if set (non-empty), stops the CLI using a daemon
+DISABLE_ENV = "SOCIALS_NO_DAEMON"
+
+# Seconds the client waits for a daemon to accept, read a block of URLs or
+# send its first answer, so a stuck daemon is given up on quickly
+CONNECT_TIMEOUT = 1.0
+# Seconds the client waits for each further block of answers
+CLIENT_TIMEOUT = 30.0
+
+_BUFFER_BYTES = 64 * 1024
+# URLs the daemon parses before writing their answers, so the first answer
+# arrives within CONNECT_TIMEOUT even for large batches
+_CHUNK_URLS = 1024
+
+
+def default_socket_path() -> Path:
+    """Return the socket path used by `socials daemon` and the CLI.
+
+    Returns:
+        `$SOCIALS_SOCKET` if set, else `socials.sock` in `$XDG_RUNTIME_DIR`,
+        else a per-user file in the temporary directory.
+
+    """
+    configured = os.environ.get(SOCKET_ENV)
+    if configured:
+        return Path(configured)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "socials.sock"
+    import tempfile  # noqa: PLC0415
+
+    user = os.getuid() if hasattr(os, "getuid") else os.getlogin()
+    return Path(tempfile.gettempdir()) / f"socials-{user}.sock"
+
+
+def request(
+    urls: Sequence[str],
+    path: str | os.PathLike[str] | None = None,
+    *,
+    timeout: float = CLIENT_TIMEOUT,
+    connect_timeout: float = CONNECT_TIMEOUT,
+) -> list[dict[str, Any]] | None:
+    """Parse URLs through a running daemon.
+
+    Only a socket owned by the current user is used, so another user can't
+    answer in the daemon's place at a predictable path.
+
+    Args:
+        urls: URLs to parse.
+        path: Socket path; defaults to `default_socket_path()`.
+        timeout: Seconds to wait for each block of answers after the first.
+        connect_timeout: Seconds to wait to connect, for each block of URLs
+            to be read and for the first answer.
+
+    Returns:
+        One `{"url", "result", "reason"}` dict per URL, in input order, or
+        None if no daemon is running, it failed to answer in time, the
+        socket belongs to another user, or `$SOCIALS_NO_DAEMON` is set, in
+        which case the caller should parse in-process.
+
+    """
+    if os.environ.get(DISABLE_ENV) or not hasattr(socket, "AF_UNIX"):
+        return None
+    path = Path(path) if path is not None else default_socket_path()
+    if not _is_own_socket(path):
+        return None
+    payload = "".join(f"{json.dumps(url)}\n" for url in urls).encode()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(connect_timeout)
+            client.connect(str(path))
+            # Send in blocks so the timeout measures the daemon's progress
+            view = memoryview(payload)
+            for start in range(0, len(view), _BUFFER_BYTES):
+                client.sendall(view[start : start + _BUFFER_BYTES])
+            client.shutdown(socket.SHUT_WR)
+            with client.makefile("rb", buffering=_BUFFER_BYTES) as stream:
+                lines = [stream.readline()]
+                client.settimeout(timeout)
+                lines.extend(stream)
+        outcomes = [json.loads(line) for line in lines if line]
+    except (OSError, ValueError):
+        return None
+    if len(outcomes) != len(urls):
+        return None
+    return outcomes
+
+
+def _is_own_socket(path: Path) -> bool:
+    """Check that a path is a socket owned by the current user."""
+    try:
+        status = path.stat()
+    except OSError:
+        return False
+    if not stat.S_ISSOCK(status.st_mode):
+        return False
+    return not hasattr(os, "getuid") or status.st_uid == os.getuid()
+
+
+class DaemonServer(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server sharing one warm extractor between connections."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        extractor: Extractor | None = None,
+    ) -> None:
+        """Create the server and start listening.
+
+        The socket file is only accessible to the current user. A stale
+        socket file left behind by a daemon that didn't exit cleanly is
+        replaced.
+
+        Args:
+            path: Socket path.
+            extractor: Extractor to use; defaults to one with an `LRUCache`.
+
+        Raises:
+            RuntimeError: If another daemon is listening on the path, or it
+                is taken by a file that is not a socket.
+
+        """
+        from socials.cache import LRUCache  # noqa: PLC0415
+        from socials.extractor import Extractor  # noqa: PLC0415
+        from socials.server import warm  # noqa: PLC0415
+
+        self.path = Path(path)
+        self.extractor = extractor or Extractor(cache=LRUCache())
+        warm(self.extractor)
+        _remove_stale_socket(self.path)
+        super().__init__(str(self.path), _Handler)
+        self.path.chmod(0o600)
+
+    def server_close(self) -> None:
+        """Close the socket and remove the socket file."""
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            self.path.unlink()
+
+
+def _remove_stale_socket(path: Path) -> None:
+    """Remove a socket file nobody listens on; fail if a daemon does."""
+    if not path.exists():
+        return
+    if not path.is_socket():
+        msg = f"{path} exists and is not a socket"
+        raise RuntimeError(msg)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except OSError:
+            path.unlink()
+            return
+    msg = f"A socials daemon is already listening on {path}"
+    raise RuntimeError(msg)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Answers one NDJSON batch per connection."""
+
+    server: DaemonServer
+
+    def handle(self) -> None:
+        """Read URLs until the client shuts down writing, then answer.
+
+        URLs are parsed and answered in chunks, so the client sees the first
+        answers quickly however large the batch is.
+        """
+        from socials.server import result_to_json  # noqa: PLC0415
+
+        try:
+            urls = [json.loads(line) for line in self.rfile if line.strip()]
+        except ValueError:
+            return  # not a socials client; close without answering
+        if not all(isinstance(url, str) for url in urls):
+            return
+        for start in range(0, len(urls), _CHUNK_URLS):
+            chunk = urls[start : start + _CHUNK_URLS]
+            batch = self.server.extractor.parse_batch(chunk)
+            reasons = {failure.position: failure.reason for failure in batch.failures}
+            lines = (
+                json.dumps(
+                    {
+                        "url": url,
+                        "result": result_to_json(result),
+                        "reason": reasons.get(position),
+                    },
+                )
+                for position, (url, result) in enumerate(zip(chunk, batch))
+            )
+            self.wfile.write("".join(f"{line}\n" for line in lines).encode())
+
+
+def serve(
+    path: str | os.PathLike[str] | None = None,
+    *,
+    extractor: Extractor | None = None,
+) -> None:
+    """Run the daemon until interrupted.
+
+    Args:
+        path: Socket path; defaults to `default_socket_path()`.
+        extractor: Extractor to use; defaults to one with an `LRUCache`.
+
+    Raises:
+        RuntimeError: If Unix sockets are unavailable, or the path is taken
+            (see `DaemonServer`).
+
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        msg = "The socials daemon requires Unix domain sockets"
+        raise RuntimeError(msg)
+    server = DaemonServer(path or default_socket_path(), extractor)
+    # Remove the socket file on SIGTERM as well as on Ctrl-C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    with server, contextlib.suppress(KeyboardInterrupt):
+        server.serve_forever()
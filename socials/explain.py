@@ -0,0 +1,73 @@
+"""Explanations of how a URL was routed and parsed."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from socials.extractor import FailureReason
+    from socials.platforms.base import PatternAttempt
+    from socials.protocols import SocialsURL
+
+
+def _format_seconds(seconds: float) -> str:
+    """Format a duration in microseconds."""
+    return f"{seconds * 1_000_000:.1f} µs"
+
+
+class Explanation(NamedTuple):
+    """Trace of parsing one URL, returned by `Extractor.explain()`.
+
+    Attributes:
+        url: The input URL.
+        scheme: Scheme used for routing (empty for schemeless input).
+        hostname: Host used for routing (empty if the URL has none).
+        candidates: URL strings handed to the parser, in order (more than one
+            if normalization offered a fallback).
+        parser: Platform of the parser selected by the registry, or None.
+        patterns: Every pattern match attempted, with its timing.
+        result: The parsed result, or None.
+        reason: Why the URL was not recognized, or None if it was.
+        seconds: Total time spent parsing.
+
+    """
+
+    url: str
+    scheme: str
+    hostname: str
+    candidates: tuple[str, ...]
+    parser: str | None
+    patterns: tuple[PatternAttempt, ...]
+    result: SocialsURL | None
+    reason: FailureReason | None
+    seconds: float
+
+    def format(self) -> str:
+        """Return a human-readable, multi-line report.
+
+        Returns:
+            Report listing routing, pattern attempts and the outcome.
+
+        """
+        lines = [
+            f"url:      {self.url}",
+            f"scheme:   {self.scheme or '(none)'}",
+            f"host:     {self.hostname or '(none)'}",
+        ]
+        if self.candidates != (self.url,):
+            lines.extend(f"tried:    {candidate}" for candidate in self.candidates)
+        lines.append(f"parser:   {self.parser or '(none)'}")
+        if self.patterns:
+            lines.append("patterns:")
+            for attempt in self.patterns:
+                status = "match   " if attempt.matched else "no match"
+                lines.append(
+                    f"  {status} {_format_seconds(attempt.seconds):>10}  "
+                    f"{attempt.pattern}",
+                )
+        if self.result is not None:
+            lines.append(f"result:   {self.result.platform} {self.result.entity_type}")
+        else:
+            lines.append(f"result:   none ({self.reason})")
+        lines.append(f"time:     {_format_seconds(self.seconds)}")
+        return "\n".join(lines)
@@ -2,30 +2,325 @@
 
 from __future__ import annotations
 
+import threading
 import warnings
+import weakref
+from array import array
 from collections import defaultdict
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from time import perf_counter
+from typing import TYPE_CHECKING, Literal, NamedTuple, cast
+from urllib.parse import urlsplit
 
-from socials.platforms import DEFAULT_PARSERS
-from socials.platforms.misc import EmailURL
+from socials import codes
+from socials.normalize import split_url
+from socials.platforms import DEFAULT_PARSERS, available_parsers
+from socials.platforms.base import trace_patterns
 from socials.protocols import ParseError
+from socials.redirects import MAX_REDIRECT_DEPTH, REDIRECT_WRAPPERS, unwrap_once
+from socials.regex import is_plausible_url
 from socials.registry import Registry
 
 if TYPE_CHECKING:
-    from socials.protocols import SocialsURL
+    from collections.abc import Callable, Hashable, Iterable, Iterator
+
+    from socials.compact import CompactExtraction
+    from socials.explain import Explanation
+    from socials.protocols import PlatformParser, ResultCache, SocialsURL
+    from socials.shortlinks import ShortLinkResolver
+
+
+# Schemes routed by hostname
+_HTTP_SCHEMES = frozenset({"http", "https"})
+
+# Platform and entity type codes of URL types that declare them as ClassVars
+_codes_by_type: dict[type, tuple[int, int]] = {}
+
+
+def _result_codes(result: SocialsURL) -> tuple[int, int]:
+    """Return the platform and entity type codes of a result."""
+    cls = type(result)
+    try:
+        return _codes_by_type[cls]
+    except KeyError:
+        pass
+    platform_code = getattr(cls, "platform_code", None)
+    entity_type_code = getattr(cls, "entity_type_code", None)
+    if isinstance(platform_code, int) and isinstance(entity_type_code, int):
+        _codes_by_type[cls] = (platform_code, entity_type_code)
+        return platform_code, entity_type_code
+    # Results without class-level codes (e.g. from plugins)
+    return (
+        codes.platform_code(result.platform),
+        codes.entity_type_code(result.entity_type),
+    )
+
+
+# Fields that don't identify an entity (different spellings of one URL)
+_NON_IDENTITY_FIELDS = frozenset({"url", "normalized_url"})
+# Identifying fields compared case-insensitively (account and owner names)
+_CASELESS_FIELDS = frozenset({"username", "owner"})
+
+# Identifying field names per URL type (None for types without model fields)
+_identity_fields: dict[type, tuple[str, ...] | None] = {}
+
+
+def _canonical_key(result: SocialsURL) -> Hashable:
+    """Return a key that is equal for results identifying the same entity.
+
+    Usernames and owners are compared case-insensitively, so
+    `github.com/Lorey` and `github.com/lorey` have the same key.
+    """
+    cls = type(result)
+    try:
+        names = _identity_fields[cls]
+    except KeyError:
+        model_fields = getattr(cls, "model_fields", None)
+        names = (
+            tuple(name for name in model_fields if name not in _NON_IDENTITY_FIELDS)
+            if model_fields
+            else None
+        )
+        _identity_fields[cls] = names
+    if names is None:
+        return (cls, result.url)
+    values = vars(result)
+    return (cls, *(_key_value(name, values[name]) for name in names))
+
+
+def _key_value(name: str, value: object) -> object:
+    """Return a field value as compared by `_canonical_key()`."""
+    if name in _CASELESS_FIELDS and isinstance(value, str):
+        return value.casefold()
+    return value
+
+
+# Chunks per thread for threaded batches: enough to balance uneven URLs,
+# few enough to keep scheduling overhead low
+_CHUNKS_PER_THREAD = 4
+
+# Why a URL was not recognized:
+# - malformed: not a URL (unsplittable, no host, or a schemeless string that
+#   no parser accepts)
+# - no_parser: no parser handles the scheme or host
+# - rejected: the responsible parser did not match the URL
+FailureReason = Literal["malformed", "no_parser", "rejected"]
+
+
+class ParseFailure(NamedTuple):
+    """An input URL that was not recognized by `Extractor.parse_batch()`.
+
+    Attributes:
+        position: Index of the URL in the input.
+        url: The input URL.
+        reason: Why the URL was not recognized.
+
+    """
+
+    position: int
+    url: str
+    reason: FailureReason
+
+
+class BatchResult:
+    """Per-input results of `Extractor.parse_batch()`."""
+
+    def __init__(
+        self,
+        results: list[SocialsURL | None],
+        failures: list[ParseFailure],
+    ) -> None:
+        """Initialize with aligned results and the failures among them.
+
+        Args:
+            results: Parsed result or None, one per input URL.
+            failures: Failed inputs, in input order.
+
+        """
+        self._results = results
+        self._failures = failures
+
+    def __len__(self) -> int:
+        """Return the number of input URLs."""
+        return len(self._results)
+
+    def __iter__(self) -> Iterator[SocialsURL | None]:
+        """Iterate over the results (None for failures) in input order."""
+        return iter(self._results)
+
+    def __getitem__(self, index: int) -> SocialsURL | None:
+        """Return the result for an input index (None if it failed)."""
+        return self._results[index]
+
+    @property
+    def ok(self) -> bool:
+        """Whether every input URL was recognized."""
+        return not self._failures
+
+    @property
+    def results(self) -> list[SocialsURL | None]:
+        """Return the results aligned with the input (None for failures)."""
+        return list(self._results)
+
+    @property
+    def failures(self) -> list[ParseFailure]:
+        """Return the failed inputs with their reasons, in input order."""
+        return list(self._failures)
+
+    def extraction(self) -> Extraction:
+        """Return the recognized results as an Extraction.
+
+        Returns:
+            Extraction with the successful results, in input order.
+
+        """
+        return Extraction([result for result in self._results if result is not None])
+
+    def raise_for_failures(self) -> None:
+        """Raise for the first failure, like strict mode would.
+
+        Raises:
+            ParseError: If any input URL was not recognized.
+
+        """
+        if self._failures:
+            failure = self._failures[0]
+            msg = (
+                f"Unrecognized URL: {failure.url} ({failure.reason}); "
+                f"{len(self._failures)} of {len(self._results)} URLs failed"
+            )
+            raise ParseError(msg)
 
 
 class Extraction:
-    """Result of extracting social URLs from a list of URLs."""
+    """Result of extracting social URLs from a list of URLs.
+
+    Results can be added incrementally with `append()`, `extend()` and
+    `merge()`. The code arrays and grouping indexes are built on first use
+    and then updated in place as results are added, so accumulating results
+    over many batches never re-groups what is already there.
+    """
 
-    def __init__(self, results: list[SocialsURL]) -> None:
+    def __init__(self, results: Iterable[SocialsURL] = ()) -> None:
         """Initialize with parsed URL results.
 
         Args:
-            results: List of parsed SocialsURL objects.
+            results: Parsed SocialsURL objects (copied).
 
         """
-        self._results = results
+        self._results: list[SocialsURL] = list(results)
+        self._codes: tuple[array[int], array[int]] | None = None
+        # Results by platform code and by entity type code
+        self._indexes: (
+            tuple[dict[int, list[SocialsURL]], dict[int, list[SocialsURL]]] | None
+        ) = None
+        # Canonical keys of all results, built on the first deduplicating add
+        self._seen: set[Hashable] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of results."""
+        return len(self._results)
+
+    def __iter__(self) -> Iterator[SocialsURL]:
+        """Iterate over the results in insertion order."""
+        return iter(self._results)
+
+    def _get_codes(self) -> tuple[array[int], array[int]]:
+        """Return platform and entity type codes of all results (cached)."""
+        if self._codes is None:
+            platform_codes: array[int] = array("H")
+            entity_type_codes: array[int] = array("H")
+            for result in self._results:
+                platform_code, entity_type_code = _result_codes(result)
+                platform_codes.append(platform_code)
+                entity_type_codes.append(entity_type_code)
+            self._codes = (platform_codes, entity_type_codes)
+        return self._codes
+
+    def _get_indexes(
+        self,
+    ) -> tuple[dict[int, list[SocialsURL]], dict[int, list[SocialsURL]]]:
+        """Return the results grouped by platform and type code (cached)."""
+        if self._indexes is None:
+            by_platform: dict[int, list[SocialsURL]] = {}
+            by_type: dict[int, list[SocialsURL]] = {}
+            platform_codes, entity_type_codes = self._get_codes()
+            for result, platform_code, entity_type_code in zip(
+                self._results,
+                platform_codes,
+                entity_type_codes,
+            ):
+                by_platform.setdefault(platform_code, []).append(result)
+                by_type.setdefault(entity_type_code, []).append(result)
+            self._indexes = (by_platform, by_type)
+        return self._indexes
+
+    def append(self, result: SocialsURL) -> None:
+        """Add a result, updating any indexes already built.
+
+        Args:
+            result: Parsed URL object.
+
+        """
+        self._results.append(result)
+        if self._codes is not None:
+            platform_code, entity_type_code = _result_codes(result)
+            self._codes[0].append(platform_code)
+            self._codes[1].append(entity_type_code)
+            if self._indexes is not None:
+                self._indexes[0].setdefault(platform_code, []).append(result)
+                self._indexes[1].setdefault(entity_type_code, []).append(result)
+        if self._seen is not None:
+            self._seen.add(_canonical_key(result))
+
+    def extend(self, results: Iterable[SocialsURL], *, dedupe: bool = False) -> None:
+        """Add several results, updating any indexes already built.
+
+        Args:
+            results: Parsed URL objects.
+            dedupe: Skip results whose canonical identity (type and
+                identifying fields, ignoring the URL spelling) is already
+                present, including earlier results of the same call.
+
+        """
+        if not dedupe:
+            for result in results:
+                self.append(result)
+            return
+        if self._seen is None:
+            self._seen = {_canonical_key(result) for result in self._results}
+        seen = self._seen
+        for result in results:
+            if _canonical_key(result) not in seen:
+                self.append(result)
+
+    def merge(self, other: Extraction, *, dedupe: bool = False) -> None:
+        """Add all results of another extraction to this one.
+
+        Args:
+            other: Extraction whose results are appended (it is not changed).
+            dedupe: Skip results already present, as in `extend()`.
+
+        """
+        self.extend(list(other._results), dedupe=dedupe)
+
+    def platform_codes(self) -> array[int]:
+        """Return the platform code of every result.
+
+        Returns:
+            Array of integer codes (see `socials.codes`), in result order.
+
+        """
+        return array("H", self._get_codes()[0])
+
+    def entity_type_codes(self) -> array[int]:
+        """Return the entity type code of every result.
+
+        Returns:
+            Array of integer codes (see `socials.codes`), in result order.
+
+        """
+        return array("H", self._get_codes()[1])
 
     def all(self) -> list[SocialsURL]:
         """Return all parsed URLs.
@@ -43,10 +338,7 @@ class Extraction:
             Dictionary mapping platform names to lists of URLs.
 
         """
-        grouped: dict[str, list[SocialsURL]] = defaultdict(list)
-        for result in self._results:
-            grouped[result.platform].append(result)
-        return dict(grouped)
+        return self._named(self._get_indexes()[0], codes.platform_name)
 
     def by_type(self) -> dict[str, list[SocialsURL]]:
         """Group results by entity type.
@@ -55,15 +347,94 @@ class Extraction:
             Dictionary mapping entity types to lists of URLs.
 
         """
-        grouped: dict[str, list[SocialsURL]] = defaultdict(list)
+        return self._named(self._get_indexes()[1], codes.entity_type_name)
+
+    @staticmethod
+    def _named(
+        index: dict[int, list[SocialsURL]],
+        name: Callable[[int], str],
+    ) -> dict[str, list[SocialsURL]]:
+        """Name the groups of an index (copying them, as the index is live)."""
+        return {name(code): list(group) for code, group in index.items()}
+
+    def filter(
+        self,
+        *,
+        platform: str | None = None,
+        entity_type: str | None = None,
+    ) -> Extraction:
+        """Return the results matching a platform and/or entity type.
+
+        Args:
+            platform: Only keep results of this platform.
+            entity_type: Only keep results of this entity type.
+
+        Returns:
+            New Extraction with the matching results.
+
+        """
+        platform_codes, entity_type_codes = self._get_codes()
+        wanted_platform = None if platform is None else codes.platform_code(platform)
+        wanted_type = (
+            None if entity_type is None else codes.entity_type_code(entity_type)
+        )
+        return Extraction(
+            [
+                result
+                for result, platform_code, entity_type_code in zip(
+                    self._results,
+                    platform_codes,
+                    entity_type_codes,
+                )
+                if (wanted_platform is None or platform_code == wanted_platform)
+                and (wanted_type is None or entity_type_code == wanted_type)
+            ],
+        )
+
+    def roots(self) -> list[SocialsURL]:
+        """Return the distinct root entities of all results.
+
+        Returns:
+            List of root URLs (e.g. the profile of a repo), deduplicated and
+            in order of first appearance.
+
+        """
+        return list(self.rollup())
+
+    def rollup(self) -> dict[SocialsURL, list[SocialsURL]]:
+        """Group results by their root entity.
+
+        Roots identifying the same entity are one group, however their URLs
+        are spelled (`www.`, a trailing slash, a differently cased username).
+        The group's root is the first extracted root, or the first root
+        derived from a result if none was extracted.
+
+        Returns:
+            Dictionary mapping each root URL to the results below it
+            (including the root itself if it was extracted).
+
+        """
+        roots: dict[Hashable, SocialsURL] = {}
+        extracted: set[Hashable] = set()
+        grouped: dict[Hashable, list[SocialsURL]] = defaultdict(list)
         for result in self._results:
-            grouped[result.entity_type].append(result)
-        return dict(grouped)
+            root = result.get_root()
+            key = _canonical_key(root)
+            if root == result:
+                if key not in extracted:
+                    extracted.add(key)
+                    roots[key] = result
+            else:
+                roots.setdefault(key, root)
+            grouped[key].append(result)
+        return {roots[key]: results for key, results in grouped.items()}
 
     # 0.x backwards compatibility methods (deprecated)
 
     def _get_compat_url(self, url_obj: SocialsURL) -> str:
         """Get URL string for backwards compat (applies cleaning like 0.x)."""
+        from socials.platforms.misc import EmailURL  # noqa: PLC0415
+
         if isinstance(url_obj, EmailURL):
             return url_obj.email
         return url_obj.url
@@ -114,35 +485,165 @@ class Extraction:
         ]
 
 
+@lru_cache(maxsize=128)
+def _registry_snapshot(platforms: tuple[str, ...] | None) -> Registry:
+    """Build the frozen registry for a platform selection.
+
+    Snapshots are cached per selection (in priority order), so extractors
+    with the same platforms share one registry and its routing indexes.
+
+    Args:
+        platforms: Platform names in priority order, or None for all.
+
+    Returns:
+        Frozen registry with the selected parsers.
+
+    Raises:
+        ValueError: If a platform is unknown.
+
+    """
+    if platforms is None:
+        parsers = available_parsers()
+        platforms = tuple(parsers.keys())
+    elif all(platform in DEFAULT_PARSERS for platform in platforms):
+        # Built-in platforms only, no need to scan entry points
+        parsers = DEFAULT_PARSERS
+    else:
+        parsers = available_parsers()
+
+    registry = Registry()
+    for platform in platforms:
+        try:
+            parser = parsers[platform]
+        except KeyError:
+            msg = f"Unknown platform: {platform}"
+            raise ValueError(msg) from None
+        registry.register(parser)
+    return registry.freeze()
+
+
 class Extractor:
-    """Extractor for parsing social URLs."""
+    """Extractor for parsing social URLs.
 
-    def __init__(
+    Extractors are thread-safe: one instance can be shared by any number of
+    threads. Its registry is frozen, parsers are loaded once under a lock,
+    and the only mutable state is the optional cache, which must be
+    thread-safe itself (`socials.cache.LRUCache` is; a plain dict is on
+    CPython). `extract()` and `parse_batch()` take `threads=` to parse a
+    batch on a thread pool, which scales on free-threaded Python builds.
+
+    With `intern_results=True`, repeated inputs return the same (immutable)
+    result object for as long as it is referenced anywhere, so large
+    extractions hold one object per distinct URL.
+    """
+
+    def __init__(  # noqa: PLR0913
         self,
         *,
         platforms: list[str] | None = None,
         strict: bool = False,
+        normalize: bool = False,
+        cache: ResultCache | None = None,
+        intern_results: bool = False,
+        unwrap_redirects: bool = False,
+        resolver: ShortLinkResolver | None = None,
     ) -> None:
         """Initialize the extractor.
 
         Args:
-            platforms: If provided, only include these platforms.
+            platforms: If provided, only include these platforms. Plugin
+                platforms discovered via entry points can be selected too.
             strict: If True, raise ParseError for unrecognized URLs.
+            normalize: If True, clean URLs before parsing (trim whitespace,
+                drop fragments and tracking parameters, lowercase the host)
+                and record the cleaned URL as `normalized_url` on results.
+            cache: Cache of parse outcomes keyed by input URL, e.g. a
+                `socials.cache.LRUCache` or a plain dict. It can be shared
+                between extractors with the same settings.
+            intern_results: If True, keep a weak table of results by input
+                URL and return the live result for repeated inputs instead
+                of an equal copy.
+            unwrap_redirects: If True, parse the target of known redirect
+                wrappers (see `socials.redirects`) instead of the wrapper.
+            resolver: Short link resolver; short links in a batch are
+                resolved together before parsing, and their targets parsed.
 
         """
         self._strict = strict
-        self._registry = Registry()
+        self._normalize = normalize
+        self._unwrap_redirects = unwrap_redirects
+        self._resolver = resolver
+        self._cache = cache
+        self._interned: weakref.WeakValueDictionary[str, SocialsURL] | None = (
+            weakref.WeakValueDictionary() if intern_results else None
+        )
+        self._intern_lock = threading.Lock()
+        # Without a selection, start with the built-ins and only scan entry
+        # points (slow to import) once a URL needs a parser they don't have
+        self._plugins_pending = platforms is None
+        self._plugins_added = False
+        self._plugins_lock = threading.Lock()
+        key = tuple(platforms) if platforms is not None else tuple(DEFAULT_PARSERS)
+        self._registry = _registry_snapshot(key)
+
+    @property
+    def registry(self) -> Registry:
+        """Return the (frozen, shared) registry used for routing."""
+        self._load_plugins()
+        return self._registry
 
-        if platforms is None:
-            platforms = list(DEFAULT_PARSERS.keys())
+    def _load_plugins(self) -> bool:
+        """Add discovered plugins to the registry of a default extractor.
 
-        for platform in platforms:
-            try:
-                parser = DEFAULT_PARSERS[platform]
-            except KeyError:
-                msg = f"Unknown platform: {platform}"
-                raise ValueError(msg) from None
-            self._registry.register(parser)
+        Plugins come after the built-ins, so routing a URL the built-ins
+        handle gives the same parser with or without them.
+
+        Discovery runs once, under a lock; the registry is swapped before
+        the pending flag is cleared, so no thread routes a URL without the
+        plugins after seeing it cleared.
+
+        Returns:
+            True if the registry has plugins, so routing may now succeed.
+
+        """
+        if not self._plugins_pending:
+            # A thread that routed before another one added the plugins
+            # must retry, so report them as added for every caller
+            return self._plugins_added
+        with self._plugins_lock:
+            if self._plugins_pending:
+                registry = _registry_snapshot(None)
+                added = len(registry.parsers) > len(self._registry.parsers)
+                self._registry = registry
+                self._plugins_added = added
+                # Cleared last, so threads that see it cleared use plugins
+                self._plugins_pending = False
+        return self._plugins_added
+
+    @property
+    def cache(self) -> ResultCache | None:
+        """Return the result cache, if any."""
+        return self._cache
+
+    @property
+    def normalize(self) -> bool:
+        """Whether URLs are normalized before parsing."""
+        return self._normalize
+
+    @property
+    def unwrap_redirects(self) -> bool:
+        """Whether redirect wrappers are unwrapped before parsing."""
+        return self._unwrap_redirects
+
+    @property
+    def resolver(self) -> ShortLinkResolver | None:
+        """Return the short link resolver, if any."""
+        return self._resolver
+
+    @property
+    def intern_results(self) -> bool:
+        """Whether repeated inputs return the same result object."""
+        return self._interned is not None
 
     def parse(self, url: str) -> SocialsURL | None:
         """Parse a single URL.
@@ -157,7 +658,9 @@ class Extractor:
             ParseError: If strict mode is enabled and URL is not recognized.
 
         """
-        result = self._registry.parse(url)
+        if self._resolver is not None:
+            self._resolve_short_links([url])
+        result, _ = self._parse(url)
 
         if result is None and self._strict:
             msg = f"Unrecognized URL: {url}"
@@ -165,19 +668,364 @@ class Extractor:
 
         return result
 
-    def extract(self, urls: list[str]) -> Extraction:
+    def _split(self, url: str) -> tuple[str, str, tuple[str, ...]] | None:
+        """Split a URL once into scheme, host and the candidates to parse.
+
+        Returns:
+            Lowercased scheme and host plus the URL strings to try, or None
+            if the URL cannot be split or fails `is_plausible_url()`.
+
+        """
+        if self._normalize:
+            normalized = split_url(url)
+            if not is_plausible_url(normalized.candidates[0]):
+                return None
+            return normalized.scheme, normalized.hostname, normalized.candidates
+        if not is_plausible_url(url):
+            return None
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            return None
+        hostname = (parts.hostname or "").rstrip(".")
+        return parts.scheme.lower(), hostname, (url,)
+
+    def _route(self, url: str) -> tuple[str, str, tuple[str, ...]] | None:
+        """Split a URL, following redirect wrappers and short links if enabled.
+
+        Only URLs on a wrapper or short link host are looked at further, so
+        other URLs cost one set lookup. Short links are only followed if the
+        resolver already has their target cached. Nested redirects are
+        followed up to `MAX_REDIRECT_DEPTH`.
+        """
+        if not self._unwrap_redirects and self._resolver is None:
+            return self._split(url)
+        last = None
+        for split in self._hops(url):
+            last = split
+        return last
+
+    def _hops(self, url: str) -> Iterator[tuple[str, str, tuple[str, ...]]]:
+        """Yield the split of a URL and of each redirect target it leads to."""
+        split = self._split(url)
+        for _ in range(MAX_REDIRECT_DEPTH + 1):
+            if split is None:
+                return
+            yield split
+            target = self._redirect_target(split)
+            split = self._split(target) if target is not None else None
+
+    def _redirect_target(self, split: tuple[str, str, tuple[str, ...]]) -> str | None:
+        """Return the target of a redirect wrapper or resolved short link."""
+        _, hostname, candidates = split
+        if self._unwrap_redirects and hostname in REDIRECT_WRAPPERS:
+            return unwrap_once(candidates[0])
+        resolver = self._resolver
+        if resolver is not None and hostname in resolver.hosts:
+            return resolver.get(candidates[0])
+        return None
+
+    def _short_links(self, url: str) -> list[str]:
+        """Return the short links on a URL's route, in the order followed."""
+        hosts = cast("ShortLinkResolver", self._resolver).hosts
+        return [split[2][0] for split in self._hops(url) if split[1] in hosts]
+
+    def _resolve_short_links(self, urls: Iterable[str]) -> None:
+        """Resolve the short links on the routes of URLs, in batches.
+
+        Short links inside redirect wrappers are found after unwrapping, and
+        targets that are short links themselves are resolved in a further
+        batch. Each link is sent to the resolver once per call.
+        """
+        resolver = cast("ShortLinkResolver", self._resolver)
+        attempted: set[str] = set()
+        pending = list(urls)
+        while pending:
+            routes = [(url, self._short_links(url)) for url in pending]
+            pending = [url for url, links in routes if links]
+            new = [link for _, links in routes for link in links]
+            new = [link for link in dict.fromkeys(new) if link not in attempted]
+            if not new:
+                return
+            attempted.update(new)
+            resolver.resolve(new)
+
+    def _finish(self, result: SocialsURL, candidate: str, url: str) -> SocialsURL:
+        """Record the input and normalized URL on a result.
+
+        Only applies when normalizing, and only to result types with a
+        `normalized_url` field (plugin results are returned unchanged).
+        """
+        fields = getattr(type(result), "model_fields", ())
+        if not self._normalize or "normalized_url" not in fields:
+            return result
+        update = {"url": url, "normalized_url": candidate}
+        copied: SocialsURL = result.model_copy(update=update)  # type: ignore[attr-defined]
+        return copied
+
+    def _select_parser(self, scheme: str, hostname: str) -> PlatformParser | None:
+        """Return the parser for a (non-empty) scheme and host."""
+        parser = self._lookup_parser(scheme, hostname)
+        if parser is None and self._load_plugins():
+            parser = self._lookup_parser(scheme, hostname)
+        return parser
+
+    def _lookup_parser(self, scheme: str, hostname: str) -> PlatformParser | None:
+        """Return the parser for a scheme and host from the current registry."""
+        if scheme in _HTTP_SCHEMES:
+            return self._registry.get_parser_for_hostname(hostname)
+        return self._registry.get_parser_for_scheme(scheme)
+
+    def _parse(self, url: str) -> tuple[SocialsURL | None, FailureReason | None]:
+        """Parse a URL through the interning table and cache, if any.
+
+        URLs whose route passes through a short link are parsed uncached
+        when a resolver is set, so their outcome follows the resolver's
+        current target.
+
+        Returns:
+            The result and None, or None and the failure reason.
+
+        """
+        if self._resolver is not None and self._short_links(url):
+            # The target may fail to resolve now and resolve later, or
+            # expire; outcomes of short links are never cached or interned
+            return self._parse_uncached(url)
+        interned = self._interned
+        if interned is None:
+            return self._parse_cached(url)
+        with self._intern_lock:
+            live = interned.get(url)
+        if live is not None:
+            return live, None
+        result, reason = self._parse_cached(url)
+        if result is None:
+            return None, reason
+        try:
+            with self._intern_lock:
+                return interned.setdefault(url, result), None
+        except TypeError:  # plugin result type without weakref support
+            return result, None
+
+    def _parse_cached(
+        self,
+        url: str,
+    ) -> tuple[SocialsURL | None, FailureReason | None]:
+        """Parse a URL through the cache, if any.
+
+        Returns:
+            The result and None, or None and the failure reason.
+
+        """
+        cache = self._cache
+        if cache is None:
+            return self._parse_uncached(url)
+        cached = cache.get(url)
+        if cached is None:
+            result, reason = self._parse_uncached(url)
+            cache[url] = result if result is not None else cast("str", reason)
+            return result, reason
+        if isinstance(cached, str):
+            return None, cast("FailureReason", cached)
+        return cached, None
+
+    def _parse_uncached(
+        self,
+        url: str,
+    ) -> tuple[SocialsURL | None, FailureReason | None]:
+        """Parse a URL and report why it was not recognized.
+
+        Routing uses the scheme and host of the single split, and the parser
+        is tried with each (normalized) candidate in turn.
+
+        Returns:
+            The result and None, or None and the failure reason.
+
+        """
+        split = self._route(url)
+        if split is None or (split[0] in _HTTP_SCHEMES and not split[1]):
+            return None, "malformed"
+        scheme, hostname, candidates = split
+
+        if not scheme:
+            # Schemeless input (e.g. raw email) is routed by the registry
+            result = self._registry.parse(candidates[0])
+            if result is None and self._load_plugins():
+                result = self._registry.parse(candidates[0])
+            if result is None:
+                return None, "malformed"
+            return self._finish(result, candidates[0], url), None
+
+        parser = self._select_parser(scheme, hostname)
+        if parser is None:
+            return None, "no_parser"
+        for candidate in candidates:
+            result = parser.parse(candidate)
+            if result is not None:
+                return self._finish(result, candidate, url), None
+        return None, "rejected"
+
+    def explain(self, url: str) -> Explanation:
+        """Parse a URL and report how it was routed and matched.
+
+        Parsing runs as in `parse()` (without raising in strict mode and
+        bypassing the cache), with pattern tracing enabled for the call.
+
+        Args:
+            url: URL to explain.
+
+        Returns:
+            Explanation with the scheme and host used for routing, the
+            selected parser, every pattern tried with its timing, and the
+            result or the reason it was rejected.
+
+        Examples:
+            ```python
+            explanation = Extractor().explain("https://github.com/settings")
+            explanation.reason  # "rejected"
+            print(explanation.format())
+            ```
+
+        """
+        from socials.explain import Explanation  # noqa: PLC0415
+
+        if self._resolver is not None:
+            self._resolve_short_links([url])
+        with trace_patterns() as attempts:
+            started = perf_counter()
+            result, reason = self._parse_uncached(url)
+            seconds = perf_counter() - started
+
+        scheme, hostname, candidates = self._route(url) or ("", "", (url,))
+        parser: str | None = None
+        if scheme and (hostname or scheme not in _HTTP_SCHEMES):
+            selected = self._select_parser(scheme, hostname)
+            parser = selected.platform if selected is not None else None
+        elif result is not None:
+            # Schemeless input is offered to every parser; report the winner
+            parser = result.platform
+        return Explanation(
+            url=url,
+            scheme=scheme,
+            hostname=hostname,
+            candidates=candidates,
+            parser=parser,
+            patterns=tuple(attempts),
+            result=result,
+            reason=reason,
+            seconds=seconds,
+        )
+
+    def _outcomes(
+        self,
+        urls: Iterable[str],
+        threads: int | None,
+    ) -> Iterable[tuple[str, tuple[SocialsURL | None, FailureReason | None]]]:
+        """Pair each URL with its parse outcome, in input order.
+
+        Without `threads`, URLs are parsed lazily one by one. With `threads`,
+        the batch is split into chunks that are parsed on a thread pool.
+        With a resolver, the batch is read up front to resolve its short
+        links together.
+        """
+        parse = self._parse
+        if self._resolver is not None:
+            urls = list(urls)
+            self._resolve_short_links(urls)
+        if threads is None:
+            return ((url, parse(url)) for url in urls)
+        if threads < 1:
+            msg = f"threads must be at least 1, got {threads}"
+            raise ValueError(msg)
+        from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+        urls = list(urls)
+        size = max(1, -(-len(urls) // (threads * _CHUNKS_PER_THREAD)))
+        chunks = [urls[i : i + size] for i in range(0, len(urls), size)]
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            parsed = pool.map(lambda chunk: [parse(url) for url in chunk], chunks)
+            outcomes = [outcome for chunk in parsed for outcome in chunk]
+        return zip(urls, outcomes)
+
+    def extract(self, urls: Iterable[str], *, threads: int | None = None) -> Extraction:
         """Parse multiple URLs.
 
         Args:
-            urls: List of URLs to parse.
+            urls: URLs to parse.
+            threads: If set, parse on a pool of this many threads.
 
         Returns:
             Extraction object containing parsed results.
 
+        Raises:
+            ParseError: If strict mode is enabled and a URL is not recognized.
+            ValueError: If `threads` is less than 1.
+
         """
         results: list[SocialsURL] = []
-        for url in urls:
-            result = self.parse(url)
+        for url, (result, _) in self._outcomes(urls, threads):
             if result is not None:
                 results.append(result)
+            elif self._strict:
+                msg = f"Unrecognized URL: {url}"
+                raise ParseError(msg)
         return Extraction(results)
+
+    def parse_batch(
+        self,
+        urls: Iterable[str],
+        *,
+        threads: int | None = None,
+    ) -> BatchResult:
+        """Parse multiple URLs, recording failures instead of raising.
+
+        Unlike `extract()`, the result is aligned with the input and never
+        raises, even in strict mode: every unrecognized URL is reported with
+        its index and the reason it failed.
+
+        Args:
+            urls: URLs to parse.
+            threads: If set, parse on a pool of this many threads.
+
+        Returns:
+            BatchResult with one entry per input URL.
+
+        Raises:
+            ValueError: If `threads` is less than 1.
+
+        """
+        results: list[SocialsURL | None] = []
+        failures: list[ParseFailure] = []
+        for index, (url, (result, reason)) in enumerate(self._outcomes(urls, threads)):
+            results.append(result)
+            if reason is not None:
+                failures.append(ParseFailure(index, url, reason))
+        return BatchResult(results, failures)
+
+    def extract_compact(self, urls: Iterable[str]) -> CompactExtraction:
+        """Parse multiple URLs into a columnar, memory-compact store.
+
+        Results are stored as arrays and only materialized on access, which
+        keeps very large batches in memory without a model instance per URL.
+
+        Args:
+            urls: URLs to parse.
+
+        Returns:
+            CompactExtraction containing the parsed results.
+
+        Raises:
+            ParseError: If strict mode is enabled and a URL is not recognized.
+
+        """
+        from socials.compact import CompactExtraction  # noqa: PLC0415
+
+        store = CompactExtraction()
+        append = store.append
+        for url, (result, _) in self._outcomes(urls, None):
+            if result is not None:
+                append(result)
+            elif self._strict:
+                msg = f"Unrecognized URL: {url}"
+                raise ParseError(msg)
+        return store
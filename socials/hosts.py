@@ -0,0 +1,184 @@
+"""Hostname routing with declared domains and subdomain policies.
+
+Parsers declare the domains they handle as a mapping of domain to policy:
+
+- `"exact"`: only the domain itself (`mobile.twitter.com`)
+- `"www"`: the domain and its `www.` host (`github.com`, `www.github.com`)
+- `"subdomains"`: the domain and any subdomain at any depth
+  (`linkedin.com`, `de.linkedin.com`, `a.b.linkedin.com`)
+
+`HostTrie` stores declared domains by reversed labels (`com` → `linkedin` →
+`de`), so a lookup walks the labels of a hostname once, whatever the number
+of parsers or the subdomain depth.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, Literal, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+HostPolicy = Literal["exact", "www", "subdomains"]
+
+HOST_POLICIES: frozenset[str] = frozenset({"exact", "www", "subdomains"})
+
+T = TypeVar("T")
+
+
+def _check_policy(domain: str, policy: str) -> None:
+    """Raise ValueError for an unknown policy."""
+    if policy not in HOST_POLICIES:
+        msg = (
+            f"Unknown host policy {policy!r} for {domain!r}, "
+            f"expected one of {sorted(HOST_POLICIES)}"
+        )
+        raise ValueError(msg)
+
+
+def domain_matches(hostname: str, domain: str, policy: HostPolicy) -> bool:
+    """Check whether a hostname is covered by a declared domain.
+
+    Args:
+        hostname: Lowercased hostname.
+        domain: Declared domain.
+        policy: Subdomain policy of the declared domain.
+
+    Returns:
+        True if the policy admits the hostname.
+
+    Raises:
+        ValueError: If the policy is unknown.
+
+    """
+    _check_policy(domain, policy)
+    if hostname == domain:
+        return True
+    if policy == "www":
+        return hostname == f"www.{domain}"
+    if policy == "subdomains":
+        return hostname.endswith(f".{domain}")
+    return False
+
+
+def matches_domains(hostname: str, domains: Mapping[str, HostPolicy]) -> bool:
+    """Check whether a hostname is covered by any of the declared domains.
+
+    Args:
+        hostname: Lowercased hostname.
+        domains: Declared domains mapped to their subdomain policies.
+
+    Returns:
+        True if one of the domains admits the hostname.
+
+    """
+    return any(
+        domain_matches(hostname, domain, policy) for domain, policy in domains.items()
+    )
+
+
+class _Node(Generic[T]):
+    """Trie node for one hostname label."""
+
+    __slots__ = ("children", "exact", "subdomains")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node[T]] = {}
+        # (priority, value) entries; lower priority wins
+        self.exact: tuple[int, T] | None = None
+        self.subdomains: tuple[int, T] | None = None
+
+
+class HostTrie(Generic[T]):
+    """Map hostnames to values via domains declared with subdomain policies.
+
+    Each domain is added with a priority. When several declared domains cover
+    a hostname (e.g. `linkedin.com` with `"subdomains"` and an exact
+    `api.linkedin.com`), the entry with the lowest priority wins, so a
+    registry can keep its "first registered wins" rule.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty trie."""
+        self._root: _Node[T] = _Node()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of declared hosts."""
+        return self._size
+
+    def add(
+        self,
+        domain: str,
+        value: T,
+        policy: HostPolicy = "exact",
+        *,
+        priority: int = 0,
+    ) -> None:
+        """Declare a domain.
+
+        Existing entries with a lower or equal priority are kept.
+
+        Args:
+            domain: Domain to declare (case-insensitive).
+            value: Value returned for hostnames the domain covers.
+            policy: Subdomain policy (`"exact"`, `"www"` or `"subdomains"`).
+            priority: Priority of the entry; lower wins.
+
+        Raises:
+            ValueError: If the policy is unknown or the domain is empty.
+
+        """
+        _check_policy(domain, policy)
+        domain = domain.lower().strip(".")
+        if not domain:
+            msg = "Cannot declare an empty domain"
+            raise ValueError(msg)
+        if policy == "www":
+            self._insert(domain, (priority, value), wildcard=False)
+            self._insert(f"www.{domain}", (priority, value), wildcard=False)
+        else:
+            self._insert(domain, (priority, value), wildcard=policy == "subdomains")
+
+    def _insert(self, domain: str, entry: tuple[int, T], *, wildcard: bool) -> None:
+        """Store an entry at the node of a domain."""
+        node = self._root
+        for label in reversed(domain.split(".")):
+            child = node.children.get(label)
+            if child is None:
+                child = node.children[label] = _Node()
+            node = child
+        current = node.subdomains if wildcard else node.exact
+        if current is not None and current[0] <= entry[0]:
+            return
+        if current is None:
+            self._size += 1
+        if wildcard:
+            node.subdomains = entry
+        else:
+            node.exact = entry
+
+    def get(self, hostname: str) -> T | None:
+        """Return the value for a hostname.
+
+        Args:
+            hostname: Lowercased hostname, without port.
+
+        Returns:
+            Value of the covering domain with the lowest priority, or None.
+
+        """
+        best: tuple[int, T] | None = None
+        node = self._root
+        for label in reversed(hostname.split(".")):
+            child = node.children.get(label)
+            if child is None:
+                return best[1] if best is not None else None
+            node = child
+            wildcard = node.subdomains
+            if wildcard is not None and (best is None or wildcard[0] < best[0]):
+                best = wildcard
+        exact = node.exact
+        if exact is not None and (best is None or exact[0] < best[0]):
+            best = exact
+        return best[1] if best is not None else None
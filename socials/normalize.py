@@ -0,0 +1,131 @@
+"""URL normalization applied before parsing.
+
+Real-world hrefs carry tracking parameters, fragments, uppercase hosts and
+stray whitespace that the anchored platform patterns reject. `split_url()`
+cleans a URL in a single `urlsplit()` call and returns the candidate strings
+to try, most specific first.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+from urllib.parse import urlsplit, urlunsplit
+
+# Query parameters that only carry tracking or share-sheet information
+TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "feature",
+        "gclid",
+        "igsh",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "ref",
+        "ref_src",
+        "ref_url",
+        "s",
+        "si",
+        "t",
+        "trk",
+    },
+)
+TRACKING_PREFIXES = ("utm_",)
+
+_HTTP_SCHEMES = frozenset({"http", "https"})
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class NormalizedURL(NamedTuple):
+    """Result of normalizing a URL.
+
+    Attributes:
+        scheme: Lowercased scheme, empty for schemeless input (e.g. an email).
+        hostname: Lowercased host without userinfo, port or trailing dot,
+            empty for URLs without one.
+        candidates: Normalized URLs to try, most specific (keeping the query)
+            first.
+
+    """
+
+    scheme: str
+    hostname: str
+    candidates: tuple[str, ...]
+
+    @property
+    def url(self) -> str:
+        """Return the normalized URL."""
+        return self.candidates[0]
+
+
+def _is_tracking_param(pair: str) -> bool:
+    """Check whether a `key=value` query pair is a tracking parameter."""
+    key = pair.partition("=")[0].lower()
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES)
+
+
+def split_url(url: str) -> NormalizedURL:
+    """Normalize a URL and split out its routing information.
+
+    Surrounding whitespace and the fragment are removed, scheme and host are
+    lowercased, userinfo, default ports and a trailing dot are dropped from
+    the host, `http` is upgraded to `https`, and tracking parameters are
+    dropped from the query. If a query remains, the URL without any query is
+    offered as a second candidate, since profile URLs never need one.
+
+    Args:
+        url: URL as found in the wild.
+
+    Returns:
+        Scheme, hostname and candidate URLs.
+
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        # e.g. unbalanced brackets in the host; leave it to the parsers
+        return NormalizedURL("", "", (url,))
+    scheme = parts.scheme.lower()
+    if not scheme:
+        return NormalizedURL("", "", (url,))
+
+    hostname = (parts.hostname or "").rstrip(".")
+    try:
+        port = parts.port
+    except ValueError:
+        # Invalid port; route on the host, leave the URL to the parsers
+        return NormalizedURL(scheme, hostname, (url,))
+    netloc = f"[{hostname}]" if ":" in hostname else hostname
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{port}"
+    if scheme in _HTTP_SCHEMES:
+        scheme = "https"
+    query = "&".join(
+        pair for pair in parts.query.split("&") if pair and not _is_tracking_param(pair)
+    )
+    without_query = urlunsplit((scheme, netloc, parts.path, "", ""))
+    if not query:
+        return NormalizedURL(scheme, hostname, (without_query,))
+    with_query = urlunsplit((scheme, netloc, parts.path, query, ""))
+    return NormalizedURL(scheme, hostname, (with_query, without_query))
+
+
+def normalize_url(url: str) -> str:
+    """Return the normalized form of a URL.
+
+    Args:
+        url: URL as found in the wild.
+
+    Returns:
+        URL with whitespace, fragment, tracking parameters, userinfo and
+        default port removed and lowercased scheme and host.
+
+    Examples:
+        ```python
+        normalize_url(" HTTP://GitHub.com/lorey?utm_source=x#readme ")
+        # "https://github.com/lorey"
+        ```
+
+    """
+    return split_url(url).url
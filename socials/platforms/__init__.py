@@ -1,40 +1,185 @@
-"""Platform parsers for socials."""
+"""Platform parsers for socials.
+
+Platform modules are imported lazily: `DEFAULT_PARSERS` holds `LazyParser`
+proxies that declare domains and schemes, and the parser classes below are
+only imported when accessed. Third-party parsers are discovered through the
+`socials.platforms` entry point group.
+"""
 
 from __future__ import annotations
 
+import warnings
+from functools import cache
+from importlib import import_module
 from typing import TYPE_CHECKING
 
-from socials.platforms.facebook import FacebookParser
-from socials.platforms.github import GitHubParser
-from socials.platforms.instagram import InstagramParser
-from socials.platforms.linkedin import LinkedInParser
-from socials.platforms.misc import EmailParser, PhoneParser
-from socials.platforms.twitter import TwitterParser
-from socials.platforms.youtube import YouTubeParser
+from socials.platforms.base import LazyParser
 
 if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
+    from socials.platforms.facebook import FacebookParser
+    from socials.platforms.github import GitHubParser
+    from socials.platforms.instagram import InstagramParser
+    from socials.platforms.linkedin import LinkedInParser
+    from socials.platforms.misc import EmailParser, PhoneParser
+    from socials.platforms.twitter import TwitterParser
+    from socials.platforms.youtube import YouTubeParser
     from socials.protocols import PlatformParser
 
+# Entry point group for third-party parsers
+ENTRY_POINT_GROUP = "socials.platforms"
+
+# Parser class name -> defining module (imported on first access)
+_PARSER_MODULES = {
+    "EmailParser": "socials.platforms.misc",
+    "FacebookParser": "socials.platforms.facebook",
+    "GitHubParser": "socials.platforms.github",
+    "InstagramParser": "socials.platforms.instagram",
+    "LinkedInParser": "socials.platforms.linkedin",
+    "PhoneParser": "socials.platforms.misc",
+    "TwitterParser": "socials.platforms.twitter",
+    "YouTubeParser": "socials.platforms.youtube",
+}
+
+_HTTP = {"http", "https"}
+
 # Default parsers by platform name
 DEFAULT_PARSERS: dict[str, PlatformParser] = {
-    GitHubParser.platform: GitHubParser(),
-    TwitterParser.platform: TwitterParser(),
-    LinkedInParser.platform: LinkedInParser(),
-    FacebookParser.platform: FacebookParser(),
-    InstagramParser.platform: InstagramParser(),
-    YouTubeParser.platform: YouTubeParser(),
-    EmailParser.platform: EmailParser(),
-    PhoneParser.platform: PhoneParser(),
+    "github": LazyParser(
+        "github",
+        "socials.platforms.github:GitHubParser",
+        schemes=_HTTP,
+        domains={"github.com": "www"},
+    ),
+    "twitter": LazyParser(
+        "twitter",
+        "socials.platforms.twitter:TwitterParser",
+        schemes=_HTTP,
+        domains={
+            "twitter.com": "www",
+            "x.com": "www",
+            "mobile.twitter.com": "exact",
+            "mobile.x.com": "exact",
+        },
+    ),
+    "linkedin": LazyParser(
+        "linkedin",
+        "socials.platforms.linkedin:LinkedInParser",
+        schemes=_HTTP,
+        domains={"linkedin.com": "subdomains"},
+    ),
+    "facebook": LazyParser(
+        "facebook",
+        "socials.platforms.facebook:FacebookParser",
+        schemes=_HTTP,
+        domains={"facebook.com": "subdomains", "fb.com": "www"},
+    ),
+    "instagram": LazyParser(
+        "instagram",
+        "socials.platforms.instagram:InstagramParser",
+        schemes=_HTTP,
+        domains={"instagram.com": "www", "instagr.am": "www"},
+    ),
+    "youtube": LazyParser(
+        "youtube",
+        "socials.platforms.youtube:YouTubeParser",
+        schemes=_HTTP,
+        domains={"youtube.com": "www", "m.youtube.com": "exact"},
+    ),
+    "email": LazyParser(
+        "email",
+        "socials.platforms.misc:EmailParser",
+        schemes={"mailto"},
+        schemeless=True,
+    ),
+    "phone": LazyParser(
+        "phone",
+        "socials.platforms.misc:PhoneParser",
+        schemes={"tel"},
+    ),
 }
 
+
+def _entry_points() -> list[EntryPoint]:
+    """Return entry points registered for `ENTRY_POINT_GROUP`."""
+    from importlib.metadata import entry_points  # noqa: PLC0415
+
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        return list(eps.select(group=ENTRY_POINT_GROUP))
+    return list(eps.get(ENTRY_POINT_GROUP, []))  # Python 3.9
+
+
+@cache
+def discover_plugins() -> dict[str, PlatformParser]:
+    """Discover third-party parsers registered via entry points.
+
+    Each entry point in the `socials.platforms` group is named after its
+    platform and points to a parser class, a parser instance, or (preferably)
+    a `LazyParser` defined in a lightweight module, so the plugin's models are
+    only imported when a URL for one of its hostnames appears. Results are
+    cached; plugins that fail to load are skipped with a warning.
+
+    Returns:
+        Dictionary mapping platform names to plugin parsers.
+
+    """
+    plugins: dict[str, PlatformParser] = {}
+    for entry_point in _entry_points():
+        if entry_point.name in DEFAULT_PARSERS or entry_point.name in plugins:
+            warnings.warn(
+                f"Ignoring plugin parser '{entry_point.value}': platform "
+                f"'{entry_point.name}' is already registered.",
+                stacklevel=2,
+            )
+            continue
+        try:
+            parser = entry_point.load()
+        except Exception as e:  # noqa: BLE001
+            warnings.warn(
+                f"Failed to load plugin parser '{entry_point.value}': {e}",
+                stacklevel=2,
+            )
+            continue
+        if isinstance(parser, type):
+            parser = parser()
+        plugins[entry_point.name] = parser
+    return plugins
+
+
+def available_parsers() -> dict[str, PlatformParser]:
+    """Return built-in parsers followed by discovered plugin parsers.
+
+    Returns:
+        Dictionary mapping platform names to parsers.
+
+    """
+    return {**DEFAULT_PARSERS, **discover_plugins()}
+
+
+def __getattr__(name: str) -> object:
+    """Import parser classes on first access."""
+    try:
+        module_name = _PARSER_MODULES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    return getattr(import_module(module_name), name)
+
+
 __all__ = [
     "DEFAULT_PARSERS",
+    "ENTRY_POINT_GROUP",
     "EmailParser",
     "FacebookParser",
     "GitHubParser",
     "InstagramParser",
+    "LazyParser",
     "LinkedInParser",
     "PhoneParser",
     "TwitterParser",
     "YouTubeParser",
+    "available_parsers",
+    "discover_plugins",
 ]
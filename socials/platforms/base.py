@@ -2,8 +2,26 @@
 
 from __future__ import annotations
 
+import string
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from importlib import import_module
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple
 from urllib.parse import urlparse
 
+from socials.hosts import matches_domains
+from socials.regex import compile_pattern
+
+if TYPE_CHECKING:
+    import re
+    from collections.abc import Iterator, Mapping
+
+    from socials.hosts import HostPolicy
+    from socials.protocols import PlatformParser, SocialsURL
+    from socials.regex import CompiledPattern
+
 
 def extract_hostname(url: str) -> str:
     """Extract hostname from URL.
@@ -12,11 +30,12 @@ def extract_hostname(url: str) -> str:
         url: Full URL string.
 
     Returns:
-        Hostname (e.g., 'github.com' from 'https://github.com/user/repo').
+        Lowercased hostname without userinfo, port or trailing dot (e.g.,
+        'github.com' from 'https://github.com:443/user/repo').
 
     """
     parsed = urlparse(url)
-    return parsed.netloc.lower()
+    return (parsed.hostname or "").rstrip(".")
 
 
 def extract_scheme(url: str) -> str:
@@ -47,3 +66,261 @@ def extract_path_segments(url: str) -> list[str]:
     parsed = urlparse(url)
     path = parsed.path
     return [segment for segment in path.split("/") if segment]
+
+
+class PatternAttempt(NamedTuple):
+    """A pattern match recorded while tracing.
+
+    Attributes:
+        pattern: Source of the regular expression.
+        string: String the pattern was matched against.
+        matched: Whether the pattern matched.
+        seconds: Time spent matching.
+
+    """
+
+    pattern: str
+    string: str
+    matched: bool
+    seconds: float
+
+
+# Number of active `trace_patterns()` blocks in any thread; while it is zero,
+# matching skips the context lookup entirely
+_active_traces = 0
+_active_traces_lock = threading.Lock()
+_trace: ContextVar[list[PatternAttempt] | None] = ContextVar(
+    "socials_pattern_trace",
+    default=None,
+)
+
+
+@contextmanager
+def trace_patterns() -> Iterator[list[PatternAttempt]]:
+    """Record every `LazyPattern` match in the current context.
+
+    Matches in other threads or tasks are not recorded. Outside of a tracing
+    block, matching has no tracing overhead beyond one global check.
+
+    Yields:
+        List that receives a `PatternAttempt` per match, in call order.
+
+    """
+    global _active_traces  # noqa: PLW0603
+    attempts: list[PatternAttempt] = []
+    token = _trace.set(attempts)
+    with _active_traces_lock:
+        _active_traces += 1
+    try:
+        yield attempts
+    finally:
+        with _active_traces_lock:
+            _active_traces -= 1
+        _trace.reset(token)
+
+
+# Schemes (with colon) of URLs taking a parser's fast path
+_FAST_SCHEMES = frozenset({"http:", "https:"})
+
+
+def char_table(extra: str = "") -> frozenset[str]:
+    """Build a lookup table of ASCII letters, digits and extra characters.
+
+    Args:
+        extra: Additional allowed characters, e.g. `"_-"`.
+
+    Returns:
+        Table to check identifiers with `table.issuperset(identifier)`.
+
+    """
+    return frozenset(string.ascii_letters + string.digits + extra)
+
+
+def fast_path(url: str, hosts: frozenset[str]) -> str | None:
+    """Return the path of a plain http(s) URL on one of the hosts.
+
+    Parsers use this to handle their most common URL shapes with string
+    operations and fall back to their patterns for everything else. While
+    patterns are traced (see `trace_patterns()`), it always returns None so
+    traces show every pattern as usual.
+
+    Args:
+        url: URL to parse.
+        hosts: Exact (lowercase) hosts the fast path applies to.
+
+    Returns:
+        The path after the host, without the leading slash and one trailing
+        slash, or None if the URL needs the parser's patterns.
+
+    """
+    # "https://host/path" splits into "https:", "", "host" and "path"
+    parts = url.split("/", 3)
+    if (
+        len(parts) != 4  # noqa: PLR2004
+        or parts[2] not in hosts
+        or parts[0] not in _FAST_SCHEMES
+        or parts[1]
+        or _active_traces
+    ):
+        return None
+    return parts[3].removesuffix("/")
+
+
+class LazyPattern:
+    """Regex pattern that is compiled on first use.
+
+    Platform modules define their patterns at import time; deferring the
+    compilation keeps importing a parser cheap until it actually sees a URL.
+    Patterns compile with the active regex backend (see `socials.regex`).
+    """
+
+    __slots__ = ("__weakref__", "_compiled", "flags", "pattern")
+
+    def __init__(self, pattern: str, flags: int = 0) -> None:
+        """Store the pattern source without compiling it.
+
+        Args:
+            pattern: Regular expression source.
+            flags: Flags passed to `re.compile`.
+
+        """
+        self.pattern = pattern
+        self.flags = flags
+        self._compiled: CompiledPattern | None = None
+
+    def compile(self) -> CompiledPattern:
+        """Return the compiled pattern, compiling it if necessary.
+
+        Concurrent first uses may compile twice; either result is kept.
+        """
+        if self._compiled is None:
+            self._compiled = compile_pattern(self)
+        return self._compiled
+
+    def reset(self) -> None:
+        """Drop the compiled pattern, e.g. after the backend changed."""
+        self._compiled = None
+
+    def match(self, string: str) -> re.Match[str] | None:
+        """Match the pattern at the start of the string."""
+        if _active_traces:
+            return self._traced_match(string)
+        return self.compile().match(string)
+
+    def _traced_match(self, string: str) -> re.Match[str] | None:
+        """Match and record the attempt if tracing is on in this context."""
+        compiled = self.compile()
+        attempts = _trace.get()
+        if attempts is None:
+            return compiled.match(string)
+        started = perf_counter()
+        match = compiled.match(string)
+        seconds = perf_counter() - started
+        attempts.append(
+            PatternAttempt(self.pattern, string, match is not None, seconds),
+        )
+        return match
+
+
+def lazy_compile(pattern: str, flags: int = 0) -> LazyPattern:
+    """Create a pattern that is compiled on first use.
+
+    Args:
+        pattern: Regular expression source.
+        flags: Flags passed to `re.compile`.
+
+    Returns:
+        LazyPattern with the same `match()` interface as a compiled pattern.
+
+    """
+    return LazyPattern(pattern, flags)
+
+
+class LazyParser:
+    """Proxy for a parser whose module is imported on first use.
+
+    The proxy declares the domains and schemes of the parser up front, so
+    the registry can route URLs without importing the platform module (and
+    pydantic). The real parser is loaded the first time a URL for one of its
+    domains or schemes shows up.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        platform: str,
+        target: str,
+        *,
+        schemes: set[str],
+        domains: Mapping[str, HostPolicy] | None = None,
+        hostnames: set[str] | None = None,
+        schemeless: bool = False,
+    ) -> None:
+        """Initialize the proxy.
+
+        Args:
+            platform: Platform identifier of the parser.
+            target: Import path of the parser class, as 'module:ClassName'.
+            schemes: URL schemes the parser handles.
+            domains: Domains the parser handles, mapped to their subdomain
+                policies (see `socials.hosts`).
+            hostnames: Exact hostnames the parser handles, in addition to
+                `domains`.
+            schemeless: Whether the parser accepts input without a scheme
+                (e.g. raw email addresses).
+
+        """
+        self.platform = platform
+        self.target = target
+        self.schemes = schemes
+        self.domains: dict[str, HostPolicy] = dict(domains or {})
+        for hostname in hostnames or ():
+            self.domains.setdefault(hostname, "exact")
+        self.schemeless = schemeless
+        self._parser: PlatformParser | None = None
+        self._load_lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        state = "loaded" if self._parser is not None else "not loaded"
+        return f"LazyParser({self.platform!r}, {self.target!r}, {state})"
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the underlying parser has been imported."""
+        return self._parser is not None
+
+    def load(self) -> PlatformParser:
+        """Import and instantiate the underlying parser.
+
+        Returns:
+            The real parser instance.
+
+        """
+        parser = self._parser
+        if parser is None:
+            # Double-checked so concurrent first uses create one parser
+            with self._load_lock:
+                parser = self._parser
+                if parser is None:
+                    module_name, _, class_name = self.target.partition(":")
+                    parser_class = getattr(import_module(module_name), class_name)
+                    parser = self._parser = parser_class()
+        return parser
+
+    def handles_hostname(self, hostname: str) -> bool:
+        """Check the declared domains, without importing the parser."""
+        return matches_domains(hostname, self.domains)
+
+    def parse(self, url: str) -> SocialsURL | None:
+        """Parse the URL with the real parser."""
+        if self._parser is None and not self.schemeless and not extract_scheme(url):
+            # Schemeless input is only tried against parsers that accept it,
+            # so don't import every platform for a stray string.
+            return None
+        return self.load().parse(url)
+
+    def __getattr__(self, name: str) -> object:
+        """Delegate any other attribute to the real parser."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
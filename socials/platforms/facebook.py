@@ -2,26 +2,55 @@
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING, ClassVar, Literal, Optional
 
 from pydantic import BaseModel
 
+from socials import codes
+from socials.hosts import matches_domains
+from socials.platforms.base import lazy_compile
+
 if TYPE_CHECKING:
+    from socials.hosts import HostPolicy
     from socials.protocols import SocialsURL
 
+# Hosts serving profiles: www., mobile (m., mbasic.), web. and locale hosts
+# (de-de.); other subdomains (developers., business., l.) are not profiles
+_PROFILE_HOST = r"(?:(?:www|m|mbasic|web|[a-z]{2}-[a-z]{2})\.)?facebook\.com"
+
+# Reserved paths that are not usernames, matched as prefixes; checked in
+# parse() rather than with a lookahead, so the pattern also compiles with RE2
+_RESERVED_PREFIXES = (
+    "marketplace",
+    "gaming",
+    "watch",
+    "me",
+    "messages",
+    "help",
+    "search",
+    "groups",
+)
+
 # Regex patterns with named groups
 # Adapted from: https://github.com/lorey/social-media-profiles-regexs
-PROFILE_REGEX = re.compile(
-    r"^https?://(?:www\.)?(?:facebook|fb)\.com/"
-    r"(?P<username>(?![A-Za-z]+\.php)"
-    r"(?!marketplace|gaming|watch|me|messages|help|search|groups)[A-Za-z0-9_.-]+)/?$",
+PROFILE_REGEX = lazy_compile(
+    rf"^https?://(?:{_PROFILE_HOST}|(?:www\.)?fb\.com)/"
+    r"(?P<username>[A-Za-z0-9_.-]+)/?$",
 )
-PROFILE_BY_ID_REGEX = re.compile(
-    r"^https?://(?:www\.)?facebook\.com/(?:profile\.php\?id=)?(?P<user_id>[0-9]+)$",
+PROFILE_BY_ID_REGEX = lazy_compile(
+    rf"^https?://{_PROFILE_HOST}/(?:profile\.php\?id=)?(?P<user_id>[0-9]+)$",
 )
 
 
+def _is_reserved(username: str) -> bool:
+    """Check for a reserved path or a page such as `home.php`."""
+    if username.startswith(_RESERVED_PREFIXES):
+        return True
+    # Letters followed by ".php", e.g. home.php or profile.php
+    name, dot, rest = username.partition(".")
+    return bool(dot) and name.isascii() and name.isalpha() and rest.startswith("php")
+
+
 class FacebookProfileURL(BaseModel, frozen=True):
     """Facebook user or page profile URL."""
 
@@ -30,6 +59,9 @@ class FacebookProfileURL(BaseModel, frozen=True):
     entity_type: Literal["profile"] = "profile"
     username: Optional[str] = None
     user_id: Optional[str] = None
+    normalized_url: Optional[str] = None
+    platform_code: ClassVar[int] = codes.platform_code("facebook")
+    entity_type_code: ClassVar[int] = codes.entity_type_code("profile")
 
     def __hash__(self) -> int:
         """Return hash based on URL."""
@@ -53,16 +85,15 @@ class FacebookParser:
 
     platform = "facebook"
     schemes: ClassVar[set[str]] = {"http", "https"}
+    # Any subdomain is routed here; the patterns only accept profile hosts
+    domains: ClassVar[dict[str, HostPolicy]] = {
+        "facebook.com": "subdomains",
+        "fb.com": "www",
+    }
 
     def handles_hostname(self, hostname: str) -> bool:
         """Check if this parser handles the given hostname."""
-        return hostname in {
-            "facebook.com",
-            "www.facebook.com",
-            "fb.com",
-            "www.fb.com",
-            "m.facebook.com",
-        }
+        return matches_domains(hostname, self.domains)
 
     def parse(self, url: str) -> FacebookProfileURL | None:
         """Parse a Facebook URL into a typed object."""
@@ -71,7 +102,8 @@ class FacebookParser:
             return FacebookProfileURL(url=url, **match.groupdict())
 
         # Try username profile
-        if match := PROFILE_REGEX.match(url):
+        match = PROFILE_REGEX.match(url)
+        if match and not _is_reserved(match["username"]):
             return FacebookProfileURL(url=url, **match.groupdict())
 
         return None
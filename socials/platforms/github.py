@@ -2,31 +2,43 @@
 
 from __future__ import annotations
 
-import re
-from typing import TYPE_CHECKING, ClassVar, Literal
+from functools import cached_property
+from typing import TYPE_CHECKING, ClassVar, Literal, Optional
 
 from pydantic import BaseModel
 
+from socials import codes
+from socials.hosts import matches_domains
+from socials.platforms.base import char_table, fast_path, lazy_compile
+
 if TYPE_CHECKING:
+    from socials.hosts import HostPolicy
     from socials.protocols import SocialsURL
 
-# Reserved paths that are not usernames
+# Reserved paths that are not usernames, matched as prefixes; checked in
+# parse() rather than with lookaheads, so the patterns also compile with RE2
 _RESERVED = (
     "about|codespaces|collections|contact|customer-stories|enterprise|events|"
     "explore|features|issues|login|marketplace|new|notifications|orgs|pricing|"
     "pulls|readme|search|security|settings|sponsors|team|topics|trending"
 )
+_RESERVED_PREFIXES = tuple(_RESERVED.split("|"))
 
 # Regex patterns with named groups
 # Adapted from: https://github.com/lorey/social-media-profiles-regexs
-REPO_REGEX = re.compile(
-    rf"^https?://(?:www\.)?github\.com/(?P<owner>(?!{_RESERVED})[A-Za-z0-9_-]+)/"
+REPO_REGEX = lazy_compile(
+    r"^https?://(?:www\.)?github\.com/(?P<owner>[A-Za-z0-9_-]+)/"
     r"(?P<repo>[A-Za-z0-9._-]+)/?$",
 )
-PROFILE_REGEX = re.compile(
-    rf"^https?://(?:www\.)?github\.com/(?P<username>(?!{_RESERVED})[A-Za-z0-9_-]+)/?$",
+PROFILE_REGEX = lazy_compile(
+    r"^https?://(?:www\.)?github\.com/(?P<username>[A-Za-z0-9_-]+)/?$",
 )
 
+# Fast path for the same shapes (see socials.platforms.base.fast_path)
+_FAST_HOSTS = frozenset({"github.com", "www.github.com"})
+_OWNER_CHARS = char_table("_-")
+_REPO_CHARS = char_table("._-")
+
 
 class GitHubProfileURL(BaseModel, frozen=True):
     """GitHub user or organization profile URL."""
@@ -35,6 +47,9 @@ class GitHubProfileURL(BaseModel, frozen=True):
     platform: Literal["github"] = "github"
     entity_type: Literal["profile"] = "profile"
     username: str
+    normalized_url: Optional[str] = None
+    platform_code: ClassVar[int] = codes.platform_code("github")
+    entity_type_code: ClassVar[int] = codes.entity_type_code("profile")
 
     def __hash__(self) -> int:
         """Return hash based on URL."""
@@ -61,25 +76,33 @@ class GitHubRepoURL(BaseModel, frozen=True):
     entity_type: Literal["repo"] = "repo"
     owner: str
     repo: str
+    normalized_url: Optional[str] = None
+    platform_code: ClassVar[int] = codes.platform_code("github")
+    entity_type_code: ClassVar[int] = codes.entity_type_code("repo")
 
     def __hash__(self) -> int:
         """Return hash based on URL."""
         return hash(self.url)
 
-    def get_parent(self) -> GitHubProfileURL:
-        """Return parent profile."""
-        return GitHubProfileURL(
+    @cached_property
+    def _parent(self) -> GitHubProfileURL:
+        """Parent profile, built once per instance (owner is already validated)."""
+        return GitHubProfileURL.model_construct(
             url=f"https://github.com/{self.owner}",
             username=self.owner,
         )
 
+    def get_parent(self) -> GitHubProfileURL:
+        """Return parent profile."""
+        return self._parent
+
     def get_root(self) -> GitHubProfileURL:
         """Return root of hierarchy."""
-        return self.get_parent()
+        return self._parent
 
     def get_ancestors(self) -> list[SocialsURL]:
         """Return ancestors."""
-        return [self.get_parent()]
+        return [self._parent]
 
 
 class GitHubParser:
@@ -87,19 +110,35 @@ class GitHubParser:
 
     platform = "github"
     schemes: ClassVar[set[str]] = {"http", "https"}
+    domains: ClassVar[dict[str, HostPolicy]] = {"github.com": "www"}
 
     def handles_hostname(self, hostname: str) -> bool:
         """Check if this parser handles the given hostname."""
-        return hostname in {"github.com", "www.github.com"}
+        return matches_domains(hostname, self.domains)
 
     def parse(self, url: str) -> GitHubProfileURL | GitHubRepoURL | None:
         """Parse a GitHub URL into a typed object."""
+        path = fast_path(url, _FAST_HOSTS)
+        if path is not None:
+            owner, slash, repo = path.partition("/")
+            valid_owner = (
+                owner
+                and _OWNER_CHARS.issuperset(owner)
+                and not owner.startswith(_RESERVED_PREFIXES)
+            )
+            if valid_owner and not slash:
+                return GitHubProfileURL(url=url, username=owner)
+            if valid_owner and repo and _REPO_CHARS.issuperset(repo):
+                return GitHubRepoURL(url=url, owner=owner, repo=repo)
+
         # Try repo first (more specific)
-        if match := REPO_REGEX.match(url):
+        match = REPO_REGEX.match(url)
+        if match and not match["owner"].startswith(_RESERVED_PREFIXES):
             return GitHubRepoURL(url=url, **match.groupdict())
 
         # Try profile
-        if match := PROFILE_REGEX.match(url):
+        match = PROFILE_REGEX.match(url)
+        if match and not match["username"].startswith(_RESERVED_PREFIXES):
             return GitHubProfileURL(url=url, **match.groupdict())
 
         return None
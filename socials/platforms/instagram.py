@@ -2,19 +2,37 @@
 
 from __future__ import annotations
 
-import re
-from typing import TYPE_CHECKING, ClassVar, Literal
+from typing import TYPE_CHECKING, ClassVar, Literal, Optional
 
 from pydantic import BaseModel
 
+from socials import codes
+from socials.hosts import matches_domains
+from socials.platforms.base import lazy_compile
+
 if TYPE_CHECKING:
+    from socials.hosts import HostPolicy
     from socials.protocols import SocialsURL
 
+# Reserved paths that are not usernames, matched as prefixes; checked in
+# parse() rather than with a lookahead, so the pattern also compiles with RE2
+_RESERVED_PREFIXES = (
+    "about",
+    "accounts",
+    "direct",
+    "explore",
+    "legal",
+    "p",
+    "privacy",
+    "reels",
+    "stories",
+    "tv",
+)
+
 # Regex patterns with named groups
 # Adapted from: https://github.com/lorey/social-media-profiles-regexs
-PROFILE_REGEX = re.compile(
+PROFILE_REGEX = lazy_compile(
     r"^https?://(?:www\.)?(?:instagram\.com|instagr\.am)/"
-    r"(?!about|accounts|direct|explore|legal|p|privacy|reels|stories|tv)"
     r"(?P<username>[A-Za-z0-9_.]{1,30})/?$",
 )
 
@@ -26,6 +44,9 @@ class InstagramProfileURL(BaseModel, frozen=True):
     platform: Literal["instagram"] = "instagram"
     entity_type: Literal["profile"] = "profile"
     username: str
+    normalized_url: Optional[str] = None
+    platform_code: ClassVar[int] = codes.platform_code("instagram")
+    entity_type_code: ClassVar[int] = codes.entity_type_code("profile")
 
     def __hash__(self) -> int:
         """Return hash based on URL."""
@@ -49,18 +70,18 @@ class InstagramParser:
 
     platform = "instagram"
     schemes: ClassVar[set[str]] = {"http", "https"}
+    domains: ClassVar[dict[str, HostPolicy]] = {
+        "instagram.com": "www",
+        "instagr.am": "www",
+    }
 
     def handles_hostname(self, hostname: str) -> bool:
         """Check if this parser handles the given hostname."""
-        return hostname in {
-            "instagram.com",
-            "www.instagram.com",
-            "instagr.am",
-            "www.instagr.am",
-        }
+        return matches_domains(hostname, self.domains)
 
     def parse(self, url: str) -> InstagramProfileURL | None:
         """Parse an Instagram URL into a typed object."""
-        if match := PROFILE_REGEX.match(url):
+        match = PROFILE_REGEX.match(url)
+        if match and not match["username"].startswith(_RESERVED_PREFIXES):
             return InstagramProfileURL(url=url, **match.groupdict())
         return None
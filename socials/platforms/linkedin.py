@@ -2,28 +2,37 @@
 
 from __future__ import annotations
 
-import re
-from typing import TYPE_CHECKING, ClassVar, Literal
+from typing import TYPE_CHECKING, ClassVar, Literal, Optional
 
 from pydantic import BaseModel
 
+from socials import codes
+from socials.hosts import matches_domains
+from socials.platforms.base import char_table, fast_path, lazy_compile
+
 if TYPE_CHECKING:
+    from socials.hosts import HostPolicy
     from socials.protocols import SocialsURL
 
 # Regex patterns with named groups
 # Adapted from: https://github.com/lorey/social-media-profiles-regexs
-PROFILE_REGEX = re.compile(
-    r"^https?://(?:[\w]+\.)?linkedin\.com/in/(?P<username>[\w\-_]+)/?$",
+PROFILE_REGEX = lazy_compile(
+    r"^https?://(?:[\w-]+\.)*linkedin\.com/in/(?P<username>[\w\-_]+)/?$",
 )
-PROFILE_PUB_REGEX = re.compile(
-    r"^https?://(?:[\w]+\.)?linkedin\.com/pub/(?P<username>[A-Za-z0-9_-]+)"
+PROFILE_PUB_REGEX = lazy_compile(
+    r"^https?://(?:[\w-]+\.)*linkedin\.com/pub/(?P<username>[A-Za-z0-9_-]+)"
     r"(?:/[A-Za-z0-9]+){3}/?$",
 )
-COMPANY_REGEX = re.compile(
-    r"^https?://(?:[\w]+\.)?linkedin\.com/(?:company|school)/"
+COMPANY_REGEX = lazy_compile(
+    r"^https?://(?:[\w-]+\.)*linkedin\.com/(?:company|school)/"
     r"(?P<company_id>[A-Za-z0-9_-]+)/?$",
 )
 
+# Fast path for /in/ and /company/ URLs on the main hosts, ASCII names only
+# (see socials.platforms.base.fast_path)
+_FAST_HOSTS = frozenset({"linkedin.com", "www.linkedin.com"})
+_NAME_CHARS = char_table("_-")
+
 
 class LinkedInProfileURL(BaseModel, frozen=True):
     """LinkedIn personal profile URL."""
@@ -32,6 +41,9 @@ class LinkedInProfileURL(BaseModel, frozen=True):
     platform: Literal["linkedin"] = "linkedin"
     entity_type: Literal["profile"] = "profile"
     username: str
+    normalized_url: Optional[str] = None
+    platform_code: ClassVar[int] = codes.platform_code("linkedin")
+    entity_type_code: ClassVar[int] = codes.entity_type_code("profile")
 
     def __hash__(self) -> int:
         """Return hash based on URL."""
@@ -57,6 +69,9 @@ class LinkedInCompanyURL(BaseModel, frozen=True):
     platform: Literal["linkedin"] = "linkedin"
     entity_type: Literal["company"] = "company"
     company_id: str
+    normalized_url: Optional[str] = None
+    platform_code: ClassVar[int] = codes.platform_code("linkedin")
+    entity_type_code: ClassVar[int] = codes.entity_type_code("company")
 
     def __hash__(self) -> int:
         """Return hash based on URL."""
@@ -80,14 +95,24 @@ class LinkedInParser:
 
     platform = "linkedin"
     schemes: ClassVar[set[str]] = {"http", "https"}
+    # LinkedIn has various subdomains (www, de, uk, etc.)
+    domains: ClassVar[dict[str, HostPolicy]] = {"linkedin.com": "subdomains"}
 
     def handles_hostname(self, hostname: str) -> bool:
         """Check if this parser handles the given hostname."""
-        # LinkedIn has various subdomains (www, de, uk, etc.)
-        return hostname == "linkedin.com" or hostname.endswith(".linkedin.com")
+        return matches_domains(hostname, self.domains)
 
     def parse(self, url: str) -> LinkedInProfileURL | LinkedInCompanyURL | None:
         """Parse a LinkedIn URL into a typed object."""
+        path = fast_path(url, _FAST_HOSTS)
+        if path is not None:
+            section, _, name = path.partition("/")
+            if name and _NAME_CHARS.issuperset(name):
+                if section == "in":
+                    return LinkedInProfileURL(url=url, username=name)
+                if section in {"company", "school"}:
+                    return LinkedInCompanyURL(url=url, company_id=name)
+
         # Try company first (more specific path)
         if match := COMPANY_REGEX.match(url):
             return LinkedInCompanyURL(url=url, **match.groupdict())
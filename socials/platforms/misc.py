@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
-import re
-from typing import TYPE_CHECKING, ClassVar, Literal
+from typing import TYPE_CHECKING, ClassVar, Literal, Optional
 from urllib.parse import unquote
 
 from pydantic import BaseModel
 
+from socials import codes
+from socials.platforms.base import lazy_compile
+
 if TYPE_CHECKING:
     from socials.protocols import SocialsURL
 
+# Basic email validation
+EMAIL_REGEX = lazy_compile(r"^[\w.+-]+@[\w.-]+\.[a-zA-Z]{2,}$")
+
+# Basic phone validation (digits, spaces, dashes, parens, plus)
+PHONE_REGEX = lazy_compile(r"^[+\d\s().-]+$")
+
 
 class EmailURL(BaseModel, frozen=True):
     """Email address (mailto: URL or plain email)."""
@@ -19,6 +27,9 @@ class EmailURL(BaseModel, frozen=True):
     platform: Literal["email"] = "email"
     entity_type: Literal["email"] = "email"
     email: str
+    normalized_url: Optional[str] = None
+    platform_code: ClassVar[int] = codes.platform_code("email")
+    entity_type_code: ClassVar[int] = codes.entity_type_code("email")
 
     def __hash__(self) -> int:
         """Return hash based on URL."""
@@ -44,6 +55,9 @@ class PhoneURL(BaseModel, frozen=True):
     platform: Literal["phone"] = "phone"
     entity_type: Literal["phone"] = "phone"
     number: str
+    normalized_url: Optional[str] = None
+    platform_code: ClassVar[int] = codes.platform_code("phone")
+    entity_type_code: ClassVar[int] = codes.entity_type_code("phone")
 
     def __hash__(self) -> int:
         """Return hash based on URL."""
@@ -80,8 +94,7 @@ class EmailParser:
         else:
             email = url
 
-        # Basic email validation
-        if not re.match(r"^[\w.+-]+@[\w.-]+\.[a-zA-Z]{2,}$", email):
+        if not EMAIL_REGEX.match(email):
             return None
 
         return EmailURL(
@@ -107,8 +120,7 @@ class PhoneParser:
 
         number = unquote(url[4:])
 
-        # Basic phone validation (digits, spaces, dashes, parens, plus)
-        if not re.match(r"^[+\d\s().-]+$", number):
+        if not PHONE_REGEX.match(number):
             return None
 
         return PhoneURL(
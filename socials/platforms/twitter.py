@@ -2,21 +2,38 @@
 
 from __future__ import annotations
 
-import re
-from typing import TYPE_CHECKING, ClassVar, Literal
+from typing import TYPE_CHECKING, ClassVar, Literal, Optional
 
 from pydantic import BaseModel
 
+from socials import codes
+from socials.hosts import matches_domains
+from socials.platforms.base import char_table, fast_path, lazy_compile
+
 if TYPE_CHECKING:
+    from socials.hosts import HostPolicy
     from socials.protocols import SocialsURL
 
+# Reserved paths that are not usernames, matched as prefixes; checked in
+# parse() rather than with a lookahead, so the pattern also compiles with RE2
+_RESERVED = "home|share|privacy|tos|explore|search|settings|messages|i|login|compose"
+_RESERVED_PREFIXES = tuple(_RESERVED.split("|"))
+
 # Regex patterns with named groups
 # Adapted from: https://github.com/lorey/social-media-profiles-regexs
-PROFILE_REGEX = re.compile(
+PROFILE_REGEX = lazy_compile(
     r"^https?://(?:www\.|mobile\.)?(?:twitter|x)\.com/"
-    r"@?(?!home|share|privacy|tos|explore|search|settings|messages|i|login|compose)"
-    r"(?P<username>[A-Za-z0-9_]{1,15})/?$",
+    r"@?(?P<username>[A-Za-z0-9_]{1,15})/?$",
+)
+
+# Fast path for the same shapes (see socials.platforms.base.fast_path)
+_FAST_HOSTS = frozenset(
+    f"{prefix}{domain}"
+    for prefix in ("", "www.", "mobile.")
+    for domain in ("twitter.com", "x.com")
 )
+_USERNAME_CHARS = char_table("_")
+_MAX_USERNAME_LENGTH = 15
 
 
 class TwitterProfileURL(BaseModel, frozen=True):
@@ -26,6 +43,9 @@ class TwitterProfileURL(BaseModel, frozen=True):
     platform: Literal["twitter"] = "twitter"
     entity_type: Literal["profile"] = "profile"
     username: str
+    normalized_url: Optional[str] = None
+    platform_code: ClassVar[int] = codes.platform_code("twitter")
+    entity_type_code: ClassVar[int] = codes.entity_type_code("profile")
 
     def __hash__(self) -> int:
         """Return hash based on URL."""
@@ -49,20 +69,29 @@ class TwitterParser:
 
     platform = "twitter"
     schemes: ClassVar[set[str]] = {"http", "https"}
+    domains: ClassVar[dict[str, HostPolicy]] = {
+        "twitter.com": "www",
+        "x.com": "www",
+        "mobile.twitter.com": "exact",
+        "mobile.x.com": "exact",
+    }
 
     def handles_hostname(self, hostname: str) -> bool:
         """Check if this parser handles the given hostname."""
-        return hostname in {
-            "twitter.com",
-            "www.twitter.com",
-            "x.com",
-            "www.x.com",
-            "mobile.twitter.com",
-            "mobile.x.com",
-        }
+        return matches_domains(hostname, self.domains)
 
     def parse(self, url: str) -> TwitterProfileURL | None:
         """Parse a Twitter/X URL into a typed object."""
-        if match := PROFILE_REGEX.match(url):
+        username = fast_path(url, _FAST_HOSTS)
+        if (
+            username
+            and len(username) <= _MAX_USERNAME_LENGTH
+            and _USERNAME_CHARS.issuperset(username)
+            and not username.startswith(_RESERVED_PREFIXES)
+        ):
+            return TwitterProfileURL(url=url, username=username)
+
+        match = PROFILE_REGEX.match(url)
+        if match and not match["username"].startswith(_RESERVED_PREFIXES):
             return TwitterProfileURL(url=url, **match.groupdict())
         return None
@@ -2,35 +2,41 @@
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING, ClassVar, Literal, Optional
 
 from pydantic import BaseModel
 
+from socials import codes
+from socials.hosts import matches_domains
+from socials.platforms.base import lazy_compile
+
 if TYPE_CHECKING:
+    from socials.hosts import HostPolicy
     from socials.protocols import SocialsURL
 
 # Regex patterns with named groups
 # Adapted from: https://github.com/lorey/social-media-profiles-regexs
-CHANNEL_ID_REGEX = re.compile(
+CHANNEL_ID_REGEX = lazy_compile(
     r"^https?://(?:www\.|m\.)?youtube\.com/channel/(?P<channel_id>UC[A-Za-z0-9_-]+)/?$",
 )
-USER_REGEX = re.compile(
+USER_REGEX = lazy_compile(
     r"^https?://(?:www\.|m\.)?youtube\.com/user/(?P<username>[A-Za-z0-9_.-]+)/?$",
 )
-CUSTOM_REGEX = re.compile(
+CUSTOM_REGEX = lazy_compile(
     r"^https?://(?:www\.|m\.)?youtube\.com/c/(?P<custom_url>[A-Za-z0-9_.-]+)/?$",
 )
-HANDLE_REGEX = re.compile(
+HANDLE_REGEX = lazy_compile(
     r"^https?://(?:www\.|m\.)?youtube\.com/@(?P<custom_url>[A-Za-z0-9_.-]+)/?$",
 )
-# Direct /channelname format (excluding reserved paths)
+# Direct /channelname format; reserved paths (matched as prefixes) are
+# excluded in parse() rather than with a lookahead, so RE2 can compile it
 _RESERVED = (
     "about|account|channel|embed|feed|gaming|hashtag|live|music|"
     "playlist|premium|redirect|results|shorts|trending|upload|watch|c|user"
 )
-DIRECT_REGEX = re.compile(
-    rf"^https?://(?:www\.|m\.)?youtube\.com/(?P<custom_url>(?!{_RESERVED})[A-Za-z0-9_.-]+)/?$",
+_RESERVED_PREFIXES = tuple(_RESERVED.split("|"))
+DIRECT_REGEX = lazy_compile(
+    r"^https?://(?:www\.|m\.)?youtube\.com/(?P<custom_url>[A-Za-z0-9_.-]+)/?$",
 )
 
 
@@ -43,6 +49,9 @@ class YouTubeChannelURL(BaseModel, frozen=True):
     channel_id: Optional[str] = None
     username: Optional[str] = None
     custom_url: Optional[str] = None
+    normalized_url: Optional[str] = None
+    platform_code: ClassVar[int] = codes.platform_code("youtube")
+    entity_type_code: ClassVar[int] = codes.entity_type_code("channel")
 
     def __hash__(self) -> int:
         """Return hash based on URL."""
@@ -66,14 +75,14 @@ class YouTubeParser:
 
     platform = "youtube"
     schemes: ClassVar[set[str]] = {"http", "https"}
+    domains: ClassVar[dict[str, HostPolicy]] = {
+        "youtube.com": "www",
+        "m.youtube.com": "exact",
+    }
 
     def handles_hostname(self, hostname: str) -> bool:
         """Check if this parser handles the given hostname."""
-        return hostname in {
-            "youtube.com",
-            "www.youtube.com",
-            "m.youtube.com",
-        }
+        return matches_domains(hostname, self.domains)
 
     def parse(self, url: str) -> YouTubeChannelURL | None:
         """Parse a YouTube URL into a typed object."""
@@ -89,7 +98,8 @@ class YouTubeParser:
         if match := HANDLE_REGEX.match(url):
             return YouTubeChannelURL(url=url, **match.groupdict())
 
-        if match := DIRECT_REGEX.match(url):
+        match = DIRECT_REGEX.match(url)
+        if match and not match["custom_url"].startswith(_RESERVED_PREFIXES):
             return YouTubeChannelURL(url=url, **match.groupdict())
 
         return None
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import ClassVar, Protocol, runtime_checkable
+from typing import Protocol, runtime_checkable
 
 
 class ParseError(Exception):
@@ -46,7 +46,11 @@ class PlatformParser(Protocol):
     """Interface for platform-specific URL parsers."""
 
     platform: str
-    schemes: ClassVar[set[str]]
+
+    @property
+    def schemes(self) -> set[str]:
+        """URL schemes this parser handles (e.g., {'http', 'https'})."""
+        ...
 
     def handles_hostname(self, hostname: str) -> bool:
         """Check if this parser handles the given hostname."""
@@ -55,3 +59,27 @@ class PlatformParser(Protocol):
     def parse(self, url: str) -> SocialsURL | None:
         """Parse URL into typed object, or None if not recognized."""
         ...
+
+
+class ResultCache(Protocol):
+    """Cache of parse outcomes keyed by input URL.
+
+    Values are parsed results, or the failure reason (e.g. `"no_parser"`) for
+    URLs that were not recognized. A plain `dict` satisfies this protocol.
+    """
+
+    def get(self, key: str, /) -> SocialsURL | str | None:
+        """Return the cached outcome for a URL, or None if not cached."""
+        ...
+
+    def __setitem__(self, key: str, value: SocialsURL | str, /) -> None:
+        """Cache the outcome for a URL."""
+        ...
+
+
+class ResolverBackend(Protocol):
+    """Async backend that resolves a short link, e.g. by following redirects."""
+
+    async def resolve(self, url: str, /) -> str | None:
+        """Return the target of a short link, or None if it has none."""
+        ...
@@ -0,0 +1,88 @@
+"""Unwrapping of redirect wrappers before parsing.
+
+Links shared on social sites and in search results are often wrapped in a
+redirect through the site itself (`l.facebook.com/l.php?u=...`,
+`www.google.com/url?q=...`). `unwrap_once()` looks the host up in
+`REDIRECT_WRAPPERS` and decodes the target from the query, so the extractor
+can parse the target instead of rejecting the wrapper.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, urlsplit
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# Known wrappers: host -> path -> query parameters that carry the target
+REDIRECT_WRAPPERS: Mapping[str, Mapping[str, tuple[str, ...]]] = {
+    "l.facebook.com": {"/l.php": ("u",)},
+    "lm.facebook.com": {"/l.php": ("u",)},
+    "l.messenger.com": {"/l.php": ("u",)},
+    "l.instagram.com": {"/": ("u",)},
+    "google.com": {"/url": ("q", "url")},
+    "www.google.com": {"/url": ("q", "url")},
+    "t.umblr.com": {"/redirect": ("z",)},
+    "linkedin.com": {"/redir/redirect": ("url",)},
+    "www.linkedin.com": {"/redir/redirect": ("url",)},
+    "youtube.com": {"/redirect": ("q",)},
+    "www.youtube.com": {"/redirect": ("q",)},
+}
+
+# Wrappers unwrapped at most per URL (e.g. a Facebook link to a Google link)
+MAX_REDIRECT_DEPTH = 3
+
+_TARGET_PREFIXES = ("http://", "https://")
+
+
+def unwrap_once(url: str) -> str | None:
+    """Return the target of a redirect wrapper.
+
+    Args:
+        url: URL that may be a known redirect wrapper.
+
+    Returns:
+        The decoded http(s) target, or None if the URL is not a known
+        wrapper or carries no usable target.
+
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return None
+    paths = REDIRECT_WRAPPERS.get(parts.netloc.lower())
+    if paths is None:
+        return None
+    params = paths.get(parts.path or "/")
+    if params is None:
+        return None
+    for key, value in parse_qsl(parts.query):
+        if key in params and value.lower().startswith(_TARGET_PREFIXES):
+            return value.strip()
+    return None
+
+
+def unwrap_url(url: str, *, max_depth: int = MAX_REDIRECT_DEPTH) -> str:
+    """Follow nested redirect wrappers to the innermost target.
+
+    Args:
+        url: URL as found in the wild.
+        max_depth: Maximum number of wrappers to remove.
+
+    Returns:
+        The innermost target, or the URL itself if it is not a wrapper.
+
+    Examples:
+        ```python
+        unwrap_url("https://l.facebook.com/l.php?u=https%3A%2F%2Fgithub.com%2Florey")
+        # "https://github.com/lorey"
+        ```
+
+    """
+    for _ in range(max_depth):
+        target = unwrap_once(url)
+        if target is None:
+            break
+        url = target
+    return url
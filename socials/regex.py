@@ -0,0 +1,230 @@
+r"""Pluggable regex engines for platform patterns, and an input guard.
+
+All platform patterns are `LazyPattern`s that compile through the active
+backend. The default backend is the standard library `re`. The `re2` backend
+uses Google's RE2 (`pip install 'socials[re2]'`), which matches in time linear
+in the input, so adversarial URLs can't cause catastrophic backtracking.
+
+RE2 doesn't support lookarounds or backreferences; patterns using them are
+compiled with `re` instead and listed in `RE2Backend.fallbacks`. Built-in
+patterns use neither (parsers check reserved paths in code), so only plugin
+patterns can fall back. `\w` and `\d` are translated to their Unicode
+classes, so both backends match the same strings.
+
+Independently of the backend, `Extractor` rejects inputs that fail
+`is_plausible_url()` (too long, or containing control characters) before any
+pattern runs.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import weakref
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from socials.platforms.base import LazyPattern
+
+# Longest input handed to a pattern; longer strings are rejected up front
+MAX_URL_LENGTH = 2048
+
+
+def is_plausible_url(url: str) -> bool:
+    """Check an input cheaply before any pattern runs on it.
+
+    Args:
+        url: Input string.
+
+    Returns:
+        False if it is longer than `MAX_URL_LENGTH` or contains control or
+        other non-printable characters, True otherwise.
+
+    """
+    return len(url) <= MAX_URL_LENGTH and url.isprintable()
+
+
+class CompiledPattern(Protocol):
+    """A compiled pattern as returned by a backend."""
+
+    def match(self, string: str, /) -> re.Match[str] | None:
+        """Match the pattern at the start of the string."""
+        ...
+
+
+class RegexBackend(Protocol):
+    """Engine that compiles platform patterns."""
+
+    name: str
+
+    def compile(self, pattern: str, flags: int = 0) -> CompiledPattern:
+        """Compile a pattern."""
+        ...
+
+
+class StdlibBackend:
+    """Backend using the standard library `re` module."""
+
+    name = "re"
+
+    def compile(self, pattern: str, flags: int = 0) -> CompiledPattern:
+        """Compile a pattern with `re`.
+
+        Args:
+            pattern: Regular expression source.
+            flags: `re` flags.
+
+        Returns:
+            Compiled pattern.
+
+        """
+        return re.compile(pattern, flags)
+
+
+# Python's Unicode-aware classes spelled as RE2 Unicode classes
+_UNICODE_CLASSES = {"w": r"\pL\pN_", "d": r"\p{Nd}"}
+
+
+def _translate_for_re2(pattern: str) -> str:
+    r"""Spell `\w` and `\d` as Unicode classes, as `re` interprets them."""
+    out: list[str] = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            unicode_class = _UNICODE_CLASSES.get(escaped)
+            if unicode_class is None:
+                out.append(pattern[i : i + 2])
+            elif in_class:
+                out.append(unicode_class)
+            else:
+                out.append(f"[{unicode_class}]")
+            i += 2
+            continue
+        if char == "[" and not in_class:
+            in_class = True
+        elif char == "]" and in_class and out[-1] != "[":
+            in_class = False
+        out.append(char)
+        i += 1
+    return "".join(out)
+
+
+class RE2Backend:
+    """Backend using RE2, with a per-pattern fallback to `re`.
+
+    Patterns RE2 rejects (lookarounds, backreferences) or that need `re`
+    flags are compiled with `re` and recorded in `fallbacks`.
+    """
+
+    name = "re2"
+
+    def __init__(self) -> None:
+        """Import RE2.
+
+        Raises:
+            ImportError: If the `google-re2` package is not installed.
+
+        """
+        try:
+            import re2  # noqa: PLC0415
+        except ImportError as e:
+            msg = (
+                "The re2 regex backend requires the google-re2 package: "
+                "pip install 'socials[re2]'"
+            )
+            raise ImportError(msg) from e
+        self._re2 = re2
+        self._options = re2.Options()
+        self._options.log_errors = False
+        self.fallbacks: set[str] = set()
+
+    def compile(self, pattern: str, flags: int = 0) -> CompiledPattern:
+        """Compile a pattern with RE2, or with `re` if RE2 can't.
+
+        Args:
+            pattern: Regular expression source.
+            flags: `re` flags; patterns with flags are compiled with `re`.
+
+        Returns:
+            Compiled pattern.
+
+        """
+        if not flags:
+            try:
+                translated = _translate_for_re2(pattern)
+                return self._re2.compile(translated, self._options)  # type: ignore[no-any-return]
+            except self._re2.error:
+                pass
+        self.fallbacks.add(pattern)
+        return re.compile(pattern, flags)
+
+
+_BACKENDS: dict[str, type[RegexBackend]] = {
+    "re": StdlibBackend,
+    "re2": RE2Backend,
+}
+
+_backend: RegexBackend = StdlibBackend()
+_backend_lock = threading.Lock()
+
+# Patterns compiled through a backend, reset when the backend changes
+_patterns: weakref.WeakSet[LazyPattern] = weakref.WeakSet()
+
+
+def get_backend() -> RegexBackend:
+    """Return the active regex backend."""
+    return _backend
+
+
+def set_backend(backend: str | RegexBackend) -> RegexBackend:
+    """Switch the regex backend for all platform patterns.
+
+    Patterns compiled so far are recompiled with the new backend on next
+    use. Switch backends at startup, not while other threads are parsing.
+
+    Args:
+        backend: `"re"`, `"re2"`, or a backend instance.
+
+    Returns:
+        The previous backend.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If the backend's engine is not installed.
+
+    """
+    global _backend
+    if isinstance(backend, str):
+        try:
+            backend_class = _BACKENDS[backend]
+        except KeyError:
+            msg = (
+                f"Unknown regex backend {backend!r}, "
+                f"expected one of {sorted(_BACKENDS)}"
+            )
+            raise ValueError(msg) from None
+        backend = backend_class()
+    with _backend_lock:
+        previous, _backend = _backend, backend
+        for pattern in list(_patterns):
+            pattern.reset()
+    return previous
+
+
+def compile_pattern(pattern: LazyPattern) -> CompiledPattern:
+    """Compile a lazy pattern with the active backend.
+
+    Args:
+        pattern: Pattern to compile; it is reset if the backend changes.
+
+    Returns:
+        Compiled pattern.
+
+    """
+    with _backend_lock:
+        _patterns.add(pattern)
+        backend = _backend
+    return backend.compile(pattern.pattern, pattern.flags)
@@ -5,17 +5,34 @@ from __future__ import annotations
 import warnings
 from typing import TYPE_CHECKING
 
+from socials.hosts import HostTrie
 from socials.platforms.base import extract_hostname, extract_scheme
 
 if TYPE_CHECKING:
     from socials.protocols import PlatformParser, SocialsURL
 
 
+# Schemes differentiated by hostname rather than by scheme
+_HOSTNAME_SCHEMES = frozenset({"http", "https"})
+
+# Maximum number of hostname lookups memoized by a frozen registry
+_HOST_CACHE_SIZE = 4096
+
+
 class Registry:
     """Registry that maps hostnames to platform parsers.
 
     When multiple parsers could handle the same URL, the first registered
     parser takes priority. This is a "first match wins" policy.
+
+    Parsers that declare `domains` (a mapping of domain to subdomain policy,
+    see `socials.hosts`) are routed through a hostname trie in one pass over
+    the host's labels. Parsers without `domains` are asked via
+    `handles_hostname()`.
+
+    A registry can be frozen with `freeze()`. Frozen registries reject new
+    parsers, which makes them safe to share between extractors and lets them
+    memoize hostname lookups.
     """
 
     def __init__(self, parsers: list[PlatformParser] | None = None) -> None:
@@ -26,6 +43,11 @@ class Registry:
 
         """
         self._parsers: list[PlatformParser] = []
+        self._scheme_index: dict[str, PlatformParser] = {}
+        self._host_trie: HostTrie[tuple[int, PlatformParser]] = HostTrie()
+        # (priority, parser) for parsers without declared domains
+        self._host_fallback: list[tuple[int, PlatformParser]] = []
+        self._host_cache: dict[str, PlatformParser | None] | None = None
         if parsers:
             for parser in parsers:
                 self.register(parser)
@@ -39,23 +61,70 @@ class Registry:
         Args:
             parser: Parser to register.
 
-        """
-        # Check for scheme overlap with existing parsers (ignore http/https since
-        # those are differentiated by hostname, not scheme)
-        dominated_schemes = {"http", "https"}
-        for existing in self._parsers:
-            overlap = (parser.schemes & existing.schemes) - dominated_schemes
-            if overlap:
-                warnings.warn(
-                    f"Parser '{parser.platform}' has overlapping schemes {overlap} "
-                    f"with existing parser '{existing.platform}'. "
-                    f"First registered parser ('{existing.platform}') takes priority.",
-                    stacklevel=2,
-                )
-                break  # Only warn once
+        Raises:
+            RuntimeError: If the registry is frozen.
 
+        """
+        if self.frozen:
+            msg = "Cannot register parsers on a frozen registry"
+            raise RuntimeError(msg)
+
+        # Index schemes (first registered wins) and check for overlap with
+        # existing parsers (ignore http/https since those are differentiated
+        # by hostname, not scheme)
+        overlapping: PlatformParser | None = None
+        for scheme in sorted(parser.schemes):
+            existing = self._scheme_index.get(scheme)
+            if existing is None:
+                self._scheme_index[scheme] = parser
+            elif overlapping is None and scheme not in _HOSTNAME_SCHEMES:
+                overlapping = existing
+
+        if overlapping is not None:
+            overlap = (parser.schemes & overlapping.schemes) - _HOSTNAME_SCHEMES
+            warnings.warn(
+                f"Parser '{parser.platform}' has overlapping schemes {overlap} "
+                f"with existing parser '{overlapping.platform}'. "
+                f"First registered parser ('{overlapping.platform}') takes "
+                "priority.",
+                stacklevel=2,
+            )
+
+        self._index_hostnames(parser, len(self._parsers))
         self._parsers.append(parser)
 
+    def _index_hostnames(self, parser: PlatformParser, priority: int) -> None:
+        """Add a parser's declared domains to the trie, or to the fallback."""
+        domains = getattr(parser, "domains", None)
+        if domains is None:
+            self._host_fallback.append((priority, parser))
+            return
+        for domain, policy in domains.items():
+            self._host_trie.add(domain, (priority, parser), policy, priority=priority)
+
+    def freeze(self) -> Registry:
+        """Return a frozen copy of this registry.
+
+        The copy shares the registered parsers and their scheme index,
+        rejects further registrations, and memoizes hostname lookups.
+
+        Returns:
+            Frozen registry with the same parsers.
+
+        """
+        frozen = Registry()
+        frozen._parsers = list(self._parsers)
+        frozen._scheme_index = dict(self._scheme_index)
+        for priority, parser in enumerate(frozen._parsers):
+            frozen._index_hostnames(parser, priority)
+        frozen._host_cache = {}
+        return frozen
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the registry is frozen."""
+        return self._host_cache is not None
+
     def get_parser_for_url(self, url: str) -> PlatformParser | None:
         """Find the parser that handles the given URL.
 
@@ -91,10 +160,7 @@ class Registry:
             Parser that handles the scheme, or None.
 
         """
-        for parser in self._parsers:
-            if scheme in parser.schemes:
-                return parser
-        return None
+        return self._scheme_index.get(scheme)
 
     def get_parser_for_hostname(self, hostname: str) -> PlatformParser | None:
         """Find the parser that handles the given hostname.
@@ -106,10 +172,27 @@ class Registry:
             Parser that handles the hostname, or None.
 
         """
-        for parser in self._parsers:
-            if parser.handles_hostname(hostname):
-                return parser
-        return None
+        if self._host_cache is not None:
+            try:
+                return self._host_cache[hostname]
+            except KeyError:
+                pass
+
+        routed = self._host_trie.get(hostname)
+        result = routed[1] if routed is not None else None
+        if self._host_fallback:
+            # Parsers without declared domains registered earlier take priority
+            priority = routed[0] if routed is not None else len(self._parsers)
+            for fallback_priority, parser in self._host_fallback:
+                if fallback_priority > priority:
+                    break
+                if parser.handles_hostname(hostname):
+                    result = parser
+                    break
+
+        if self._host_cache is not None and len(self._host_cache) < _HOST_CACHE_SIZE:
+            self._host_cache[hostname] = result
+        return result
 
     def parse(self, url: str) -> SocialsURL | None:
         """Parse a URL using the appropriate parser.
@@ -0,0 +1,506 @@
+"""Local HTTP server exposing an extractor to non-Python services.
+
+Built on the standard library (`http.server`), so it needs no extra
+dependencies. Endpoints:
+
+- `GET /parse?url=...` or `POST /parse` with `{"url": ...}`: parse one URL
+- `POST /batch` with a JSON array (or `{"urls": [...]}`): parse many URLs
+- `POST /batch` with `Content-Type: application/x-ndjson`: one URL per line
+  in, one outcome per line out
+- `GET /metrics`: request, URL and latency metrics in Prometheus text format
+- `GET /health`: liveness check
+
+Connections are kept alive (HTTP/1.1), requests are handled in threads that
+share one warm extractor and its cache, and `serve(workers=N)` forks worker
+processes that accept on the same socket.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import signal
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlsplit
+
+from socials.cache import LRUCache
+from socials.extractor import Extractor
+from socials.platforms.base import LazyParser
+
+if TYPE_CHECKING:
+    from socials.protocols import SocialsURL
+
+# Largest accepted request body
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+_JSON = "application/json"
+_NDJSON = "application/x-ndjson"
+_PROMETHEUS = "text/plain; version=0.0.4"
+
+# Upper bounds (seconds) of the request latency histogram buckets
+_LATENCY_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+_ENDPOINTS = frozenset({"/parse", "/batch", "/metrics", "/health"})
+
+
+class _RequestError(Exception):
+    """Client error that is answered with a JSON error response."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class Metrics:
+    """Thread-safe request metrics, rendered in Prometheus text format."""
+
+    def __init__(self) -> None:
+        """Initialize all counters at zero."""
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._requests: dict[tuple[str, int], int] = {}
+        self._buckets: dict[str, list[int]] = {}
+        self._seconds: dict[str, float] = {}
+        self._urls = 0
+        self._failures = 0
+
+    def observe(
+        self,
+        endpoint: str,
+        status: int,
+        seconds: float,
+        *,
+        urls: int = 0,
+        failures: int = 0,
+    ) -> None:
+        """Record a handled request.
+
+        Args:
+            endpoint: Request path (e.g. '/batch').
+            status: HTTP status code of the response.
+            seconds: Time spent handling the request.
+            urls: Number of URLs parsed.
+            failures: Number of URLs that were not recognized.
+
+        """
+        with self._lock:
+            key = (endpoint, status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            buckets = self._buckets.setdefault(endpoint, [0] * len(_LATENCY_BUCKETS))
+            for i, bound in enumerate(_LATENCY_BUCKETS):
+                if seconds <= bound:
+                    buckets[i] += 1
+            self._seconds[endpoint] = self._seconds.get(endpoint, 0.0) + seconds
+            self._urls += urls
+            self._failures += failures
+
+    def render(self, cache: object = None) -> str:
+        """Render the metrics in Prometheus text exposition format.
+
+        Args:
+            cache: Result cache; its `hits`/`misses` are included if present.
+
+        Returns:
+            Metrics text.
+
+        """
+        with self._lock:
+            lines = [
+                "# HELP socials_requests_total HTTP requests handled.",
+                "# TYPE socials_requests_total counter",
+            ]
+            lines.extend(
+                f'socials_requests_total{{endpoint="{endpoint}",status="{status}"}} '
+                f"{count}"
+                for (endpoint, status), count in sorted(self._requests.items())
+            )
+            lines += [
+                "# HELP socials_urls_total URLs parsed.",
+                "# TYPE socials_urls_total counter",
+                f"socials_urls_total {self._urls}",
+                "# HELP socials_url_failures_total URLs that were not recognized.",
+                "# TYPE socials_url_failures_total counter",
+                f"socials_url_failures_total {self._failures}",
+                "# HELP socials_request_duration_seconds Request latency.",
+                "# TYPE socials_request_duration_seconds histogram",
+            ]
+            name = "socials_request_duration_seconds"
+            for endpoint, buckets in sorted(self._buckets.items()):
+                count = sum(
+                    n for (path, _), n in self._requests.items() if path == endpoint
+                )
+                lines.extend(
+                    f'{name}_bucket{{endpoint="{endpoint}",le="{bound}"}} {n}'
+                    for bound, n in zip(_LATENCY_BUCKETS, buckets)
+                )
+                lines += [
+                    f'{name}_bucket{{endpoint="{endpoint}",le="+Inf"}} {count}',
+                    f'{name}_sum{{endpoint="{endpoint}"}} {self._seconds[endpoint]}',
+                    f'{name}_count{{endpoint="{endpoint}"}} {count}',
+                ]
+            uptime = time.monotonic() - self._started
+        hits = getattr(cache, "hits", None)
+        misses = getattr(cache, "misses", None)
+        if isinstance(hits, int) and isinstance(misses, int):
+            lines += [
+                "# TYPE socials_cache_hits_total counter",
+                f"socials_cache_hits_total {hits}",
+                "# TYPE socials_cache_misses_total counter",
+                f"socials_cache_misses_total {misses}",
+            ]
+        lines += [
+            "# TYPE socials_uptime_seconds gauge",
+            f"socials_uptime_seconds {uptime:.3f}",
+            "# TYPE socials_worker_pid gauge",
+            f"socials_worker_pid {os.getpid()}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def result_to_json(result: SocialsURL | None) -> dict[str, Any] | None:
+    """Convert a parsed result to JSON-compatible data.
+
+    Args:
+        result: Parsed URL object, or None.
+
+    Returns:
+        All fields of the result (`model_dump()` for Pydantic models), or
+        None.
+
+    """
+    if result is None:
+        return None
+    dump = getattr(result, "model_dump", None)
+    if dump is not None:
+        data: dict[str, Any] = dump()
+        return data
+    return {
+        "url": result.url,
+        "platform": result.platform,
+        "entity_type": result.entity_type,
+    }
+
+
+def warm(extractor: Extractor) -> None:
+    """Import every parser of an extractor ahead of the first request.
+
+    Args:
+        extractor: Extractor to warm up.
+
+    """
+    for parser in extractor.registry.parsers:
+        if isinstance(parser, LazyParser):
+            parser.load()
+
+
+class ExtractionServer(ThreadingHTTPServer):
+    """Threaded HTTP server sharing one extractor between requests."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        extractor: Extractor | None = None,
+        *,
+        bind_and_activate: bool = True,
+    ) -> None:
+        """Create the server.
+
+        Args:
+            address: Host and port to listen on (port 0 picks a free port).
+            extractor: Extractor to use; defaults to one with an `LRUCache`.
+            bind_and_activate: Whether to bind and listen immediately.
+
+        """
+        self.extractor = extractor or Extractor(cache=LRUCache())
+        self.metrics = Metrics()
+        warm(self.extractor)
+        super().__init__(address, _Handler, bind_and_activate=bind_and_activate)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler for `ExtractionServer`."""
+
+    # HTTP/1.1 keeps connections alive between requests
+    protocol_version = "HTTP/1.1"
+    server: ExtractionServer
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002, ANN401
+        """Silence per-request logging (see /metrics instead)."""
+
+    def do_GET(self) -> None:
+        """Handle GET requests."""
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        """Handle POST requests."""
+        self._handle("POST")
+
+    def _handle(self, method: str) -> None:
+        """Answer a request and record its metrics."""
+        started = time.perf_counter()
+        parts = urlsplit(self.path)
+        endpoint = parts.path if parts.path in _ENDPOINTS else "other"
+        self._body_read = False
+        try:
+            urls, failures = self._dispatch(method, endpoint, parts.query)
+            status = 200
+        except _RequestError as error:
+            urls = failures = 0
+            status = error.status
+            self._discard_body()
+            self._send_json(status, {"error": str(error)})
+        else:
+            self._discard_body()
+        self.server.metrics.observe(
+            endpoint,
+            status,
+            time.perf_counter() - started,
+            urls=urls,
+            failures=failures,
+        )
+
+    def _dispatch(self, method: str, endpoint: str, query: str) -> tuple[int, int]:
+        """Route a request; return the number of URLs parsed and failed."""
+        if endpoint == "/parse":
+            return 1, self._parse(self._single_url(method, query))
+        if endpoint == "/batch" and method == "POST":
+            return self._batch()
+        if endpoint == "/metrics" and method == "GET":
+            body = self.server.metrics.render(self.server.extractor.cache).encode()
+            self._send(200, body, _PROMETHEUS)
+            return 0, 0
+        if endpoint == "/health" and method == "GET":
+            self._send_json(200, {"status": "ok"})
+            return 0, 0
+        if endpoint == "other":
+            raise _RequestError(404, f"Not found: {urlsplit(self.path).path}")
+        raise _RequestError(405, f"Method {method} not allowed")
+
+    def _read_body(self) -> bytes:
+        """Read the request body.
+
+        If the body is rejected unread, the connection is closed after the
+        response, so the body isn't taken for the client's next request.
+        """
+        self._body_read = True
+        length = self.headers.get("Content-Length")
+        if length is None:
+            self.close_connection = True
+            raise _RequestError(411, "Content-Length required")
+        size = _content_length(length)
+        if size is None:
+            self.close_connection = True
+            raise _RequestError(400, "Invalid Content-Length")
+        if size > MAX_BODY_BYTES:
+            self.close_connection = True
+            raise _RequestError(413, f"Body larger than {MAX_BODY_BYTES} bytes")
+        return self.rfile.read(size)
+
+    def _discard_body(self) -> None:
+        """Drain a body the endpoint didn't read, so the connection stays usable.
+
+        Bodies that can't be delimited or are too large to drain close the
+        connection instead.
+        """
+        if self._body_read:
+            return
+        self._body_read = True
+        length = self.headers.get("Content-Length")
+        if length is None and "Transfer-Encoding" not in self.headers:
+            return
+        size = None if length is None else _content_length(length)
+        if size is None or size > MAX_BODY_BYTES:
+            self.close_connection = True
+        else:
+            self.rfile.read(size)
+
+    def _read_json(self) -> Any:  # noqa: ANN401
+        """Read and decode a JSON request body."""
+        try:
+            return json.loads(self._read_body())
+        except ValueError:
+            raise _RequestError(400, "Invalid JSON body") from None
+
+    def _single_url(self, method: str, query: str) -> str:
+        """Return the URL of a /parse request."""
+        if method == "GET":
+            values = parse_qs(query).get("url")
+            if not values:
+                raise _RequestError(400, "Missing 'url' query parameter")
+            return values[0]
+        data = self._read_json()
+        url = data.get("url") if isinstance(data, dict) else None
+        if not isinstance(url, str):
+            raise _RequestError(400, "Expected a JSON object with a 'url' string")
+        return url
+
+    def _parse(self, url: str) -> int:
+        """Answer a /parse request; return the number of failures."""
+        batch = self.server.extractor.parse_batch([url])
+        failures = batch.failures
+        self._send_json(
+            200,
+            {
+                "url": url,
+                "result": result_to_json(batch[0]),
+                "reason": failures[0].reason if failures else None,
+            },
+        )
+        return len(failures)
+
+    def _batch(self) -> tuple[int, int]:
+        """Answer a /batch request; return the URL and failure counts."""
+        content_type = self.headers.get("Content-Type", _JSON).split(";")[0].strip()
+        ndjson = content_type == _NDJSON
+        urls = self._ndjson_urls() if ndjson else self._json_urls()
+        batch = self.server.extractor.parse_batch(urls)
+        failures = batch.failures
+        if ndjson:
+            reasons = {failure.position: failure.reason for failure in failures}
+            lines = (
+                json.dumps(
+                    {
+                        "url": url,
+                        "result": result_to_json(result),
+                        "reason": reasons.get(position),
+                    },
+                )
+                for position, (url, result) in enumerate(zip(urls, batch))
+            )
+            body = "".join(f"{line}\n" for line in lines).encode()
+            self._send(200, body, _NDJSON)
+        else:
+            self._send_json(
+                200,
+                {
+                    "results": [result_to_json(result) for result in batch],
+                    "failures": [failure._asdict() for failure in failures],
+                },
+            )
+        return len(urls), len(failures)
+
+    def _json_urls(self) -> list[str]:
+        """Read the URLs of a JSON batch request."""
+        data = self._read_json()
+        if isinstance(data, dict):
+            data = data.get("urls")
+        if not isinstance(data, list) or not all(isinstance(u, str) for u in data):
+            raise _RequestError(
+                400,
+                "Expected a JSON array of URL strings or {'urls': [...]}",
+            )
+        return data
+
+    def _ndjson_urls(self) -> list[str]:
+        """Read the URLs of an NDJSON batch request (raw or JSON strings)."""
+        try:
+            text = self._read_body().decode()
+        except UnicodeDecodeError:
+            raise _RequestError(400, "NDJSON body is not valid UTF-8") from None
+        urls = []
+        for line in text.splitlines():
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if stripped.startswith('"'):
+                try:
+                    stripped = json.loads(stripped)
+                except ValueError:
+                    raise _RequestError(400, f"Invalid NDJSON line: {line}") from None
+            urls.append(stripped)
+        return urls
+
+    def _send_json(self, status: int, data: object) -> None:
+        """Send a JSON response."""
+        self._send(status, json.dumps(data).encode(), _JSON)
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        """Send a response with a body and keep the connection open if possible."""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _content_length(value: str) -> int | None:
+    """Parse a Content-Length header; return None if it is invalid."""
+    try:
+        size = int(value)
+    except ValueError:
+        return None
+    return size if size >= 0 else None
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    *,
+    workers: int = 1,
+    extractor: Extractor | None = None,
+) -> None:
+    """Run the server until interrupted.
+
+    With several workers, the socket is bound and the parsers are loaded
+    once, then worker processes are forked that accept connections on the
+    shared socket. Each worker has its own metrics, and its own cache unless
+    the extractor's cache is a `socials.cache.SharedMemoryCache`.
+
+    Args:
+        host: Interface to listen on.
+        port: Port to listen on.
+        workers: Number of worker processes.
+        extractor: Extractor to use; defaults to one with an `LRUCache`.
+
+    Raises:
+        ValueError: If workers is below 1.
+        RuntimeError: If several workers are requested on a platform
+            without `os.fork`.
+
+    """
+    if workers < 1:
+        msg = f"workers must be at least 1, got {workers}"
+        raise ValueError(msg)
+    if workers > 1 and not hasattr(os, "fork"):
+        msg = "Worker processes require os.fork, which is unavailable here"
+        raise RuntimeError(msg)
+
+    server = ExtractionServer((host, port), extractor)
+    if workers == 1:
+        with server, contextlib.suppress(KeyboardInterrupt):
+            server.serve_forever()
+    else:
+        _serve_workers(server, workers)
+
+
+def _serve_workers(server: ExtractionServer, workers: int) -> None:
+    """Fork worker processes serving the bound socket and wait for them."""
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the worker process
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            try:
+                server.serve_forever()
+            finally:
+                os._exit(0)
+        children.append(pid)
+    server.socket.close()
+    # Stop the workers on SIGTERM as well as on Ctrl-C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        for pid in children:
+            os.waitpid(pid, 0)
+    except KeyboardInterrupt:
+        for pid in children:
+            os.kill(pid, signal.SIGTERM)
+        for pid in children:
+            os.waitpid(pid, 0)
@@ -0,0 +1,210 @@
+"""Resolution of short links (`t.co`, `bit.ly`, ...) to the URLs they hide.
+
+Resolving a short link takes a network round trip, so socials doesn't do it
+itself: a `ShortLinkResolver` wraps a user-supplied async `ResolverBackend`
+(e.g. one following redirects with an HTTP client), resolves many links
+concurrently, and caches targets for a time-to-live. `Extractor(resolver=...)`
+collects the short links of a batch, resolves them in one go and parses the
+targets. `DictResolver` is a backend for tests and offline use.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from socials.protocols import ResolverBackend
+
+# Hosts of common URL shorteners
+SHORT_LINK_HOSTS = frozenset(
+    {
+        "bit.ly",
+        "buff.ly",
+        "fb.me",
+        "goo.gl",
+        "lnkd.in",
+        "ow.ly",
+        "t.co",
+        "tinyurl.com",
+        "youtu.be",
+    },
+)
+
+
+class DictResolver:
+    """Backend that resolves short links from a fixed mapping.
+
+    Implements the `ResolverBackend` protocol and records every lookup in
+    `calls`, so tests can check which links were resolved.
+    """
+
+    def __init__(self, targets: Mapping[str, str]) -> None:
+        """Initialize the resolver.
+
+        Args:
+            targets: Target URL by short link; other links resolve to None.
+
+        """
+        self.targets = dict(targets)
+        self.calls: list[str] = []
+
+    async def resolve(self, url: str, /) -> str | None:
+        """Return the target of a short link from the mapping."""
+        self.calls.append(url)
+        return self.targets.get(url)
+
+
+class ShortLinkResolver:
+    """Resolves short links concurrently and caches their targets.
+
+    Unresolvable links are cached as None for the same time-to-live. Links
+    whose backend call raises are not cached, so they are retried next time.
+    Expired entries are pruned as new ones are stored, so a long-running
+    process keeps at most the links of the last two time-to-lives. The
+    resolver is thread-safe.
+    """
+
+    def __init__(
+        self,
+        backend: ResolverBackend,
+        *,
+        ttl: float = 86400.0,
+        concurrency: int = 16,
+        hosts: Iterable[str] = SHORT_LINK_HOSTS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the resolver.
+
+        Args:
+            backend: Async backend that resolves one short link.
+            ttl: Seconds a resolved target is cached.
+            concurrency: Maximum number of backend calls in flight.
+            hosts: Hosts (lowercase) whose URLs are short links.
+            clock: Time source for the cache, in seconds.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+
+        """
+        if concurrency < 1:
+            msg = f"concurrency must be at least 1, got {concurrency}"
+            raise ValueError(msg)
+        self.backend = backend
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self.hosts = frozenset(hosts)
+        self._clock = clock
+        self._targets: dict[str, tuple[float, str | None]] = {}
+        self._prune_at = clock() + ttl
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return f"ShortLinkResolver({self.backend!r}, ttl={self.ttl}, size={len(self)})"
+
+    def __len__(self) -> int:
+        """Return the number of cached links, including expired ones."""
+        return len(self._targets)
+
+    def __contains__(self, url: object) -> bool:
+        """Check whether a link has a fresh cached target (or miss)."""
+        if not isinstance(url, str):
+            return False
+        with self._lock:
+            entry = self._targets.get(url)
+        return entry is not None and entry[0] > self._clock()
+
+    def get(self, url: str) -> str | None:
+        """Return the cached target of a short link.
+
+        Args:
+            url: Short link.
+
+        Returns:
+            The target, or None if the link is unresolvable, not cached or
+            its entry has expired. Never calls the backend.
+
+        """
+        with self._lock:
+            entry = self._targets.get(url)
+        if entry is None or entry[0] <= self._clock():
+            return None
+        return entry[1]
+
+    def _prune(self, now: float) -> None:
+        """Drop expired entries at most once per time-to-live.
+
+        The lock must be held. Scanning once per time-to-live keeps the cost
+        per stored link constant.
+        """
+        if now < self._prune_at:
+            return
+        self._prune_at = now + self.ttl
+        expired = [url for url, (expires, _) in self._targets.items() if expires <= now]
+        for url in expired:
+            del self._targets[url]
+
+    def clear(self) -> None:
+        """Drop all cached targets."""
+        with self._lock:
+            self._targets.clear()
+
+    async def aresolve(self, urls: Iterable[str]) -> dict[str, str | None]:
+        """Resolve short links, calling the backend for uncached ones only.
+
+        Args:
+            urls: Short links; duplicates are resolved once.
+
+        Returns:
+            Target (or None) for every link.
+
+        """
+        urls = list(dict.fromkeys(urls))
+        pending = [url for url in urls if url not in self]
+        if pending:
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def resolve(url: str) -> tuple[bool, str | None]:
+                async with semaphore:
+                    try:
+                        return True, await self.backend.resolve(url)
+                    except Exception:  # noqa: BLE001
+                        # Not cached, so the link is retried next time
+                        return False, None
+
+            outcomes = await asyncio.gather(*(resolve(url) for url in pending))
+            now = self._clock()
+            with self._lock:
+                self._prune(now)
+                for url, (resolved, target) in zip(pending, outcomes):
+                    if resolved:
+                        self._targets[url] = (now + self.ttl, target)
+        return {url: self.get(url) for url in urls}
+
+    def resolve(self, urls: Iterable[str]) -> dict[str, str | None]:
+        """Resolve short links from synchronous code.
+
+        Runs `aresolve()` in a new event loop, or on a helper thread if this
+        thread is already running one.
+
+        Args:
+            urls: Short links; duplicates are resolved once.
+
+        Returns:
+            Target (or None) for every link.
+
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aresolve(urls))
+        from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+        urls = list(urls)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, self.aresolve(urls)).result()
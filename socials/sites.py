@@ -0,0 +1,353 @@
+"""Aggregate social accounts per website.
+
+Feed `(source_url, href)` pairs, e.g. every link of every crawled page, into
+a `SiteAggregator`. It parses each href once, groups the results by the
+domain of the page that linked them, and keeps per-account counts so the
+likely official account of a site can be ranked per platform. Aggregation is
+streaming: memory grows with the number of distinct accounts per site, not
+with the number of links.
+"""
+
+from __future__ import annotations
+
+import re
+from itertools import groupby
+from operator import itemgetter
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from socials.extractor import Extraction, Extractor, _canonical_key
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Iterator
+
+    from socials.protocols import SocialsURL
+
+# Entity types that can be a site's own account
+ACCOUNT_TYPES = frozenset({"profile", "company", "channel"})
+
+# Fields holding the handle of an account, in order of preference
+_HANDLE_FIELDS = ("username", "company_id", "custom_url", "owner")
+
+# Host labels that never name a site
+_GENERIC_LABELS = frozenset({"www", "m", "blog", "shop", "com", "co", "org", "net"})
+_NON_ALNUM = re.compile(r"[^a-z0-9]")
+
+# Shortest domain label or handle that is matched against the other
+_MIN_LABEL_LENGTH = 3
+
+
+def site_domain(source_url: str) -> str:
+    """Return the domain a source page belongs to.
+
+    Args:
+        source_url: URL of the page a link was found on (the scheme may be
+            missing).
+
+    Returns:
+        Lowercased host without port and leading `www.`, or an empty string
+        if there is none.
+
+    """
+    source_url = source_url.strip()
+    if "://" not in source_url:
+        source_url = f"//{source_url}"
+    try:
+        hostname = urlsplit(source_url).hostname or ""
+    except ValueError:
+        return ""
+    return hostname.removeprefix("www.")
+
+
+def _handle(result: SocialsURL) -> str:
+    """Return the handle of an account, normalized for comparison."""
+    for name in _HANDLE_FIELDS:
+        value = getattr(result, name, None)
+        if isinstance(value, str) and value:
+            return _NON_ALNUM.sub("", value.lower())
+    return ""
+
+
+def _domain_labels(domain: str) -> list[str]:
+    """Return the labels of a domain that may name the site."""
+    labels = domain.split(".")[:-1]  # without the top-level domain
+    return [
+        _NON_ALNUM.sub("", label)
+        for label in labels
+        if label not in _GENERIC_LABELS and len(label) >= _MIN_LABEL_LENGTH
+    ]
+
+
+class SiteAccount:
+    """An account linked from a site, with how it was linked."""
+
+    __slots__ = ("_last_source", "count", "first_seen", "pages", "result")
+
+    def __init__(self, result: SocialsURL, source_url: str, position: int) -> None:
+        """Record the first link to an account.
+
+        Args:
+            result: Parsed URL of the first link.
+            source_url: Page the link was found on.
+            position: Index of the link among all links of the site.
+
+        """
+        self.result = result
+        self.count = 1
+        self.pages = 1
+        self.first_seen = position
+        self._last_source = source_url
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return (
+            f"SiteAccount({self.result.url!r}, count={self.count}, "
+            f"pages={self.pages}, first_seen={self.first_seen})"
+        )
+
+    def _add(self, source_url: str) -> None:
+        """Count another link to the account."""
+        self.count += 1
+        if source_url != self._last_source:
+            self.pages += 1
+            self._last_source = source_url
+
+
+class Site:
+    """Accounts linked from the pages of one domain."""
+
+    def __init__(self, domain: str) -> None:
+        """Initialize an empty site.
+
+        Args:
+            domain: Domain of the site (see `site_domain()`).
+
+        """
+        self.domain = domain
+        self.links = 0
+        self._accounts: dict[Hashable, SiteAccount] = {}
+        self._labels = _domain_labels(domain)
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return (
+            f"Site({self.domain!r}, links={self.links}, accounts={len(self._accounts)})"
+        )
+
+    def _add(self, result: SocialsURL | None, source_url: str) -> None:
+        """Count a link of the site and its parsed result, if any."""
+        position = self.links
+        self.links += 1
+        if result is None:
+            return
+        key = _canonical_key(result)
+        account = self._accounts.get(key)
+        if account is None:
+            self._accounts[key] = SiteAccount(result, source_url, position)
+        else:
+            account._add(source_url)  # noqa: SLF001
+
+    def accounts(self) -> list[SiteAccount]:
+        """Return all distinct accounts, in order of first appearance.
+
+        Returns:
+            Accounts with their link counts and first-seen positions.
+
+        """
+        return list(self._accounts.values())
+
+    def by_platform(self) -> dict[str, list[SiteAccount]]:
+        """Group the accounts by platform.
+
+        Returns:
+            Dictionary mapping platform names to accounts, in order of first
+            appearance.
+
+        """
+        grouped: dict[str, list[SiteAccount]] = {}
+        for account in self._accounts.values():
+            grouped.setdefault(account.result.platform, []).append(account)
+        return grouped
+
+    def _rank_key(self, account: SiteAccount) -> tuple[bool, int, int, int]:
+        """Sort key for ranking accounts, most likely official first."""
+        handle = _handle(account.result)
+        # A handle contains the site name, or is a long enough part of it
+        matches_domain = any(
+            label in handle or (len(handle) >= _MIN_LABEL_LENGTH and handle in label)
+            for label in self._labels
+        )
+        return (not matches_domain, -account.pages, -account.count, account.first_seen)
+
+    def ranked(self, platform: str) -> list[SiteAccount]:
+        """Rank a platform's accounts by how likely they are the site's own.
+
+        Accounts whose handle matches the domain name come first, then those
+        linked from more pages, then more often, then earlier.
+
+        Args:
+            platform: Platform name.
+
+        Returns:
+            Accounts of an account entity type (profile, company, channel),
+            most likely official first.
+
+        """
+        candidates = [
+            account
+            for account in self._accounts.values()
+            if account.result.platform == platform
+            and account.result.entity_type in ACCOUNT_TYPES
+        ]
+        return sorted(candidates, key=self._rank_key)
+
+    def official(self) -> dict[str, SocialsURL]:
+        """Return the most likely official account per platform.
+
+        Returns:
+            Dictionary mapping platform names to the top-ranked account.
+
+        """
+        official: dict[str, SocialsURL] = {}
+        for platform in self.by_platform():
+            ranked = self.ranked(platform)
+            if ranked:
+                official[platform] = ranked[0].result
+        return official
+
+    def extraction(self) -> Extraction:
+        """Return the distinct accounts as an Extraction.
+
+        Returns:
+            Extraction with one result per account, in order of first
+            appearance.
+
+        """
+        return Extraction(account.result for account in self._accounts.values())
+
+
+class SiteAggregator:
+    """Streaming aggregation of linked accounts per source domain."""
+
+    def __init__(self, extractor: Extractor | None = None) -> None:
+        """Initialize an empty aggregator.
+
+        Args:
+            extractor: Extractor used to parse hrefs; defaults to a new
+                `Extractor()`. Pass one with a cache for crawl-scale input.
+
+        """
+        self._extractor = extractor or Extractor()
+        self._sites: dict[str, Site] = {}
+
+    def __len__(self) -> int:
+        """Return the number of sites."""
+        return len(self._sites)
+
+    def __iter__(self) -> Iterator[Site]:
+        """Iterate over the sites in order of first appearance."""
+        return iter(self._sites.values())
+
+    def __getitem__(self, domain: str) -> Site:
+        """Return the site of a domain."""
+        return self._sites[domain]
+
+    def add(self, source_url: str, href: str) -> SocialsURL | None:
+        """Add a link found on a page.
+
+        Links from one page are expected to arrive together; `pages` counts
+        runs of consecutive links from the same source URL.
+
+        Args:
+            source_url: URL of the page the link was found on.
+            href: The link target.
+
+        Returns:
+            Parsed result for the href, or None if it was not recognized.
+
+        """
+        return self.add_page(source_url, [href])[0]
+
+    def add_page(
+        self,
+        source_url: str,
+        hrefs: Iterable[str],
+    ) -> list[SocialsURL | None]:
+        """Add the links found on one page.
+
+        The hrefs are parsed as one batch (see `Extractor.parse_batch()`),
+        so short links are resolved together and a strict extractor doesn't
+        raise part-way through the page.
+
+        Args:
+            source_url: URL of the page the links were found on.
+            hrefs: The link targets, in page order.
+
+        Returns:
+            Parsed result (or None) for each href.
+
+        """
+        domain = site_domain(source_url)
+        site = self._sites.get(domain)
+        if site is None:
+            site = self._sites[domain] = Site(domain)
+        results = self._extractor.parse_batch(hrefs).results
+        for result in results:
+            site._add(result, source_url)  # noqa: SLF001
+        return results
+
+    def add_pairs(self, pairs: Iterable[tuple[str, str]]) -> None:
+        """Add many `(source_url, href)` pairs.
+
+        Consecutive pairs from the same source URL are added as one page.
+
+        Args:
+            pairs: Pairs of source page URL and link target.
+
+        """
+        for source_url, page in groupby(pairs, key=itemgetter(0)):
+            self.add_page(source_url, [href for _, href in page])
+
+    def sites(self) -> dict[str, Site]:
+        """Return all sites by domain.
+
+        Returns:
+            Dictionary mapping domains to sites, in order of first appearance.
+
+        """
+        return dict(self._sites)
+
+    def official(self) -> dict[str, dict[str, SocialsURL]]:
+        """Return the most likely official account per platform of each site.
+
+        Returns:
+            Dictionary mapping domains to `Site.official()`.
+
+        """
+        return {domain: site.official() for domain, site in self._sites.items()}
+
+
+def aggregate_sites(
+    pairs: Iterable[tuple[str, str]],
+    *,
+    extractor: Extractor | None = None,
+) -> SiteAggregator:
+    """Aggregate `(source_url, href)` pairs per source domain.
+
+    Args:
+        pairs: Pairs of source page URL and link target.
+        extractor: Extractor used to parse hrefs.
+
+    Returns:
+        SiteAggregator holding the sites, which can be fed more pairs.
+
+    Examples:
+        ```python
+        sites = aggregate_sites([("https://karllorey.com", "https://github.com/lorey")])
+        sites["karllorey.com"].official()  # {"github": GitHubProfileURL(...)}
+        ```
+
+    """
+    aggregator = SiteAggregator(extractor)
+    aggregator.add_pairs(pairs)
+    return aggregator
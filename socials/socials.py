@@ -13,13 +13,17 @@ The old regex-based API is preserved here for backwards compatibility.
 
 from __future__ import annotations
 
-import re
 import warnings
+from functools import cache
 from typing import TYPE_CHECKING
 
+from socials.platforms.base import lazy_compile
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from socials.platforms.base import LazyPattern
+
 # Platform constants (kept for backwards compatibility)
 PLATFORM_FACEBOOK = "facebook"
 PLATFORM_GITHUB = "github"
@@ -143,11 +147,17 @@ def get_platform(href: str) -> str | None:
     return None
 
 
+@cache
+def _compile(pattern: str) -> LazyPattern:
+    """Return a legacy pattern compiled through the active regex backend."""
+    return lazy_compile(pattern)
+
+
 def is_platform(href: str, platform: str) -> bool:
     """Check if URL belongs to a platform (legacy function)."""
     if platform not in PATTERNS:
         raise RuntimeError(ERROR_MSG_UNKNOWN_PLATFORM)
-    return any(re.match(p, href) for p in PATTERNS[platform])
+    return any(_compile(p).match(href) for p in PATTERNS[platform])
 
 
 def clean_mailto(href: str) -> str:
@@ -0,0 +1,244 @@
+"""Vectorized parsing of pandas Series and NumPy string arrays.
+
+Requires the optional `pandas` extra (`pip install socials[pandas]`). Inputs
+are factorized first, so every distinct URL is parsed once, and URLs whose
+scheme or hostname no parser handles (and that are not redirect wrappers or
+short links the extractor follows) are filtered out before parsing. The
+results are returned as columns aligned with the input.
+"""
+
+from __future__ import annotations
+
+import re
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from socials.platforms.base import extract_hostname
+from socials.redirects import REDIRECT_WRAPPERS
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+    import numpy as np
+    import pandas as pd
+
+    from socials.extractor import Extractor
+    from socials.protocols import SocialsURL
+
+# Scheme and authority of a URL (no authority for mailto:, tel:, ...)
+_SCHEME_REGEX = re.compile(r"^([A-Za-z][A-Za-z0-9+.-]*):(?://([^/?#]*))?")
+
+# Fields that are returned as dedicated columns or not at all
+_BASE_FIELDS = ("url", "platform", "entity_type", "normalized_url")
+
+
+def _require(module: str) -> Any:  # noqa: ANN401
+    """Import an optional dependency or explain how to install it."""
+    try:
+        return import_module(module)
+    except ImportError:
+        msg = (
+            f"Vectorized parsing requires {module}, "
+            "install it with: pip install 'socials[pandas]'"
+        )
+        raise ImportError(msg) from None
+
+
+def _factorize(values: Iterable[Any]) -> tuple[np.ndarray, list[Any]]:
+    """Map values to integer codes (-1 for missing) and the distinct values."""
+    numpy = _require("numpy")
+    try:
+        pandas = import_module("pandas")
+    except ImportError:
+        pandas = None
+
+    if pandas is not None:
+        codes, uniques = pandas.factorize(numpy.asarray(values, dtype=object))
+        return codes, list(uniques)
+
+    index: dict[str, int] = {}
+    codes = numpy.fromiter(
+        (
+            index.setdefault(value, len(index)) if isinstance(value, str) else -1
+            for value in values
+        ),
+        dtype=numpy.intp,
+    )
+    return codes, list(index)
+
+
+def _parse_uniques(values: list[Any], extractor: Extractor) -> list[SocialsURL | None]:
+    """Parse distinct values, skipping those no parser can route.
+
+    Redirect wrappers (with `unwrap_redirects`) and short links (with a
+    resolver) are kept, as the extractor parses their targets. The kept
+    values are parsed as one batch, so their short links are resolved
+    together.
+    """
+    registry = extractor.registry
+    redirect_hosts: Collection[str] = (
+        REDIRECT_WRAPPERS if extractor.unwrap_redirects else ()
+    )
+    resolver = extractor.resolver
+    short_link_hosts: Collection[str] = resolver.hosts if resolver is not None else ()
+    routable: dict[str, bool] = {}
+    positions: list[int] = []
+    for position, value in enumerate(values):
+        if not isinstance(value, str):
+            continue
+        match = _SCHEME_REGEX.match(value)
+        # Schemeless input (e.g. raw email) is left to the registry
+        key = f"{match.group(1)}:{match.group(2)}".lower() if match is not None else ""
+        if key not in routable:
+            host = extract_hostname(value) if match is not None else ""
+            routable[key] = (
+                match is None
+                or host in redirect_hosts
+                or host in short_link_hosts
+                or registry.get_parser_for_url(value) is not None
+            )
+        if routable[key]:
+            positions.append(position)
+
+    results: list[SocialsURL | None] = [None] * len(values)
+    batch = extractor.parse_batch(values[position] for position in positions)
+    for position, result in zip(positions, batch):
+        results[position] = result
+    return results
+
+
+def _identifier_fields(result: SocialsURL) -> Iterable[str]:
+    """Return the identifier field names of a result."""
+    names = getattr(type(result), "model_fields", None) or vars(result)
+    return (name for name in names if name not in _BASE_FIELDS)
+
+
+def _unique_columns(
+    results: list[SocialsURL | None],
+    *,
+    normalized: bool = False,
+) -> dict[str, list[Any]]:
+    """Build columns (one entry per distinct input) from parsed results."""
+    columns: dict[str, list[Any]] = {"platform": [], "entity_type": []}
+    if normalized:
+        columns["normalized_url"] = [
+            getattr(result, "normalized_url", None) for result in results
+        ]
+    size = len(results)
+    for i, result in enumerate(results):
+        if result is None:
+            columns["platform"].append(None)
+            columns["entity_type"].append(None)
+            continue
+        columns["platform"].append(result.platform)
+        columns["entity_type"].append(result.entity_type)
+        for name in _identifier_fields(result):
+            if name not in columns:
+                columns[name] = [None] * size
+            columns[name][i] = getattr(result, name)
+    return columns
+
+
+def _take(column: list[Any], codes: np.ndarray) -> np.ndarray:
+    """Expand a per-distinct-value column to the input (None where missing)."""
+    numpy = _require("numpy")
+    values = numpy.empty(len(column) + 1, dtype=object)
+    values[:-1] = column
+    values[-1] = None  # code -1 (missing input) selects the last entry
+    expanded: np.ndarray = values[codes]
+    return expanded
+
+
+def _default_extractor(extractor: Extractor | None) -> Extractor:
+    """Return the given extractor or the module-level default."""
+    if extractor is not None:
+        return extractor
+    import socials  # noqa: PLC0415
+
+    return socials._get_default_extractor()  # noqa: SLF001
+
+
+def parse_array(
+    values: Iterable[Any],
+    *,
+    extractor: Extractor | None = None,
+) -> dict[str, np.ndarray]:
+    """Parse an array of URLs into columns.
+
+    Args:
+        values: URLs as a NumPy array or any iterable. Non-strings (e.g. None
+            or NaN) count as unrecognized.
+        extractor: Extractor to use; defaults to the module-level one.
+
+    Returns:
+        Dictionary of object arrays aligned with the input: `platform`,
+        `entity_type` and one column per identifier field (e.g. `username`,
+        `owner`, `repo`), plus `normalized_url` if the extractor normalizes.
+        Unrecognized inputs are None in every column.
+
+    Examples:
+        ```python
+        columns = socials.parse_array(urls)
+        columns["platform"]  # array(["github", None, ...], dtype=object)
+        ```
+
+    """
+    extractor = _default_extractor(extractor)
+    codes, uniques = _factorize(values)
+    columns = _unique_columns(
+        _parse_uniques(uniques, extractor),
+        normalized=extractor.normalize,
+    )
+    return {name: _take(column, codes) for name, column in columns.items()}
+
+
+def parse_series(
+    series: pd.Series,
+    *,
+    extractor: Extractor | None = None,
+) -> pd.DataFrame:
+    """Parse a Series of URLs into a DataFrame.
+
+    Args:
+        series: URLs; missing values count as unrecognized.
+        extractor: Extractor to use; defaults to the module-level one.
+
+    Returns:
+        DataFrame with the same index as the input: categorical `platform`
+        and `entity_type` columns and one object column per identifier field,
+        plus `normalized_url` if the extractor normalizes. Unrecognized
+        inputs are missing in every column.
+
+    Examples:
+        ```python
+        df = socials.parse_series(frame["href"])
+        df["platform"].value_counts()
+        ```
+
+    """
+    pandas = _require("pandas")
+    numpy = _require("numpy")
+
+    extractor = _default_extractor(extractor)
+    codes, uniques = _factorize(series.to_numpy(dtype=object))
+    columns = _unique_columns(
+        _parse_uniques(uniques, extractor),
+        normalized=extractor.normalize,
+    )
+
+    data: dict[str, Any] = {}
+    for name, column in columns.items():
+        if name in ("platform", "entity_type"):
+            # Categorical from codes, so rows are never hashed again
+            categories = sorted({value for value in column if value is not None})
+            lookup = {value: code for code, value in enumerate(categories)}
+            unique_codes = numpy.fromiter(
+                (lookup.get(value, -1) for value in column),
+                dtype=numpy.int32,
+                count=len(column),
+            )
+            row_codes = numpy.append(unique_codes, -1)[codes]
+            data[name] = pandas.Categorical.from_codes(row_codes, categories=categories)
+        else:
+            data[name] = _take(column, codes)
+    return pandas.DataFrame(data, index=series.index)
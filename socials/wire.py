@@ -0,0 +1,258 @@
+"""Compact wire format for moving results between processes.
+
+Results are encoded as tuples of a type code followed by the identifying
+field values, e.g. `(2, "https://github.com/lorey/socials", "lorey", "socials")`
+for a `GitHubRepoURL`, and serialized with `marshal`. Compared to pickling
+Pydantic models this is several times smaller and faster.
+
+Decoding skips validation, so only decode data produced by `dumps()`. Like
+`marshal` and `pickle`, the format is not meant for untrusted input.
+"""
+
+from __future__ import annotations
+
+import marshal
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from socials.extractor import Extraction
+    from socials.protocols import SocialsURL
+
+# Bumped whenever the layout of an encoded result changes
+WIRE_VERSION = 2
+
+# Marshal format version (stable across the supported Python versions)
+_MARSHAL_VERSION = 4
+
+# Type codes of the built-in URL types; codes below 128 are reserved
+_BUILTIN_TYPES: dict[int, str] = {
+    1: "socials.platforms.github:GitHubProfileURL",
+    2: "socials.platforms.github:GitHubRepoURL",
+    3: "socials.platforms.twitter:TwitterProfileURL",
+    4: "socials.platforms.linkedin:LinkedInProfileURL",
+    5: "socials.platforms.linkedin:LinkedInCompanyURL",
+    6: "socials.platforms.facebook:FacebookProfileURL",
+    7: "socials.platforms.instagram:InstagramProfileURL",
+    8: "socials.platforms.youtube:YouTubeChannelURL",
+    9: "socials.platforms.misc:EmailURL",
+    10: "socials.platforms.misc:PhoneURL",
+}
+_MIN_PLUGIN_CODE = 128
+
+# Constant fields that are implied by the type code
+_IMPLIED_FIELDS = frozenset({"platform", "entity_type"})
+
+_types_by_code: dict[int, type[BaseModel]] = {}
+_codes_by_type: dict[type, int] = {}
+_fields_by_type: dict[type, tuple[str, ...]] = {}
+# Per type: all fields with their defaults, in declaration order
+_templates_by_type: dict[type, dict[str, Any]] = {}
+
+_new = object.__new__
+_setattr = object.__setattr__
+_codes_by_target = {target: code for code, target in _BUILTIN_TYPES.items()}
+
+
+def register_type(code: int, cls: type[BaseModel]) -> None:
+    """Register a URL type so it can be encoded.
+
+    Built-in types are registered automatically. Plugins register their own
+    types with a code of 128 or higher; the code must be the same in every
+    process that exchanges data.
+
+    Args:
+        code: Type code used on the wire.
+        cls: Pydantic URL model class.
+
+    Raises:
+        ValueError: If the code is reserved or already taken by another type.
+
+    """
+    if code < _MIN_PLUGIN_CODE:
+        msg = f"Type codes below {_MIN_PLUGIN_CODE} are reserved, got {code}"
+        raise ValueError(msg)
+    existing = _types_by_code.get(code)
+    if existing is not None and existing is not cls:
+        msg = f"Type code {code} is already used by {existing.__name__}"
+        raise ValueError(msg)
+    _add_type(code, cls)
+
+
+def _add_type(code: int, cls: type[BaseModel]) -> None:
+    """Add a type to the lookup tables."""
+    _types_by_code[code] = cls
+    _codes_by_type[cls] = code
+    _fields_by_type[cls] = tuple(
+        name for name in cls.model_fields if name not in _IMPLIED_FIELDS
+    )
+    _templates_by_type[cls] = {
+        name: field.default for name, field in cls.model_fields.items()
+    }
+
+
+def _type_for_code(code: int) -> type[BaseModel]:
+    """Return the URL type for a code, importing built-in types on demand."""
+    try:
+        return _types_by_code[code]
+    except KeyError:
+        pass
+    try:
+        target = _BUILTIN_TYPES[code]
+    except KeyError:
+        msg = f"Unknown wire type code: {code}"
+        raise ValueError(msg) from None
+    module_name, _, class_name = target.partition(":")
+    cls: type[BaseModel] = getattr(import_module(module_name), class_name)
+    _add_type(code, cls)
+    return cls
+
+
+def _code_for_type(cls: type[BaseModel]) -> int:
+    """Return the code for a URL type."""
+    try:
+        return _codes_by_type[cls]
+    except KeyError:
+        pass
+    code = _codes_by_target.get(f"{cls.__module__}:{cls.__qualname__}")
+    if code is None:
+        msg = f"No wire type code registered for {cls.__name__}"
+        raise ValueError(msg)
+    _add_type(code, cls)
+    return code
+
+
+def fields(cls: type[BaseModel]) -> tuple[str, ...]:
+    """Return the encoded field names of a URL type, in wire order.
+
+    Args:
+        cls: URL model class.
+
+    Returns:
+        Field names excluding `platform` and `entity_type`, which are implied
+        by the type.
+
+    """
+    _code_for_type(cls)
+    return _fields_by_type[cls]
+
+
+def to_tuple(result: SocialsURL) -> tuple[Any, ...]:
+    """Encode a result as a tuple of its type code and field values.
+
+    Args:
+        result: Parsed URL object.
+
+    Returns:
+        Tuple usable with any transport that handles tuples of strings
+        (e.g. msgpack or JSON arrays).
+
+    Raises:
+        ValueError: If the result type has no registered code.
+
+    """
+    cls: type[BaseModel] = type(result)  # type: ignore[assignment]
+    code = _code_for_type(cls)
+    values = result.__dict__
+    return (code, *(values[name] for name in _fields_by_type[cls]))
+
+
+def from_tuple(row: tuple[Any, ...] | list[Any]) -> SocialsURL:
+    """Decode a tuple produced by `to_tuple()`.
+
+    Args:
+        row: Type code followed by field values.
+
+    Returns:
+        Parsed URL object.
+
+    Raises:
+        ValueError: If the type code is unknown.
+
+    """
+    cls = _type_for_code(row[0])
+    names = _fields_by_type[cls]
+    values = dict(_templates_by_type[cls])
+    values.update(zip(names, row[1:]))
+    # Restore the instance state directly, like unpickling does, but without
+    # going through validation or __setstate__
+    result = _new(cls)
+    _setattr(result, "__dict__", values)
+    _setattr(result, "__pydantic_fields_set__", set(names))
+    _setattr(result, "__pydantic_extra__", None)
+    _setattr(result, "__pydantic_private__", None)
+    return cast("SocialsURL", result)
+
+
+def dumps(result: SocialsURL) -> bytes:
+    """Serialize a single result.
+
+    Args:
+        result: Parsed URL object.
+
+    Returns:
+        Encoded bytes.
+
+    """
+    return marshal.dumps((WIRE_VERSION, to_tuple(result)), _MARSHAL_VERSION)
+
+
+def loads(data: bytes) -> SocialsURL:
+    """Deserialize a single result produced by `dumps()`.
+
+    Args:
+        data: Encoded bytes.
+
+    Returns:
+        Parsed URL object.
+
+    Raises:
+        ValueError: If the data was written with another wire version.
+
+    """
+    version, row = marshal.loads(data)  # noqa: S302
+    _check_version(version)
+    return from_tuple(row)
+
+
+def dumps_extraction(extraction: Extraction) -> bytes:
+    """Serialize all results of an extraction.
+
+    Args:
+        extraction: Extraction to serialize.
+
+    Returns:
+        Encoded bytes.
+
+    """
+    rows = tuple(to_tuple(result) for result in extraction.all())
+    return marshal.dumps((WIRE_VERSION, rows), _MARSHAL_VERSION)
+
+
+def loads_extraction(data: bytes) -> Extraction:
+    """Deserialize an extraction produced by `dumps_extraction()`.
+
+    Args:
+        data: Encoded bytes.
+
+    Returns:
+        Extraction with the decoded results.
+
+    Raises:
+        ValueError: If the data was written with another wire version.
+
+    """
+    from socials.extractor import Extraction  # noqa: PLC0415
+
+    version, rows = marshal.loads(data)  # noqa: S302
+    _check_version(version)
+    return Extraction([from_tuple(row) for row in rows])
+
+
+def _check_version(version: int) -> None:
+    """Raise if data was written with an incompatible wire version."""
+    if version != WIRE_VERSION:
+        msg = f"Unsupported wire version {version}, expected {WIRE_VERSION}"
+        raise ValueError(msg)
@@ -22,6 +22,8 @@ class TestFacebookParser:
             "fb.com",
             "www.fb.com",
             "m.facebook.com",
+            "de-de.facebook.com",
+            "web.facebook.com",
         ],
     )
     def test_handles_valid_hostname(self, parser, hostname):
@@ -33,6 +35,8 @@ class TestFacebookParser:
             "facbook.com",
             "facebook.co",
             "facebookcom",
+            "m.fb.com",
+            "notfacebook.com",
         ],
     )
     def test_rejects_invalid_hostname(self, parser, hostname):
@@ -48,6 +52,10 @@ class TestFacebookParser:
             ("https://facebook.com/peterparker", "peterparker"),
             ("https://www.facebook.com/peterparker", "peterparker"),
             ("https://fb.com/peterparker", "peterparker"),
+            ("https://m.facebook.com/peterparker", "peterparker"),
+            ("https://de-de.facebook.com/peterparker", "peterparker"),
+            ("https://web.facebook.com/peterparker", "peterparker"),
+            ("https://mbasic.facebook.com/peterparker", "peterparker"),
             ("https://facebook.com/some.page", "some.page"),
             ("https://facebook.com/Some_Page", "Some_Page"),
         ],
@@ -68,6 +76,7 @@ class TestFacebookParser:
         [
             ("https://www.facebook.com/profile.php?id=4", "4"),
             ("https://facebook.com/profile.php?id=123456789", "123456789"),
+            ("https://m.facebook.com/profile.php?id=4", "4"),
         ],
     )
     def test_parse_profile_id(self, parser, url, user_id):
@@ -109,6 +118,21 @@ class TestFacebookParser:
     def test_rejects_invalid_urls(self, parser, url):
         assert parser.parse(url) is None
 
+    # Subdomains that are routed here but don't serve profiles
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://developers.facebook.com/docs",
+            "https://business.facebook.com/overview",
+            "https://l.facebook.com/foo",
+            "https://developers.facebook.com/123",
+            "https://a.b.facebook.com/peterparker",
+        ],
+    )
+    def test_rejects_non_profile_subdomains(self, parser, url):
+        assert parser.parse(url) is None
+
 
 class TestFacebookProfileURL:
     """Tests for FacebookProfileURL."""
@@ -145,6 +169,7 @@ class TestFacebookProfileURL:
             "entity_type": "profile",
             "username": "peterparker",
             "user_id": None,
+            "normalized_url": None,
         }
 
     def test_model_dump_id(self, profile_id):
@@ -155,4 +180,5 @@ class TestFacebookProfileURL:
             "entity_type": "profile",
             "username": None,
             "user_id": "123",
+            "normalized_url": None,
         }
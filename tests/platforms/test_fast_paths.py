@@ -0,0 +1,78 @@
+"""Tests that parser fast paths agree with the patterns they shortcut."""
+
+import pytest
+
+from socials.platforms.base import fast_path, trace_patterns
+from socials.platforms.github import GitHubParser
+from socials.platforms.linkedin import LinkedInParser
+from socials.platforms.twitter import TwitterParser
+
+URLS = {
+    GitHubParser: [
+        "https://github.com/lorey",
+        "http://www.github.com/lorey/",
+        "https://github.com/lorey/socials",
+        "https://github.com/lorey/socials.py/",
+        "https://github.com/lorey/socials/issues",
+        "https://github.com/lorey//",
+        "https://github.com/settings",
+        "https://github.com/newton",
+        "https://github.com/lo.rey",
+        "https://github.com/lorey?tab=repositories",
+        "https://github.com/",
+        "https://gist.github.com/lorey",
+        "HTTPS://github.com/lorey",
+    ],
+    TwitterParser: [
+        "https://twitter.com/karllorey",
+        "https://mobile.x.com/karllorey/",
+        "https://x.com/@karllorey",
+        "https://twitter.com/home",
+        "https://twitter.com/ivan",
+        "https://twitter.com/abcdefghijklmnop",
+        "https://twitter.com/karl-lorey",
+        "https://twitter.com/karllorey/status/1",
+    ],
+    LinkedInParser: [
+        "https://www.linkedin.com/in/karllorey",
+        "https://linkedin.com/in/karl-lorey/",
+        "https://de.linkedin.com/in/karllorey",
+        "https://www.linkedin.com/in/jürgen",
+        "https://www.linkedin.com/company/acme",
+        "https://www.linkedin.com/school/mit/",
+        "https://www.linkedin.com/pub/karl/1/2/3",
+        "https://www.linkedin.com/in/",
+        "https://www.linkedin.com/in/karl/detail",
+        "https://www.linkedin.com/feed",
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    ("parser_class", "url"),
+    [(parser_class, url) for parser_class, urls in URLS.items() for url in urls],
+)
+def test_fast_path_matches_patterns(parser_class, url):
+    parser = parser_class()
+    fast = parser.parse(url)
+    with trace_patterns():  # disables fast paths
+        slow = parser.parse(url)
+    assert type(fast) is type(slow)
+    assert fast == slow
+    if fast is not None:
+        assert fast.model_dump() == slow.model_dump()
+        assert fast.model_fields_set == slow.model_fields_set
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://github.com/lorey/", "lorey"),
+        ("http://github.com/a/b", "a/b"),
+        ("https://github.com", None),
+        ("https://example.com/lorey", None),
+        ("ftp://github.com/lorey", None),
+    ],
+)
+def test_fast_path(url, expected):
+    assert fast_path(url, frozenset({"github.com"})) == expected
@@ -138,6 +138,7 @@ class TestGitHubProfileURL:
             "platform": "github",
             "entity_type": "profile",
             "username": "lorey",
+            "normalized_url": None,
         }
 
 
@@ -168,6 +169,25 @@ class TestGitHubRepoURL:
         assert len(ancestors) == 1
         assert isinstance(ancestors[0], GitHubProfileURL)
 
+    def test_hierarchy_is_cached(self, repo):
+        parent = repo.get_parent()
+        assert repo.get_parent() is parent
+        assert repo.get_root() is parent
+        assert repo.get_ancestors()[0] is parent
+
+    def test_parent_equals_validated_profile(self, repo):
+        expected = GitHubProfileURL(url="https://github.com/lorey", username="lorey")
+        assert repo.get_parent() == expected
+
+    def test_cached_parent_keeps_equality_and_dump(self, repo):
+        repo.get_parent()
+        assert repo == GitHubRepoURL(
+            url="https://github.com/lorey/socials",
+            owner="lorey",
+            repo="socials",
+        )
+        assert "_parent" not in repo.model_dump()
+
     def test_hashable(self, repo):
         assert hash(repo) == hash(repo.url)
         s = {repo}
@@ -181,4 +201,5 @@ class TestGitHubRepoURL:
             "entity_type": "repo",
             "owner": "lorey",
             "repo": "socials",
+            "normalized_url": None,
         }
@@ -119,4 +119,5 @@ class TestInstagramProfileURL:
             "platform": "instagram",
             "entity_type": "profile",
             "username": "instagram",
+            "normalized_url": None,
         }
@@ -26,6 +26,7 @@ class TestLinkedInParser:
             "de.linkedin.com",
             "uk.linkedin.com",
             "fr.linkedin.com",
+            "de.m.linkedin.com",
         ],
     )
     def test_handles_valid_hostname(self, parser, hostname):
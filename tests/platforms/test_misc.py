@@ -85,6 +85,7 @@ class TestEmailURL:
             "platform": "email",
             "entity_type": "email",
             "email": "test@example.com",
+            "normalized_url": None,
         }
 
 
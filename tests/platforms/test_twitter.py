@@ -125,4 +125,5 @@ class TestTwitterProfileURL:
             "platform": "twitter",
             "entity_type": "profile",
             "username": "karllorey",
+            "normalized_url": None,
         }
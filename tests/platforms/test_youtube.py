@@ -201,6 +201,7 @@ class TestYouTubeChannelURL:
             "channel_id": "UCddiUEpeqJcYeBxX1IVBKvQ",
             "username": None,
             "custom_url": None,
+            "normalized_url": None,
         }
 
     def test_model_dump_handle(self, channel_handle):
@@ -212,4 +213,5 @@ class TestYouTubeChannelURL:
             "channel_id": None,
             "username": None,
             "custom_url": "handle",
+            "normalized_url": None,
         }
@@ -0,0 +1,216 @@
+"""Tests for result caches."""
+
+import os
+
+import pytest
+
+from socials.cache import (
+    LRUCache,
+    SharedMemoryCache,
+    SQLiteCache,
+    _url_key,
+    parser_stamp,
+)
+from socials.extractor import Extractor
+
+
+class TestLRUCache:
+    def test_get_and_set(self):
+        cache = LRUCache(2)
+        assert cache.get("a") is None
+        cache["a"] = "no_parser"
+        assert cache.get("a") == "no_parser"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache["a"] = "no_parser"
+        cache["b"] = "no_parser"
+        cache.get("a")
+        cache["c"] = "no_parser"
+        assert "a" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+
+    def test_clear(self):
+        cache = LRUCache(2)
+        cache["a"] = "no_parser"
+        cache.get("a")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.hits == 0
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError, match="maxsize"):
+            LRUCache(0)
+
+
+class TestExtractorCache:
+    def test_results_are_cached(self):
+        cache = LRUCache()
+        extractor = Extractor(cache=cache)
+        first = extractor.parse("https://github.com/lorey")
+        assert extractor.parse("https://github.com/lorey") is first
+        assert cache.hits == 1
+
+    def test_failures_are_cached_with_reason(self):
+        cache = {}
+        extractor = Extractor(cache=cache)
+        assert extractor.parse("https://example.com") is None
+        assert cache == {"https://example.com": "no_parser"}
+        batch = extractor.parse_batch(["https://example.com"])
+        assert batch.failures[0].reason == "no_parser"
+
+    def test_strict_mode_raises_for_cached_failure(self):
+        from socials.protocols import ParseError  # noqa: PLC0415
+
+        extractor = Extractor(strict=True, cache=LRUCache())
+        for _ in range(2):
+            with pytest.raises(ParseError):
+                extractor.parse("https://example.com")
+
+    def test_explain_bypasses_cache(self):
+        cache = LRUCache()
+        extractor = Extractor(cache=cache)
+        extractor.explain("https://github.com/lorey")
+        assert len(cache) == 0
+
+    def test_no_cache_by_default(self):
+        assert Extractor().cache is None
+
+
+class TestSQLiteCache:
+    @pytest.fixture
+    def path(self, tmp_path):
+        return tmp_path / "cache.db"
+
+    def test_round_trip(self, path):
+        result = Extractor().parse("https://github.com/lorey/socials")
+        with SQLiteCache(path) as cache:
+            assert cache.get("https://github.com/lorey/socials") is None
+            cache["https://github.com/lorey/socials"] = result
+            cache["https://example.com"] = "no_parser"
+            assert cache.get("https://github.com/lorey/socials") == result
+            assert (cache.hits, cache.misses) == (1, 1)
+        with SQLiteCache(path) as cache:
+            assert len(cache) == 2
+            assert "https://example.com" in cache
+            assert cache.get("https://example.com") == "no_parser"
+            cached = cache.get("https://github.com/lorey/socials")
+            assert cached == result
+            assert cached.get_parent().username == "lorey"
+
+    def test_batches_writes(self, path):
+        with SQLiteCache(path, batch_size=2) as cache:
+            cache["a"] = "no_parser"
+            assert SQLiteCache(path).get("a") is None
+            cache["b"] = "no_parser"
+            assert SQLiteCache(path).get("a") == "no_parser"
+
+    def test_stamp_change_discards_entries(self, path):
+        with SQLiteCache(path, stamp="v1") as cache:
+            cache["a"] = "no_parser"
+        with SQLiteCache(path, stamp="v1") as cache:
+            assert len(cache) == 1
+        with SQLiteCache(path, stamp="v2") as cache:
+            assert len(cache) == 0
+
+    def test_default_stamp(self, path):
+        assert SQLiteCache(path).stamp == parser_stamp()
+        assert "github=socials.platforms.github:GitHubParser" in parser_stamp()
+
+    def test_skips_types_without_wire_code(self, path):
+        class PluginURL:
+            url = "https://example.com/x"
+
+        with SQLiteCache(path) as cache:
+            cache["https://example.com/x"] = PluginURL()
+            assert len(cache) == 0
+
+    def test_clear(self, path):
+        with SQLiteCache(path) as cache:
+            cache["a"] = "no_parser"
+            cache.get("a")
+            cache.clear()
+            assert len(cache) == 0
+            assert cache.hits == 0
+
+    def test_extractor_serves_from_disk(self, path):
+        with SQLiteCache(path) as cache:
+            Extractor(cache=cache).parse_batch(["https://github.com/lorey", "x"])
+        with SQLiteCache(path) as cache:
+            batch = Extractor(cache=cache).parse_batch(
+                ["https://github.com/lorey", "x"],
+            )
+            assert batch[0].username == "lorey"
+            assert batch.failures[0].reason == "malformed"
+            assert (cache.hits, cache.misses) == (2, 0)
+
+
+class TestSharedMemoryCache:
+    @pytest.fixture
+    def cache(self):
+        with SharedMemoryCache(slots=16) as cache:
+            yield cache
+
+    def test_round_trip(self, cache):
+        result = Extractor().parse("https://github.com/lorey/socials")
+        assert cache.get("https://github.com/lorey/socials") is None
+        cache["https://github.com/lorey/socials"] = result
+        cache["https://example.com"] = "no_parser"
+        assert cache.get("https://github.com/lorey/socials") == result
+        assert cache.get("https://example.com") == "no_parser"
+        assert "https://example.com" in cache
+        assert len(cache) == 2
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_overwrites_when_full(self, cache):
+        urls = [f"https://example.com/{i}" for i in range(100)]
+        for url in urls:
+            cache[url] = "no_parser"
+        assert len(cache) == 16
+        assert cache.get(urls[-1]) == "no_parser"
+
+    def test_skips_oversized_outcomes(self):
+        with SharedMemoryCache(slots=4, slot_size=32) as cache:
+            cache["a"] = "no_parser" * 10
+            assert len(cache) == 0
+
+    def test_torn_slot_is_a_miss(self, cache):
+        cache["a"] = "no_parser"
+        offset = next(cache._offsets(_url_key("a")))  # noqa: SLF001
+        cache._buf[offset + 22] ^= 0xFF  # noqa: SLF001
+        assert cache.get("a") is None
+
+    def test_attach(self, cache):
+        cache["a"] = "no_parser"
+        attached = SharedMemoryCache.attach(cache.name)
+        try:
+            assert (attached.slots, attached.slot_size) == (16, 256)
+            assert attached.get("a") == "no_parser"
+            attached["b"] = "no_parser"
+        finally:
+            attached.close()
+        assert cache.get("b") == "no_parser"
+
+    def test_rejects_invalid_layout(self):
+        with pytest.raises(ValueError, match="slots"):
+            SharedMemoryCache(slots=0)
+        with pytest.raises(ValueError, match="slot_size"):
+            SharedMemoryCache(slot_size=8)
+
+    def test_clear(self, cache):
+        cache["a"] = "no_parser"
+        cache.get("a")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.hits == 0
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+    def test_shared_between_forked_processes(self, cache):
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            Extractor(cache=cache).parse("https://github.com/lorey")
+            os._exit(0)
+        os.waitpid(pid, 0)
+        assert cache.get("https://github.com/lorey").username == "lorey"
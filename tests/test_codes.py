@@ -0,0 +1,46 @@
+"""Tests for platform and entity type codes."""
+
+import pytest
+
+import socials
+from socials import codes
+from socials.platforms.github import GitHubProfileURL, GitHubRepoURL
+
+
+class TestCodes:
+    def test_builtin_codes_are_stable(self):
+        assert codes.platform_code("github") == 0
+        assert codes.platform_code("phone") == 7
+        assert codes.entity_type_code("profile") == 0
+        assert codes.entity_type_code("phone") == 5
+
+    def test_round_trip(self):
+        for name in ["github", "twitter", "email"]:
+            assert codes.platform_name(codes.platform_code(name)) == name
+        for name in ["profile", "repo", "channel"]:
+            assert codes.entity_type_name(codes.entity_type_code(name)) == name
+
+    def test_plugin_names_get_new_codes(self):
+        code = codes.platform_code("test-plugin-platform")
+        assert code > codes.platform_code("phone")
+        assert codes.platform_code("test-plugin-platform") == code
+        assert codes.platform_name(code) == "test-plugin-platform"
+
+    def test_unknown_code_raises(self):
+        with pytest.raises(ValueError, match="Unknown code"):
+            codes.platform_name(10_000)
+
+
+class TestResultCodes:
+    def test_codes_on_results(self):
+        result = socials.parse("https://github.com/lorey/socials")
+        assert result.platform_code == codes.platform_code("github")
+        assert result.entity_type_code == codes.entity_type_code("repo")
+
+    def test_codes_are_class_level(self):
+        assert GitHubProfileURL.platform_code == GitHubRepoURL.platform_code
+        assert "platform_code" not in GitHubProfileURL.model_fields
+
+    def test_codes_not_dumped(self):
+        result = socials.parse("https://github.com/lorey")
+        assert "platform_code" not in result.model_dump()
@@ -0,0 +1,94 @@
+"""Tests for the columnar CompactExtraction store."""
+
+import pytest
+
+import socials
+from socials.compact import CompactExtraction
+
+URLS = [
+    "https://github.com/lorey",
+    "https://github.com/lorey/socials",
+    "https://twitter.com/karllorey",
+    "https://youtube.com/@karllorey",
+    "https://facebook.com/profile.php?id=1234",
+    "mailto:hello@example.com",
+    "https://unknown.example/page",
+]
+
+
+class TestCompactExtraction:
+    @pytest.fixture
+    def extraction(self):
+        return socials.parse_all(URLS)
+
+    @pytest.fixture
+    def compact(self):
+        return socials.Extractor().extract_compact(URLS)
+
+    def test_all_matches_extraction(self, compact, extraction):
+        assert compact.all() == extraction.all()
+        assert len(compact) == len(extraction.all())
+
+    def test_round_trips_optional_fields(self, compact, extraction):
+        youtube = extraction.by_platform()["youtube"][0]
+        assert youtube.channel_id is None
+        assert compact.by_platform()["youtube"] == [youtube]
+
+    def test_iteration(self, compact, extraction):
+        assert list(compact) == extraction.all()
+
+    def test_indexing(self, compact, extraction):
+        results = extraction.all()
+        assert compact[0] == results[0]
+        assert compact[-1] == results[-1]
+        assert compact[1:3] == results[1:3]
+
+    def test_index_out_of_range(self, compact):
+        with pytest.raises(IndexError):
+            compact[len(compact)]
+
+    def test_grouping_matches_extraction(self, compact, extraction):
+        assert compact.by_platform() == extraction.by_platform()
+        assert compact.by_type() == extraction.by_type()
+
+    def test_codes_match_extraction(self, compact, extraction):
+        assert compact.platform_codes() == extraction.platform_codes()
+        assert compact.entity_type_codes() == extraction.entity_type_codes()
+
+    def test_filter(self, compact, extraction):
+        filtered = compact.filter(platform="github", entity_type="repo")
+        assert isinstance(filtered, CompactExtraction)
+        expected = extraction.filter(platform="github", entity_type="repo")
+        assert filtered.all() == expected.all()
+
+    def test_rollup(self, compact, extraction):
+        assert compact.rollup() == extraction.rollup()
+        assert compact.roots() == extraction.roots()
+
+    def test_from_extraction(self, extraction):
+        compact = CompactExtraction.from_extraction(extraction)
+        assert compact.to_extraction().all() == extraction.all()
+
+    def test_append_and_extend(self, extraction):
+        compact = CompactExtraction()
+        results = extraction.all()
+        compact.append(results[0])
+        compact.extend(results[1:])
+        assert compact.all() == results
+
+    def test_non_ascii_values(self):
+        result = socials.parse("mailto:jürgen@example.com")
+        compact = CompactExtraction([result])
+        assert compact[0] == result
+
+    def test_empty(self):
+        compact = CompactExtraction()
+        assert len(compact) == 0
+        assert compact.all() == []
+        assert compact.by_platform() == {}
+        assert compact.nbytes > 0
+
+    def test_smaller_than_source_urls(self):
+        urls = [f"https://github.com/user{i}/repo{i}" for i in range(1000)]
+        compact = socials.Extractor().extract_compact(urls)
+        assert compact.nbytes < sum(len(url) for url in urls) * 3
@@ -0,0 +1,151 @@
+"""Tests for the CLI daemon."""
+
+from __future__ import annotations
+
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from socials import daemon
+from socials.cache import LRUCache
+from socials.cli import app
+from socials.extractor import Extractor
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX") or sys.platform == "win32",
+    reason="needs Unix domain sockets",
+)
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def socket_path(monkeypatch):
+    # Unix socket paths are limited to ~100 bytes, so avoid deep tmp_path dirs
+    with tempfile.TemporaryDirectory(prefix="socials-") as directory:
+        path = Path(directory) / "d.sock"
+        monkeypatch.setenv(daemon.SOCKET_ENV, str(path))
+        monkeypatch.delenv(daemon.DISABLE_ENV, raising=False)
+        yield path
+
+
+@pytest.fixture
+def server(socket_path):
+    server = daemon.DaemonServer(socket_path, Extractor(cache=LRUCache()))
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_default_socket_path(monkeypatch, socket_path):
+    assert daemon.default_socket_path() == socket_path
+    monkeypatch.delenv(daemon.SOCKET_ENV)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+    assert daemon.default_socket_path() == Path("/run/user/1000/socials.sock")
+
+
+def test_request(server):
+    outcomes = daemon.request(["https://github.com/lorey", "https://example.com"])
+    assert outcomes[0]["result"]["username"] == "lorey"
+    assert outcomes[0]["reason"] is None
+    assert outcomes[1] == {
+        "url": "https://example.com",
+        "result": None,
+        "reason": "no_parser",
+    }
+    daemon.request(["https://github.com/lorey"])
+    assert server.extractor.cache.hits == 1
+
+
+def test_request_without_daemon(socket_path):
+    assert daemon.request(["https://github.com/lorey"]) is None
+    socket_path.touch()
+    assert daemon.request(["https://github.com/lorey"]) is None
+
+
+def test_request_gives_up_on_stuck_daemon(socket_path):
+    # Listens (so connecting succeeds) but never answers
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stuck:
+        stuck.bind(str(socket_path))
+        stuck.listen()
+        started = time.monotonic()
+        assert daemon.request(["https://github.com/lorey"]) is None
+        assert time.monotonic() - started < daemon.CONNECT_TIMEOUT + 2
+
+
+@pytest.mark.usefixtures("server")
+def test_request_ignores_socket_of_other_user(monkeypatch):
+    uid = os.getuid()
+    monkeypatch.setattr(daemon.os, "getuid", lambda: uid + 1)
+    assert daemon.request(["https://github.com/lorey"]) is None
+
+
+@pytest.mark.usefixtures("server")
+def test_request_large_batch():
+    urls = [f"https://github.com/user{i}" for i in range(2500)]
+    outcomes = daemon.request(urls)
+    assert [outcome["url"] for outcome in outcomes] == urls
+    assert outcomes[-1]["result"]["username"] == "user2499"
+
+
+@pytest.mark.usefixtures("server")
+def test_request_disabled(monkeypatch):
+    monkeypatch.setenv(daemon.DISABLE_ENV, "1")
+    assert daemon.request(["https://github.com/lorey"]) is None
+
+
+def test_socket_file_lifecycle(socket_path):
+    # A stale socket file is replaced, a live daemon is not
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(str(socket_path))
+    server = daemon.DaemonServer(socket_path)
+    try:
+        assert socket_path.stat().st_mode & 0o777 == 0o600
+        with pytest.raises(RuntimeError, match="already listening"):
+            daemon.DaemonServer(socket_path)
+    finally:
+        server.server_close()
+    assert not socket_path.exists()
+
+
+def test_refuses_non_socket_path(socket_path):
+    socket_path.write_text("data")
+    with pytest.raises(RuntimeError, match="not a socket"):
+        daemon.DaemonServer(socket_path)
+    assert socket_path.read_text() == "data"
+
+
+def test_cli_uses_daemon(server):
+    result = runner.invoke(app, ["check", "https://github.com/lorey"])
+    assert result.exit_code == 0
+    assert result.output.strip() == "github"
+
+    urls = "https://github.com/lorey\nhttps://x.com/karllorey\nnope\n"
+    result = runner.invoke(app, ["extract"], input=urls)
+    assert result.exit_code == 0
+    assert result.output.splitlines() == [
+        "github\thttps://github.com/lorey",
+        "twitter\thttps://x.com/karllorey",
+    ]
+    result = runner.invoke(app, ["extract", "--platform", "twitter"], input=urls)
+    assert result.output.splitlines() == ["https://x.com/karllorey"]
+    result = runner.invoke(app, ["check"], input=urls)
+    assert result.output.splitlines() == ["github\tprofile", "twitter\tprofile", "-"]
+    cache = server.extractor.cache
+    assert (cache.hits, cache.misses) == (7, 3)
+
+
+@pytest.mark.usefixtures("socket_path")
+def test_cli_falls_back_without_daemon():
+    result = runner.invoke(app, ["check", "https://github.com/lorey"])
+    assert result.exit_code == 0
+    assert result.output.strip() == "github"
@@ -0,0 +1,96 @@
+"""Tests for explain mode and pattern tracing."""
+
+from socials.extractor import Extractor
+from socials.platforms.base import lazy_compile, trace_patterns
+
+
+class TestTracePatterns:
+    def test_records_attempts(self):
+        pattern = lazy_compile(r"^a+$")
+        with trace_patterns() as attempts:
+            pattern.match("aaa")
+            pattern.match("b")
+        assert [(a.string, a.matched) for a in attempts] == [
+            ("aaa", True),
+            ("b", False),
+        ]
+        assert all(a.pattern == r"^a+$" for a in attempts)
+        assert all(a.seconds >= 0 for a in attempts)
+
+    def test_nothing_recorded_outside_block(self):
+        pattern = lazy_compile(r"^a+$")
+        with trace_patterns() as attempts:
+            pass
+        pattern.match("aaa")
+        assert attempts == []
+
+    def test_nested_blocks(self):
+        pattern = lazy_compile(r"^a+$")
+        with trace_patterns() as outer:
+            pattern.match("a")
+            with trace_patterns() as inner:
+                pattern.match("aa")
+            pattern.match("aaa")
+        assert [a.string for a in outer] == ["a", "aaa"]
+        assert [a.string for a in inner] == ["aa"]
+
+
+class TestExplain:
+    def test_match(self):
+        explanation = Extractor().explain("https://github.com/lorey/socials")
+        assert explanation.scheme == "https"
+        assert explanation.hostname == "github.com"
+        assert explanation.parser == "github"
+        assert explanation.result.entity_type == "repo"
+        assert explanation.reason is None
+        assert explanation.patterns[-1].matched
+
+    def test_rejected(self):
+        explanation = Extractor().explain("https://github.com/lorey/socials/issues")
+        assert explanation.parser == "github"
+        assert explanation.reason == "rejected"
+        assert explanation.patterns
+        assert not any(attempt.matched for attempt in explanation.patterns)
+
+    def test_reserved_path_is_rejected_after_matching(self):
+        # Reserved paths are excluded in code, after the pattern matched
+        explanation = Extractor().explain("https://github.com/settings")
+        assert explanation.reason == "rejected"
+        assert explanation.result is None
+
+    def test_no_parser(self):
+        explanation = Extractor().explain("https://example.com/page")
+        assert explanation.parser is None
+        assert explanation.reason == "no_parser"
+        assert explanation.patterns == ()
+
+    def test_malformed(self):
+        explanation = Extractor().explain("https://[::1/x")
+        assert explanation.reason == "malformed"
+
+    def test_schemeless(self):
+        explanation = Extractor().explain("hello@example.com")
+        assert explanation.scheme == ""
+        assert explanation.parser == "email"
+
+    def test_strict_mode_does_not_raise(self):
+        explanation = Extractor(strict=True).explain("https://example.com")
+        assert explanation.result is None
+
+    def test_normalized_candidates(self):
+        explanation = Extractor(normalize=True).explain(
+            "https://github.com/lorey?tab=repositories",
+        )
+        assert explanation.candidates == (
+            "https://github.com/lorey?tab=repositories",
+            "https://github.com/lorey",
+        )
+        assert explanation.result.normalized_url == "https://github.com/lorey"
+        tried = {attempt.string for attempt in explanation.patterns}
+        assert tried == set(explanation.candidates)
+
+    def test_format(self):
+        report = Extractor().explain("https://github.com/settings").format()
+        assert "parser:   github" in report
+        assert "no match" in report
+        assert "none (rejected)" in report
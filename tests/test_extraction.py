@@ -4,6 +4,8 @@ import warnings
 
 import pytest
 
+import socials
+from socials import codes
 from socials.extractor import Extraction
 from socials.platforms.github import GitHubProfileURL, GitHubRepoURL
 from socials.platforms.twitter import TwitterProfileURL
@@ -110,3 +112,184 @@ class TestExtraction:
             warnings.simplefilter("ignore", DeprecationWarning)
             matches = ext.get_matches_for_platform("linkedin")
         assert matches == []
+
+    def test_roots_deduplicates(self, sample_results):
+        ext = Extraction(sample_results)
+        roots = ext.roots()
+        assert [r.url for r in roots] == [
+            "https://github.com/lorey",
+            "https://twitter.com/karllorey",
+        ]
+
+    def test_rollup_groups_by_root(self, sample_results):
+        ext = Extraction(sample_results)
+        rollup = ext.rollup()
+        profile, repo, twitter = sample_results
+        assert rollup == {profile: [profile, repo], twitter: [twitter]}
+
+    def test_rollup_without_root_in_results(self, sample_results):
+        repo = sample_results[1]
+        rollup = Extraction([repo]).rollup()
+        assert list(rollup) == [repo.get_root()]
+        assert rollup[repo.get_root()] == [repo]
+
+    def test_rollup_merges_spellings_of_one_root(self):
+        urls = [
+            "https://github.com/lorey/socials",
+            "https://github.com/lorey/",
+            "https://www.github.com/lorey",
+            "https://github.com/Lorey",
+        ]
+        results = [socials.parse(url) for url in urls]
+        rollup = Extraction(results).rollup()
+        assert len(rollup) == 1
+        # The extracted root is preferred over the repo's synthesized parent
+        [(root, grouped)] = rollup.items()
+        assert root is results[1]
+        assert grouped == results
+
+    def test_rollup_keeps_synthesized_root_without_extracted_one(self):
+        results = [
+            socials.parse("https://github.com/lorey/socials"),
+            socials.parse("https://github.com/Lorey/dotfiles"),
+        ]
+        rollup = Extraction(results).rollup()
+        assert list(rollup) == [results[0].get_root()]
+
+    def test_roots_empty(self):
+        assert Extraction([]).roots() == []
+        assert Extraction([]).rollup() == {}
+
+    def test_platform_codes(self, sample_results):
+        ext = Extraction(sample_results)
+        github = codes.platform_code("github")
+        twitter = codes.platform_code("twitter")
+        assert list(ext.platform_codes()) == [github, github, twitter]
+
+    def test_entity_type_codes(self, sample_results):
+        ext = Extraction(sample_results)
+        profile = codes.entity_type_code("profile")
+        repo = codes.entity_type_code("repo")
+        assert list(ext.entity_type_codes()) == [profile, repo, profile]
+
+    def test_by_platform_keeps_first_seen_order(self, sample_results):
+        ext = Extraction(list(reversed(sample_results)))
+        assert list(ext.by_platform()) == ["twitter", "github"]
+
+    def test_filter_by_platform(self, sample_results):
+        ext = Extraction(sample_results)
+        assert ext.filter(platform="github").all() == sample_results[:2]
+
+    def test_filter_by_platform_and_type(self, sample_results):
+        ext = Extraction(sample_results)
+        filtered = ext.filter(platform="github", entity_type="profile")
+        assert filtered.all() == sample_results[:1]
+
+    def test_filter_unknown_platform(self, sample_results):
+        assert Extraction(sample_results).filter(platform="nope").all() == []
+
+    def test_results_without_class_codes(self):
+        class PluginURL:
+            platform = "test-plugin"
+            entity_type = "profile"
+            url = "https://plugin.example/a"
+
+        ext = Extraction([PluginURL()])
+        assert ext.by_platform() == {"test-plugin": ext.all()}
+        assert ext.filter(entity_type="profile").all() == ext.all()
+
+
+class TestIncrementalExtraction:
+    @pytest.fixture
+    def profile(self):
+        return GitHubProfileURL(url="https://github.com/lorey", username="lorey")
+
+    @pytest.fixture
+    def twitter(self):
+        return TwitterProfileURL(
+            url="https://twitter.com/karllorey",
+            username="karllorey",
+        )
+
+    def test_does_not_alias_input_list(self, profile, twitter):
+        results = [profile]
+        ext = Extraction(results)
+        ext.append(twitter)
+        assert results == [profile]
+
+    def test_append_updates_built_indexes(self, profile, twitter):
+        ext = Extraction([profile])
+        assert list(ext.by_platform()) == ["github"]
+        ext.append(twitter)
+        assert ext.by_platform() == {"github": [profile], "twitter": [twitter]}
+        assert ext.by_type() == {"profile": [profile, twitter]}
+        assert list(ext.platform_codes()) == [
+            codes.platform_code("github"),
+            codes.platform_code("twitter"),
+        ]
+
+    def test_grouping_returns_copies(self, profile, twitter):
+        ext = Extraction([profile])
+        ext.by_platform()["github"].append(twitter)
+        assert ext.by_platform() == {"github": [profile]}
+
+    def test_extend(self, profile, twitter):
+        ext = Extraction()
+        ext.extend([profile, twitter])
+        assert ext.all() == [profile, twitter]
+        assert len(ext) == 2
+        assert list(ext) == [profile, twitter]
+
+    def test_extend_dedupe_uses_canonical_identity(self, profile):
+        other_spelling = GitHubProfileURL(
+            url="http://www.github.com/lorey/",
+            username="lorey",
+        )
+        ext = Extraction([profile])
+        ext.extend([other_spelling, other_spelling], dedupe=True)
+        assert ext.all() == [profile]
+
+    def test_extend_dedupe_within_batch(self, profile, twitter):
+        ext = Extraction()
+        ext.extend([profile, twitter, profile], dedupe=True)
+        assert ext.all() == [profile, twitter]
+
+    def test_dedupe_keeps_tracking_later_appends(self, profile):
+        ext = Extraction()
+        ext.extend([], dedupe=True)
+        ext.append(profile)
+        ext.extend([profile], dedupe=True)
+        assert len(ext) == 1
+
+    def test_dedupe_distinguishes_types(self, profile):
+        repo = GitHubRepoURL(
+            url="https://github.com/lorey/lorey",
+            owner="lorey",
+            repo="lorey",
+        )
+        ext = Extraction([profile])
+        ext.extend([repo], dedupe=True)
+        assert len(ext) == 2
+
+    def test_merge(self, profile, twitter):
+        ext = Extraction([profile])
+        other = Extraction([twitter, profile])
+        ext.merge(other)
+        assert ext.all() == [profile, twitter, profile]
+        assert other.all() == [twitter, profile]
+
+    def test_merge_dedupe(self, profile, twitter):
+        ext = Extraction([profile])
+        ext.merge(Extraction([twitter, profile]), dedupe=True)
+        assert ext.all() == [profile, twitter]
+
+    def test_merge_with_itself(self, profile):
+        ext = Extraction([profile])
+        ext.merge(ext)
+        assert len(ext) == 2
+
+    def test_filter_after_append(self, profile, twitter):
+        ext = Extraction([profile])
+        ext.filter(platform="github")
+        ext.append(twitter)
+        assert ext.filter(platform="twitter").all() == [twitter]
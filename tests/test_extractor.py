@@ -1,8 +1,13 @@
 """Tests for Extractor class."""
 
+import gc
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from socials.extractor import Extractor
+from socials.cache import LRUCache, SQLiteCache
+from socials.extractor import Extractor, ParseFailure
+from socials.platforms import LazyParser
 from socials.platforms.github import GitHubProfileURL
 from socials.protocols import ParseError
 
@@ -104,3 +109,251 @@ class TestExtractor:
         assert ext.parse("https://youtube.com/@lorey") is not None
         assert ext.parse("mailto:test@example.com") is not None
         assert ext.parse("tel:+1234567890") is not None
+
+    def test_extractors_share_registry_snapshot(self):
+        assert Extractor().registry is Extractor().registry
+        github = Extractor(platforms=["github"])
+        assert github.registry is Extractor(platforms=["github"]).registry
+        assert github.registry is not Extractor().registry
+        assert github.registry.frozen
+
+    def test_platform_order_sets_priority(self):
+        a = Extractor(platforms=["github", "twitter"])
+        b = Extractor(platforms=["twitter", "github"])
+        assert a.registry is not b.registry
+        assert [p.platform for p in b.registry.parsers] == ["twitter", "github"]
+
+
+class TestNormalization:
+    @pytest.fixture
+    def extractor(self):
+        return Extractor(normalize=True)
+
+    @pytest.mark.parametrize(
+        ("url", "normalized_url"),
+        [
+            (" https://twitter.com/karllorey\n", "https://twitter.com/karllorey"),
+            (
+                "https://twitter.com/karllorey?utm_source=newsletter",
+                "https://twitter.com/karllorey",
+            ),
+            ("HTTP://Instagram.COM/lorey/#top", "https://instagram.com/lorey/"),
+            (
+                "https://github.com/lorey/socials?tab=readme-ov-file",
+                "https://github.com/lorey/socials",
+            ),
+            (
+                "https://www.facebook.com/profile.php?id=1234&ref=bookmarks",
+                "https://www.facebook.com/profile.php?id=1234",
+            ),
+            (" hello@example.com ", "hello@example.com"),
+            ("https://github.com:443/lorey", "https://github.com/lorey"),
+            ("https://someone@GitHub.com/lorey", "https://github.com/lorey"),
+            ("https://github.com./lorey", "https://github.com/lorey"),
+        ],
+    )
+    def test_dirty_urls_parse(self, extractor, url, normalized_url):
+        result = extractor.parse(url)
+        assert result is not None
+        assert result.url == url
+        assert result.normalized_url == normalized_url
+
+    def test_identifiers_are_extracted(self, extractor):
+        result = extractor.parse("https://github.com/lorey/socials?utm_source=x")
+        assert result.owner == "lorey"
+        assert result.repo == "socials"
+
+    def test_disabled_by_default(self):
+        extractor = Extractor()
+        assert extractor.normalize is False
+        assert extractor.parse("https://twitter.com/karllorey?s=20") is None
+        assert extractor.parse("https://twitter.com/karllorey").normalized_url is None
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://github.com:443/lorey",
+            "https://someone@github.com/lorey",
+            "https://github.com./lorey",
+        ],
+    )
+    def test_routes_on_hostname_without_normalizing(self, url):
+        batch = Extractor().parse_batch([url])
+        assert batch.failures[0].reason == "rejected"
+        assert Extractor().explain(url).parser == "github"
+
+    def test_unknown_urls(self, extractor):
+        assert extractor.parse("https://example.com/?utm_source=x") is None
+        assert extractor.parse("ftp://example.com/file") is None
+
+    def test_strict_mode(self):
+        extractor = Extractor(normalize=True, strict=True)
+        with pytest.raises(ParseError):
+            extractor.parse("https://example.com/page")
+
+    def test_extract(self, extractor):
+        extraction = extractor.extract(
+            ["https://twitter.com/karllorey?s=20", "https://example.com"],
+        )
+        assert [r.normalized_url for r in extraction.all()] == [
+            "https://twitter.com/karllorey",
+        ]
+
+
+BATCH_URLS = [
+    "https://github.com/lorey",
+    "https://example.com/page",
+    "https://github.com/settings",
+    "https:///no-host",
+    "not a url",
+    "ftp://example.com/file",
+    "mailto:hello@example.com",
+]
+
+
+class TestParseBatch:
+    def test_results_align_with_input(self):
+        batch = Extractor().parse_batch(BATCH_URLS)
+        assert len(batch) == len(BATCH_URLS)
+        assert batch[0].username == "lorey"
+        assert batch[1] is None
+        assert batch[6].email == "hello@example.com"
+        assert [r is not None for r in batch] == [
+            True,
+            False,
+            False,
+            False,
+            False,
+            False,
+            True,
+        ]
+
+    def test_failure_reasons(self):
+        batch = Extractor().parse_batch(BATCH_URLS)
+        assert batch.failures == [
+            ParseFailure(1, "https://example.com/page", "no_parser"),
+            ParseFailure(2, "https://github.com/settings", "rejected"),
+            ParseFailure(3, "https:///no-host", "malformed"),
+            ParseFailure(4, "not a url", "malformed"),
+            ParseFailure(5, "ftp://example.com/file", "no_parser"),
+        ]
+        assert not batch.ok
+
+    def test_unsplittable_url_is_malformed(self):
+        batch = Extractor().parse_batch(["https://[::1/x"])
+        assert batch.failures[0].reason == "malformed"
+
+    def test_strict_mode_does_not_raise(self):
+        batch = Extractor(strict=True).parse_batch(BATCH_URLS)
+        assert len(batch.failures) == 5
+
+    def test_raise_for_failures(self):
+        batch = Extractor().parse_batch(BATCH_URLS)
+        with pytest.raises(ParseError, match=r"example\.com/page \(no_parser\)"):
+            batch.raise_for_failures()
+
+    def test_all_recognized(self):
+        batch = Extractor().parse_batch(["https://github.com/lorey"])
+        assert batch.ok
+        batch.raise_for_failures()
+        assert batch.extraction().all() == batch.results
+
+    def test_extraction_skips_failures(self):
+        batch = Extractor().parse_batch(BATCH_URLS)
+        assert [r.platform for r in batch.extraction().all()] == ["github", "email"]
+
+    def test_with_normalization(self):
+        extractor = Extractor(normalize=True)
+        batch = extractor.parse_batch(
+            [" https://twitter.com/karllorey?s=20 ", "https://twitter.com/home"],
+        )
+        assert batch[0].normalized_url == "https://twitter.com/karllorey"
+        assert batch.failures == [
+            ParseFailure(1, "https://twitter.com/home", "rejected"),
+        ]
+
+    def test_matches_parse(self):
+        extractor = Extractor()
+        batch = extractor.parse_batch(BATCH_URLS)
+        assert batch.results == [extractor.parse(url) for url in BATCH_URLS]
+
+
+class TestThreads:
+    def test_parse_batch_matches_sequential(self):
+        urls = BATCH_URLS * 50
+        ext = Extractor()
+        threaded = ext.parse_batch(urls, threads=4)
+        sequential = ext.parse_batch(urls)
+        assert threaded.results == sequential.results
+        assert threaded.failures == sequential.failures
+
+    def test_extract_matches_sequential(self):
+        ext = Extractor()
+        assert ext.extract(BATCH_URLS, threads=3).all() == ext.extract(BATCH_URLS).all()
+
+    def test_extract_strict_raises(self):
+        with pytest.raises(ParseError, match=r"https://example\.com/page"):
+            Extractor(strict=True).extract(BATCH_URLS, threads=2)
+
+    def test_empty_batch(self):
+        assert len(Extractor().parse_batch([], threads=2)) == 0
+
+    def test_invalid_threads(self):
+        with pytest.raises(ValueError, match="threads"):
+            Extractor().extract(BATCH_URLS, threads=0)
+
+    def test_shared_extractor_and_cache(self):
+        cache = LRUCache()
+        ext = Extractor(cache=cache)
+        urls = [f"https://github.com/user{i % 20}" for i in range(400)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(ext.parse, urls))
+        assert [r.username for r in results] == [url.rsplit("/", 1)[1] for url in urls]
+        assert cache.hits + cache.misses == len(urls)
+
+    def test_lazy_parser_loads_once(self):
+        lazy = LazyParser(
+            "github",
+            "socials.platforms.github:GitHubParser",
+            schemes={"https"},
+        )
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            parsers = list(pool.map(lambda _: lazy.load(), range(32)))
+        assert all(parser is parsers[0] for parser in parsers)
+
+
+class TestInterning:
+    def test_repeated_inputs_share_one_result(self):
+        ext = Extractor(intern_results=True)
+        assert ext.intern_results
+        extraction = ext.extract(["https://github.com/lorey"] * 3)
+        first, *rest = extraction
+        assert all(result is first for result in rest)
+
+    def test_disabled_by_default(self):
+        ext = Extractor()
+        assert not ext.intern_results
+        assert ext.parse("https://github.com/lorey") is not ext.parse(
+            "https://github.com/lorey",
+        )
+
+    def test_results_are_released(self):
+        ext = Extractor(intern_results=True)
+        result = ext.parse("https://github.com/lorey")
+        del result
+        gc.collect()
+        assert len(ext._interned) == 0  # noqa: SLF001
+        assert ext.parse("https://github.com/lorey").username == "lorey"
+
+    def test_interns_cached_results(self, tmp_path):
+        with SQLiteCache(tmp_path / "cache.db") as cache:
+            Extractor(cache=cache).parse("https://github.com/lorey")
+            ext = Extractor(cache=cache, intern_results=True)
+            assert ext.parse("https://github.com/lorey") is ext.parse(
+                "https://github.com/lorey",
+            )
+
+    def test_failures_are_not_interned(self):
+        ext = Extractor(intern_results=True)
+        batch = ext.parse_batch(["https://example.com", "https://example.com"])
+        assert [failure.reason for failure in batch.failures] == ["no_parser"] * 2
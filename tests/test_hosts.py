@@ -0,0 +1,68 @@
+"""Tests for hostname routing."""
+
+import pytest
+
+from socials.hosts import HostTrie, domain_matches, matches_domains
+
+
+@pytest.mark.parametrize(
+    ("hostname", "policy", "expected"),
+    [
+        ("example.com", "exact", True),
+        ("www.example.com", "exact", False),
+        ("www.example.com", "www", True),
+        ("m.example.com", "www", False),
+        ("a.b.example.com", "subdomains", True),
+        ("example.com", "subdomains", True),
+        ("notexample.com", "subdomains", False),
+    ],
+)
+def test_domain_matches(hostname, policy, expected):
+    assert domain_matches(hostname, "example.com", policy) is expected
+
+
+def test_matches_domains():
+    domains = {"x.com": "www", "mobile.x.com": "exact"}
+    assert matches_domains("mobile.x.com", domains)
+    assert not matches_domains("api.x.com", domains)
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError, match="Unknown host policy"):
+        domain_matches("example.com", "example.com", "all")
+
+
+class TestHostTrie:
+    def test_policies(self):
+        trie = HostTrie()
+        trie.add("github.com", "github", "www")
+        trie.add("linkedin.com", "linkedin", "subdomains")
+        trie.add("mobile.x.com", "x", "exact")
+        assert len(trie) == 4
+        assert trie.get("github.com") == "github"
+        assert trie.get("www.github.com") == "github"
+        assert trie.get("gist.github.com") is None
+        assert trie.get("linkedin.com") == "linkedin"
+        assert trie.get("de.m.linkedin.com") == "linkedin"
+        assert trie.get("mobile.x.com") == "x"
+        assert trie.get("x.com") is None
+        assert trie.get("com") is None
+        assert trie.get("") is None
+
+    def test_lowest_priority_wins(self):
+        trie = HostTrie()
+        trie.add("example.com", "wide", "subdomains", priority=1)
+        trie.add("api.example.com", "api", priority=2)
+        trie.add("www.example.com", "www", priority=0)
+        assert trie.get("api.example.com") == "wide"
+        assert trie.get("www.example.com") == "www"
+
+    def test_earlier_entry_kept(self):
+        trie = HostTrie()
+        trie.add("Example.com.", "first")
+        trie.add("example.com", "second")
+        assert trie.get("example.com") == "first"
+
+    def test_rejects_empty_domain(self):
+        with pytest.raises(ValueError, match="empty"):
+            HostTrie().add(".", "value")
@@ -0,0 +1,94 @@
+"""Tests that keep `import socials` lightweight."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _loaded_modules(code: str) -> set[str]:
+    """Run code in a fresh interpreter and return the loaded module names."""
+    script = f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return set(output.split())
+
+
+PLATFORM_MODULES = {
+    "socials.platforms.facebook",
+    "socials.platforms.github",
+    "socials.platforms.instagram",
+    "socials.platforms.linkedin",
+    "socials.platforms.misc",
+    "socials.platforms.twitter",
+    "socials.platforms.youtube",
+}
+
+
+class TestLazyImports:
+    def test_import_does_not_load_heavy_modules(self):
+        modules = _loaded_modules("import socials")
+        assert "pydantic" not in modules
+        assert "importlib.metadata" not in modules
+        assert "socials.compact" not in modules
+        assert not modules & PLATFORM_MODULES
+
+    def test_parse_loads_only_the_matching_platform(self):
+        modules = _loaded_modules(
+            "import socials; socials.parse('https://github.com/lorey')",
+        )
+        assert modules & PLATFORM_MODULES == {"socials.platforms.github"}
+
+    def test_unknown_host_loads_no_platform(self):
+        modules = _loaded_modules(
+            "import socials; socials.parse('https://example.com/page')",
+        )
+        assert not modules & PLATFORM_MODULES
+
+    def test_cli_check_loads_only_what_it_needs(self, monkeypatch):
+        monkeypatch.setenv("SOCIALS_NO_DAEMON", "1")
+        modules = _loaded_modules(
+            "import sys\n"
+            "sys.argv = ['socials', 'check', 'https://github.com/lorey']\n"
+            "from socials.cli import app\n"
+            "try:\n"
+            "    app()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "from socials.platforms import discover_plugins\n"
+            "assert discover_plugins.cache_info().currsize == 0, 'plugins scanned'",
+        )
+        assert modules & PLATFORM_MODULES == {"socials.platforms.github"}
+        assert not modules & {
+            "socials.cache",
+            "socials.compact",
+            "socials.explain",
+            "socials.server",
+            "socials.wire",
+            "sqlite3",
+        }
+
+    @pytest.mark.parametrize(
+        "name",
+        ["GitHubParser", "EmailParser", "YouTubeParser"],
+    )
+    def test_parser_classes_resolve_lazily(self, name):
+        import socials.platforms  # noqa: PLC0415
+
+        parser_class = getattr(socials.platforms, name)
+        assert parser_class.__name__ == name
+
+    def test_unknown_attribute_raises(self):
+        import socials.platforms  # noqa: PLC0415
+
+        with pytest.raises(AttributeError):
+            _ = socials.platforms.NoSuchParser
+
+    def test_version_is_resolved_lazily(self):
+        import socials  # noqa: PLC0415
+
+        assert isinstance(socials.__version__, str)
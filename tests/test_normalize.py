@@ -0,0 +1,84 @@
+"""Tests for URL normalization."""
+
+import pytest
+
+from socials.normalize import normalize_url, split_url
+
+
+class TestNormalizeURL:
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://github.com/lorey", "https://github.com/lorey"),
+            ("  https://github.com/lorey\n", "https://github.com/lorey"),
+            ("HTTPS://GitHub.COM/lorey", "https://github.com/lorey"),
+            ("http://github.com/lorey", "https://github.com/lorey"),
+            ("https://github.com/lorey#readme", "https://github.com/lorey"),
+            (
+                "https://twitter.com/karllorey?utm_source=x&utm_medium=y",
+                "https://twitter.com/karllorey",
+            ),
+            (
+                "https://twitter.com/karllorey?s=20&t=abc",
+                "https://twitter.com/karllorey",
+            ),
+            (
+                "https://facebook.com/profile.php?id=123&ref=bookmarks",
+                "https://facebook.com/profile.php?id=123",
+            ),
+            ("https://github.com:443/lorey", "https://github.com/lorey"),
+            ("http://github.com:80/lorey", "https://github.com/lorey"),
+            ("https://github.com:8443/lorey", "https://github.com:8443/lorey"),
+            ("https://user:pw@github.com/lorey", "https://github.com/lorey"),
+            ("https://github.com./lorey", "https://github.com/lorey"),
+            ("https://[::1]:8080/x", "https://[::1]:8080/x"),
+            ("MAILTO:Hello@Example.com", "mailto:Hello@Example.com"),
+            ("hello@example.com ", "hello@example.com"),
+        ],
+    )
+    def test_normalize(self, url, expected):
+        assert normalize_url(url) == expected
+
+    def test_path_case_is_kept(self):
+        assert normalize_url("https://GITHUB.com/Lorey") == "https://github.com/Lorey"
+
+
+class TestSplitURL:
+    def test_routing_information(self):
+        normalized = split_url(" HTTP://WWW.GitHub.com/lorey ")
+        assert normalized.scheme == "https"
+        assert normalized.hostname == "www.github.com"
+        assert normalized.candidates == ("https://www.github.com/lorey",)
+
+    def test_remaining_query_adds_candidate(self):
+        normalized = split_url("https://github.com/lorey?tab=repositories&ref=x")
+        assert normalized.candidates == (
+            "https://github.com/lorey?tab=repositories",
+            "https://github.com/lorey",
+        )
+        assert normalized.url == normalized.candidates[0]
+
+    def test_schemeless(self):
+        normalized = split_url(" hello@example.com ")
+        assert normalized.scheme == ""
+        assert normalized.candidates == ("hello@example.com",)
+
+    def test_invalid_url_is_kept(self):
+        assert split_url("https://[::1/x").candidates == ("https://[::1/x",)
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://github.com:443/lorey",
+            "https://GitHub.com:443/lorey",
+            "https://someone@github.com/lorey",
+            "https://github.com./lorey",
+        ],
+    )
+    def test_hostname_is_routing_host(self, url):
+        assert split_url(url).hostname == "github.com"
+
+    def test_invalid_port_is_kept(self):
+        normalized = split_url("https://github.com:x/lorey")
+        assert normalized.hostname == "github.com"
+        assert normalized.candidates == ("https://github.com:x/lorey",)
@@ -0,0 +1,163 @@
+"""Tests for third-party parser discovery via entry points."""
+
+from __future__ import annotations
+
+import sys
+import time
+import types
+from typing import ClassVar
+
+import pytest
+
+import socials.platforms
+from socials.cache import LRUCache
+from socials.extractor import Extractor, _registry_snapshot
+from socials.platforms import LazyParser, available_parsers, discover_plugins
+
+
+class MastodonProfileURL:
+    platform = "mastodon"
+    entity_type = "profile"
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+
+
+class MastodonParser:
+    platform = "mastodon"
+    schemes: ClassVar[set[str]] = {"http", "https"}
+
+    def handles_hostname(self, hostname: str) -> bool:
+        return hostname == "mastodon.social"
+
+    def parse(self, url: str) -> MastodonProfileURL | None:
+        if "/@" in url:
+            return MastodonProfileURL(url)
+        return None
+
+
+class FakeEntryPoint:
+    def __init__(self, name, obj, value="fake_plugin:parser"):
+        self.name = name
+        self.value = value
+        self._obj = obj
+
+    def load(self):
+        if isinstance(self._obj, Exception):
+            raise self._obj
+        return self._obj
+
+
+@pytest.fixture
+def plugin_module(monkeypatch):
+    module = types.ModuleType("socials_test_plugin")
+    module.MastodonParser = MastodonParser
+    monkeypatch.setitem(sys.modules, "socials_test_plugin", module)
+    return module
+
+
+@pytest.fixture
+def entry_points(monkeypatch):
+    """Install fake entry points and reset the discovery cache."""
+    installed: list[FakeEntryPoint] = []
+    monkeypatch.setattr(socials.platforms, "_entry_points", lambda: installed)
+    discover_plugins.cache_clear()
+    _registry_snapshot.cache_clear()
+    yield installed
+    discover_plugins.cache_clear()
+    _registry_snapshot.cache_clear()
+
+
+class TestDiscoverPlugins:
+    @pytest.mark.usefixtures("entry_points")
+    def test_no_plugins(self):
+        assert discover_plugins() == {}
+        assert list(available_parsers()) == list(socials.platforms.DEFAULT_PARSERS)
+
+    def test_parser_class_is_instantiated(self, entry_points):
+        entry_points.append(FakeEntryPoint("mastodon", MastodonParser))
+        plugins = discover_plugins()
+        assert isinstance(plugins["mastodon"], MastodonParser)
+
+    def test_plugins_come_after_builtins(self, entry_points):
+        entry_points.append(FakeEntryPoint("mastodon", MastodonParser()))
+        assert list(available_parsers())[-1] == "mastodon"
+
+    def test_builtin_name_conflict_is_ignored(self, entry_points):
+        entry_points.append(FakeEntryPoint("github", MastodonParser()))
+        with pytest.warns(UserWarning, match="already registered"):
+            plugins = discover_plugins()
+        assert plugins == {}
+
+    def test_broken_plugin_is_skipped(self, entry_points):
+        entry_points.append(FakeEntryPoint("broken", ImportError("no module")))
+        with pytest.warns(UserWarning, match="Failed to load"):
+            plugins = discover_plugins()
+        assert plugins == {}
+
+
+class TestExtractorWithPlugins:
+    def test_default_extractor_includes_plugins(self, entry_points):
+        entry_points.append(FakeEntryPoint("mastodon", MastodonParser()))
+        result = Extractor().parse("https://mastodon.social/@lorey")
+        assert result is not None
+        assert result.platform == "mastodon"
+
+    def test_select_plugin_platform(self, entry_points):
+        entry_points.append(FakeEntryPoint("mastodon", MastodonParser()))
+        ext = Extractor(platforms=["mastodon"])
+        assert ext.parse("https://mastodon.social/@lorey") is not None
+        assert ext.parse("https://github.com/lorey") is None
+
+    def test_lazy_parsers_declare_parser_domains(self):
+        for lazy in socials.platforms.DEFAULT_PARSERS.values():
+            assert lazy.domains == getattr(lazy.load(), "domains", {})
+
+    def test_builtin_platforms_skip_discovery(self, entry_points):
+        entry_points.append(FakeEntryPoint("broken", ImportError("no module")))
+        Extractor(platforms=["github"])
+        assert discover_plugins.cache_info().currsize == 0
+
+    def test_default_extractor_discovers_on_first_unrouted_url(self, entry_points):
+        entry_points.append(FakeEntryPoint("mastodon", MastodonParser()))
+        ext = Extractor()
+        assert ext.parse("https://github.com/lorey").platform == "github"
+        assert discover_plugins.cache_info().currsize == 0
+
+        assert ext.parse("https://mastodon.social/@lorey").platform == "mastodon"
+        assert discover_plugins.cache_info().currsize == 1
+        assert ext.parse("https://github.com/lorey").platform == "github"
+
+    def test_threads_wait_for_discovery(self, entry_points):
+        class SlowEntryPoint(FakeEntryPoint):
+            def load(self):
+                time.sleep(0.05)
+                return super().load()
+
+        entry_points.append(SlowEntryPoint("mastodon", MastodonParser()))
+        ext = Extractor(cache=LRUCache())
+        urls = [f"https://mastodon.social/@user{i}" for i in range(64)]
+        assert ext.parse_batch(urls, threads=8).ok
+        assert ext.parse_batch(urls).ok
+
+    def test_registry_property_includes_plugins(self, entry_points):
+        entry_points.append(FakeEntryPoint("mastodon", MastodonParser()))
+        platforms = [parser.platform for parser in Extractor().registry.parsers]
+        assert platforms[-1] == "mastodon"
+
+    @pytest.mark.usefixtures("plugin_module")
+    def test_lazy_plugin_loads_on_matching_host(self, entry_points):
+        lazy = LazyParser(
+            "mastodon",
+            "socials_test_plugin:MastodonParser",
+            schemes={"http", "https"},
+            hostnames={"mastodon.social"},
+        )
+        entry_points.append(FakeEntryPoint("mastodon", lazy))
+        ext = Extractor()
+
+        assert ext.parse("https://github.com/lorey") is not None
+        assert not lazy.loaded
+
+        assert ext.parse("https://mastodon.social/@lorey") is not None
+        assert lazy.loaded
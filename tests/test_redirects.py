@@ -0,0 +1,90 @@
+"""Tests for redirect wrapper unwrapping."""
+
+from urllib.parse import quote
+
+import pytest
+
+from socials.extractor import Extractor
+from socials.redirects import unwrap_once, unwrap_url
+
+GITHUB = "https%3A%2F%2Fgithub.com%2Florey"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        f"https://l.facebook.com/l.php?u={GITHUB}&h=AT0abc",
+        f"https://lm.facebook.com/l.php?u={GITHUB}",
+        f"https://www.google.com/url?sa=t&q={GITHUB}",
+        f"https://google.com/url?url={GITHUB}",
+        f"https://t.umblr.com/redirect?z={GITHUB}&t=xyz",
+        f"https://www.linkedin.com/redir/redirect?url={GITHUB}&urlhash=abc",
+        f"https://www.youtube.com/redirect?event=video&q={GITHUB}",
+        f"https://l.instagram.com/?u={GITHUB}",
+        f"HTTPS://L.FACEBOOK.COM/l.php?u={GITHUB}",
+    ],
+)
+def test_unwrap_once(url):
+    assert unwrap_once(url) == "https://github.com/lorey"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://github.com/lorey",
+        "https://l.facebook.com/other.php?u=https%3A%2F%2Fgithub.com%2Florey",
+        "https://www.google.com/search?q=https%3A%2F%2Fgithub.com",
+        "https://l.facebook.com/l.php?u=javascript%3Aalert(1)",
+        "https://l.facebook.com/l.php",
+        "https://[::1/",
+    ],
+)
+def test_not_unwrapped(url):
+    assert unwrap_once(url) is None
+    assert unwrap_url(url) == url
+
+
+def test_nested_wrappers():
+    google = f"https://www.google.com/url?q={GITHUB}"
+    facebook = f"https://l.facebook.com/l.php?u={quote(google, safe='')}"
+    assert unwrap_url(facebook) == "https://github.com/lorey"
+    assert unwrap_url(facebook, max_depth=1) == google
+
+
+class TestExtractor:
+    def test_disabled_by_default(self):
+        ext = Extractor()
+        assert not ext.unwrap_redirects
+        batch = ext.parse_batch([f"https://l.facebook.com/l.php?u={GITHUB}"])
+        assert batch.failures[0].reason == "rejected"
+
+    def test_parses_target(self):
+        ext = Extractor(unwrap_redirects=True)
+        result = ext.parse(f"https://www.google.com/url?q={GITHUB}")
+        assert result.username == "lorey"
+        assert result.url == "https://github.com/lorey"
+
+    def test_with_normalization(self):
+        ext = Extractor(unwrap_redirects=True, normalize=True)
+        url = f" HTTP://L.Facebook.com/l.php?u={GITHUB}%3Futm_source%3Dfb "
+        result = ext.parse(url)
+        assert result.url == url
+        assert result.normalized_url == "https://github.com/lorey"
+
+    def test_unusable_target_keeps_wrapper(self):
+        ext = Extractor(unwrap_redirects=True)
+        batch = ext.parse_batch(
+            [
+                "https://l.facebook.com/l.php?u=https%3A%2F%2Fexample.com",
+                "https://l.facebook.com/l.php?u=https%3A%2F%2Fgithub.com%2Fx%00y",
+            ],
+        )
+        reasons = [failure.reason for failure in batch.failures]
+        assert reasons == ["no_parser", "rejected"]
+
+    def test_explain_reports_target(self):
+        explanation = Extractor(unwrap_redirects=True).explain(
+            f"https://t.umblr.com/redirect?z={GITHUB}",
+        )
+        assert explanation.hostname == "github.com"
+        assert explanation.result.username == "lorey"
@@ -0,0 +1,125 @@
+"""Tests for regex backends and the input guard."""
+
+from importlib import import_module
+
+import pytest
+
+import socials
+from socials.extractor import Extractor
+from socials.platforms.base import LazyPattern, lazy_compile
+from socials.regex import (
+    MAX_URL_LENGTH,
+    RE2Backend,
+    StdlibBackend,
+    _translate_for_re2,
+    get_backend,
+    is_plausible_url,
+    set_backend,
+)
+
+PLATFORM_MODULES = [
+    f"socials.platforms.{name}"
+    for name in (
+        "facebook",
+        "github",
+        "instagram",
+        "linkedin",
+        "misc",
+        "twitter",
+        "youtube",
+    )
+]
+
+
+@pytest.fixture
+def restore_backend():
+    previous = get_backend()
+    yield
+    set_backend(previous)
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://github.com/lorey", True),
+        ("https://de.linkedin.com/in/jürgen", True),
+        ("https://github.com/lorey\n", False),
+        ("https://github.com/\x00lorey", False),
+        ("https://github.com/" + "a" * MAX_URL_LENGTH, False),
+    ],
+)
+def test_is_plausible_url(url, expected):
+    assert is_plausible_url(url) is expected
+
+
+def test_extractor_rejects_implausible_input():
+    batch = Extractor().parse_batch(
+        ["https://github.com/" + "a" * MAX_URL_LENGTH, "https://github.com/x\t"],
+    )
+    assert [failure.reason for failure in batch.failures] == ["malformed"] * 2
+
+
+def test_normalized_input_is_guarded_after_cleaning():
+    assert Extractor(normalize=True).parse(" https://github.com/lorey\n") is not None
+
+
+@pytest.mark.parametrize(
+    ("pattern", "translated"),
+    [
+        (r"^[\w\-_]+$", r"^[\pL\pN_\-_]+$"),
+        (r"a\wb\d", r"a[\pL\pN_]b[\p{Nd}]"),
+        (r"[]\w]", r"[]\pL\pN_]"),
+        (r"\\w\.", r"\\w\."),
+    ],
+)
+def test_translate_for_re2(pattern, translated):
+    assert _translate_for_re2(pattern) == translated
+
+
+@pytest.mark.usefixtures("restore_backend")
+class TestBackends:
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown regex backend"):
+            set_backend("pcre")
+
+    def test_switch_recompiles_patterns(self):
+        pattern = lazy_compile(r"^a$")
+        assert pattern.match("a")
+
+        compiled = []
+
+        class RecordingBackend(StdlibBackend):
+            name = "recording"
+
+            def compile(self, pattern, flags=0):
+                compiled.append(pattern)
+                return super().compile(pattern, flags)
+
+        set_backend(RecordingBackend())
+        assert pattern.match("a")
+        assert compiled == [r"^a$"]
+
+    def test_re2_backend(self):
+        pytest.importorskip("re2")
+        set_backend("re2")
+        backend = get_backend()
+        assert backend.name == "re2"
+        assert socials.parse("https://de.linkedin.com/in/jürgen").username == "jürgen"
+        assert socials.parse("https://github.com/lorey/socials").repo == "socials"
+        assert socials.parse("https://github.com/settings") is None
+        assert socials.parse("https://facebook.com/home.php") is None
+        assert socials.parse("https://instagram.com/explore") is None
+
+    def test_re2_compiles_every_platform_pattern(self):
+        pytest.importorskip("re2")
+        backend = RE2Backend()
+        patterns = [
+            value
+            for name in PLATFORM_MODULES
+            for value in vars(import_module(name)).values()
+            if isinstance(value, LazyPattern)
+        ]
+        assert patterns
+        for pattern in patterns:
+            backend.compile(pattern.pattern, pattern.flags)
+        assert backend.fallbacks == set()
@@ -237,3 +237,91 @@ class TestRegistryOverlappingParsers:
             reg.register(GitHubParser())  # http, https
 
         assert len(reg.parsers) == 3
+
+
+class TestFrozenRegistry:
+    def test_freeze_returns_frozen_copy(self):
+        reg = Registry([GitHubParser()])
+        frozen = reg.freeze()
+        assert frozen.frozen
+        assert not reg.frozen
+        assert frozen.parsers == reg.parsers
+
+    def test_frozen_registry_rejects_register(self):
+        frozen = Registry([GitHubParser()]).freeze()
+        with pytest.raises(RuntimeError, match="frozen"):
+            frozen.register(EmailParser())
+
+    def test_frozen_registry_routes_like_original(self):
+        reg = Registry([GitHubParser(), EmailParser(), PhoneParser()])
+        frozen = reg.freeze()
+        for url in [
+            "https://github.com/lorey",
+            "https://gitlab.com/lorey",
+            "mailto:test@example.com",
+            "tel:+1234567890",
+            "test@example.com",
+        ]:
+            assert frozen.parse(url) == reg.parse(url)
+
+    def test_frozen_registry_memoizes_hostnames(self):
+        calls = []
+
+        class CountingParser:
+            platform = "counting"
+            schemes: ClassVar[set[str]] = {"http", "https"}
+
+            def handles_hostname(self, hostname: str) -> bool:
+                calls.append(hostname)
+                return hostname == "example.com"
+
+            def parse(self, _url: str) -> None:
+                return None
+
+        frozen = Registry([CountingParser()]).freeze()
+        for _ in range(3):
+            assert frozen.get_parser_for_hostname("example.com") is not None
+            assert frozen.get_parser_for_hostname("other.com") is None
+        assert calls == ["example.com", "other.com"]
+
+    def test_routes_declared_domains(self):
+        class ExampleParser:
+            platform = "example"
+            schemes: ClassVar[set[str]] = {"http", "https"}
+            domains: ClassVar[dict[str, str]] = {"example.com": "subdomains"}
+
+            def handles_hostname(self, _hostname: str) -> bool:
+                raise AssertionError
+
+            def parse(self, _url: str) -> None:
+                return None
+
+        reg = Registry([GitHubParser(), ExampleParser()])
+        assert reg.get_parser_for_hostname("a.b.example.com").platform == "example"
+        assert reg.get_parser_for_hostname("www.github.com").platform == "github"
+        assert reg.get_parser_for_hostname("gist.github.com") is None
+        assert reg.freeze().get_parser_for_hostname("example.com") is not None
+
+    def test_first_registered_wins_across_domains_and_fallback(self):
+        class CatchAllParser:
+            platform = "catchall"
+            schemes: ClassVar[set[str]] = {"http", "https"}
+
+            def handles_hostname(self, _hostname: str) -> bool:
+                return True
+
+            def parse(self, _url: str) -> None:
+                return None
+
+        class WideParser:
+            platform = "wide"
+            schemes: ClassVar[set[str]] = {"http", "https"}
+            domains: ClassVar[dict[str, str]] = {"github.com": "subdomains"}
+
+        reg = Registry([GitHubParser(), WideParser(), CatchAllParser()])
+        assert reg.get_parser_for_hostname("github.com").platform == "github"
+        assert reg.get_parser_for_hostname("gist.github.com").platform == "wide"
+        assert reg.get_parser_for_hostname("example.com").platform == "catchall"
+
+        reg = Registry([CatchAllParser(), GitHubParser()])
+        assert reg.get_parser_for_hostname("github.com").platform == "catchall"
@@ -0,0 +1,248 @@
+"""Tests for the HTTP extraction server."""
+
+from __future__ import annotations
+
+import http.client
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from socials.cache import LRUCache
+from socials.extractor import Extractor
+from socials.server import ExtractionServer
+
+
+@pytest.fixture
+def server():
+    server = ExtractionServer(("127.0.0.1", 0), Extractor(cache=LRUCache()))
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def conn(server):
+    host, port = server.server_address[:2]
+    conn = http.client.HTTPConnection(host, port, timeout=5)
+    yield conn
+    conn.close()
+
+
+def request(conn, method, path, body=None, content_type="application/json"):
+    headers = {"Content-Type": content_type} if body is not None else {}
+    conn.request(method, path, body=body, headers=headers)
+    response = conn.getresponse()
+    return response.status, response.read().decode()
+
+
+class TestParseEndpoint:
+    def test_get(self, conn):
+        status, body = request(conn, "GET", "/parse?url=https://github.com/lorey")
+        assert status == 200
+        data = json.loads(body)
+        assert data["result"]["username"] == "lorey"
+        assert data["reason"] is None
+
+    def test_post(self, conn):
+        payload = json.dumps({"url": "https://github.com/settings"})
+        status, body = request(conn, "POST", "/parse", payload)
+        assert status == 200
+        assert json.loads(body) == {
+            "url": "https://github.com/settings",
+            "result": None,
+            "reason": "rejected",
+        }
+
+    def test_missing_url(self, conn):
+        status, body = request(conn, "GET", "/parse")
+        assert status == 400
+        assert "url" in json.loads(body)["error"]
+
+    def test_keep_alive(self, conn):
+        for _ in range(3):
+            status, _ = request(conn, "GET", "/parse?url=https://github.com/lorey")
+            assert status == 200
+        assert conn.sock is not None
+
+
+class TestBatchEndpoint:
+    def test_json(self, conn):
+        urls = ["https://github.com/lorey", "https://example.com"]
+        status, body = request(conn, "POST", "/batch", json.dumps(urls))
+        assert status == 200
+        data = json.loads(body)
+        assert data["results"][0]["platform"] == "github"
+        assert data["results"][1] is None
+        assert data["failures"] == [
+            {"position": 1, "url": "https://example.com", "reason": "no_parser"},
+        ]
+
+    def test_json_object(self, conn):
+        payload = json.dumps({"urls": ["https://twitter.com/karllorey"]})
+        status, body = request(conn, "POST", "/batch", payload)
+        assert status == 200
+        assert json.loads(body)["results"][0]["username"] == "karllorey"
+
+    def test_ndjson(self, conn):
+        payload = 'https://github.com/lorey\n\n"https://example.com"\n'
+        status, body = request(conn, "POST", "/batch", payload, "application/x-ndjson")
+        assert status == 200
+        lines = [json.loads(line) for line in body.splitlines()]
+        assert [line["url"] for line in lines] == [
+            "https://github.com/lorey",
+            "https://example.com",
+        ]
+        assert lines[0]["result"]["platform"] == "github"
+        assert lines[1]["reason"] == "no_parser"
+
+    def test_ndjson_invalid_utf8(self, conn):
+        body = b"https://github.com/lorey\n\xff\xfe\n"
+        status, body = request(conn, "POST", "/batch", body, "application/x-ndjson")
+        assert status == 400
+        assert "UTF-8" in json.loads(body)["error"]
+        # The connection is still usable
+        assert request(conn, "GET", "/health")[0] == 200
+
+    def test_negative_content_length(self, conn):
+        conn.putrequest("POST", "/batch")
+        conn.putheader("Content-Type", "application/x-ndjson")
+        conn.putheader("Content-Length", "-1")
+        conn.endheaders()
+        response = conn.getresponse()
+        assert response.status == 400
+        assert "Content-Length" in json.loads(response.read())["error"]
+
+    def test_invalid_json(self, conn):
+        status, _ = request(conn, "POST", "/batch", "{not json")
+        assert status == 400
+
+    def test_wrong_shape(self, conn):
+        status, _ = request(conn, "POST", "/batch", json.dumps({"urls": [1, 2]}))
+        assert status == 400
+
+    def test_get_not_allowed(self, conn):
+        status, _ = request(conn, "GET", "/batch")
+        assert status == 405
+
+
+class TestUnreadBody:
+    """Bodies of rejected requests are never parsed as the next request."""
+
+    SMUGGLED = b"GET /nope HTTP/1.1\r\nHost: x\r\n\r\n"
+
+    def exchange(self, server, first):
+        host, port = server.server_address[:2]
+        second = b"GET /health HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n"
+        with socket.create_connection((host, port), timeout=5) as sock:
+            sock.sendall(first + second)
+            with sock.makefile("rb") as stream:
+                statuses = []
+                while line := stream.readline():
+                    statuses.append(int(line.split()[1]))
+                    length = 0
+                    while (header := stream.readline()) not in (b"\r\n", b""):
+                        name, _, value = header.decode().partition(":")
+                        if name.lower() == "content-length":
+                            length = int(value)
+                    stream.read(length)
+        return statuses
+
+    def post(self, path, headers=b""):
+        return (
+            f"POST {path} HTTP/1.1\r\nHost: x\r\n".encode()
+            + headers
+            + f"Content-Length: {len(self.SMUGGLED)}\r\n\r\n".encode()
+            + self.SMUGGLED
+        )
+
+    @pytest.mark.parametrize("path", ["/health", "/nope", "/metrics"])
+    def test_drained_after_error(self, server, path):
+        status = 404 if path == "/nope" else 405
+        assert self.exchange(server, self.post(path)) == [status, 200]
+
+    def test_drained_after_success(self, server):
+        request = (
+            b"GET /health HTTP/1.1\r\nHost: x\r\n"
+            + f"Content-Length: {len(self.SMUGGLED)}\r\n\r\n".encode()
+            + self.SMUGGLED
+        )
+        assert self.exchange(server, request) == [200, 200]
+
+    def test_closed_without_content_length(self, server):
+        request = b"POST /batch HTTP/1.1\r\nHost: x\r\n\r\n" + self.SMUGGLED
+        assert self.exchange(server, request) == [411]
+
+    def test_closed_when_too_large(self, server, monkeypatch):
+        monkeypatch.setattr("socials.server.MAX_BODY_BYTES", 4)
+        assert self.exchange(server, self.post("/batch")) == [413]
+        assert self.exchange(server, self.post("/health")) == [405]
+
+    def test_closed_on_invalid_content_length(self, server):
+        request = (
+            b"POST /health HTTP/1.1\r\nHost: x\r\nContent-Length: x\r\n\r\n"
+            + self.SMUGGLED
+        )
+        assert self.exchange(server, request) == [405]
+
+
+class TestOtherEndpoints:
+    def test_health(self, conn):
+        assert request(conn, "GET", "/health") == (200, '{"status": "ok"}')
+
+    def test_not_found(self, conn):
+        status, _ = request(conn, "GET", "/nope")
+        assert status == 404
+
+    def test_metrics(self, conn):
+        request(conn, "GET", "/parse?url=https://github.com/lorey")
+        request(conn, "GET", "/parse?url=https://github.com/lorey")
+        request(conn, "POST", "/batch", json.dumps(["https://example.com"]))
+        status, body = request(conn, "GET", "/metrics")
+        assert status == 200
+        assert 'socials_requests_total{endpoint="/parse",status="200"} 2' in body
+        assert "socials_urls_total 3" in body
+        assert "socials_url_failures_total 1" in body
+        assert 'socials_request_duration_seconds_count{endpoint="/batch"} 1' in body
+        assert "socials_cache_hits_total 1" in body
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="worker processes need fork")
+def test_worker_processes():
+    port = free_port()
+    process = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", "socials.cli", "serve", "--port", str(port), "-w", "2"],
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        pids = set()
+        responses = 0
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline and len(pids) < 2 and responses < 50:
+            try:
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+                status, body = request(conn, "GET", "/metrics")
+                conn.close()
+            except OSError:
+                time.sleep(0.05)
+                continue
+            assert status == 200
+            responses += 1
+            pids.add(body.rsplit("socials_worker_pid ", 1)[1].strip())
+        # Connections are spread over the workers by the kernel
+        assert 1 <= len(pids) <= 2
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
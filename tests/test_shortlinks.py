@@ -0,0 +1,250 @@
+"""Tests for short link resolution."""
+
+import asyncio
+
+import pytest
+
+from socials.cache import LRUCache
+from socials.extractor import Extractor
+from socials.shortlinks import DictResolver, ShortLinkResolver
+
+TARGETS = {
+    "https://t.co/abc": "https://twitter.com/karllorey",
+    "https://lnkd.in/xyz": "https://www.linkedin.com/in/karllorey",
+    "https://bit.ly/wrapped": (
+        "https://l.facebook.com/l.php?u=https%3A%2F%2Fgithub.com%2Florey"
+    ),
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FailingBackend:
+    def __init__(self):
+        self.calls = 0
+
+    async def resolve(self, url):
+        self.calls += 1
+        raise OSError(url)
+
+
+class FlakyBackend:
+    """Raises on the first call for each link, then resolves it."""
+
+    def __init__(self, targets):
+        self.targets = targets
+        self.failed = set()
+
+    async def resolve(self, url):
+        if url not in self.failed:
+            self.failed.add(url)
+            raise OSError(url)
+        return self.targets.get(url)
+
+
+class TestShortLinkResolver:
+    def test_resolves_each_link_once(self):
+        backend = DictResolver(TARGETS)
+        resolver = ShortLinkResolver(backend)
+        targets = resolver.resolve(
+            ["https://t.co/abc", "https://t.co/abc", "https://t.co/none"],
+        )
+        assert targets == {
+            "https://t.co/abc": "https://twitter.com/karllorey",
+            "https://t.co/none": None,
+        }
+        resolver.resolve(["https://t.co/abc", "https://t.co/none"])
+        assert backend.calls == ["https://t.co/abc", "https://t.co/none"]
+        assert len(resolver) == 2
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        backend = DictResolver(TARGETS)
+        resolver = ShortLinkResolver(backend, ttl=60, clock=clock)
+        resolver.resolve(["https://t.co/abc"])
+        clock.now = 59
+        assert resolver.get("https://t.co/abc") == "https://twitter.com/karllorey"
+        clock.now = 60
+        assert resolver.get("https://t.co/abc") is None
+        assert "https://t.co/abc" not in resolver
+        resolver.resolve(["https://t.co/abc"])
+        assert len(backend.calls) == 2
+
+    def test_errors_are_not_cached(self):
+        backend = FailingBackend()
+        resolver = ShortLinkResolver(backend)
+        assert resolver.resolve(["https://t.co/abc"]) == {"https://t.co/abc": None}
+        resolver.resolve(["https://t.co/abc"])
+        assert backend.calls == 2
+
+    def test_expired_entries_are_pruned(self):
+        clock = FakeClock()
+        resolver = ShortLinkResolver(DictResolver(TARGETS), ttl=60, clock=clock)
+        resolver.resolve(["https://t.co/abc"])
+        clock.now = 30
+        resolver.resolve(["https://lnkd.in/xyz"])
+        clock.now = 60
+        resolver.resolve(["https://t.co/none"])
+        # The first entry expired and was dropped
+        assert len(resolver) == 2
+        clock.now = 1000
+        resolver.resolve(["https://bit.ly/wrapped"])
+        assert len(resolver) == 1
+
+    def test_cancellation_is_not_swallowed(self):
+        class CancelledBackend:
+            async def resolve(self, _url):
+                raise asyncio.CancelledError
+
+        resolver = ShortLinkResolver(CancelledBackend())
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(resolver.aresolve(["https://t.co/abc"]))
+        assert len(resolver) == 0
+
+    def test_limits_concurrency(self):
+        in_flight = []
+
+        class SlowBackend:
+            active = 0
+
+            async def resolve(self, url):
+                self.active += 1
+                in_flight.append(self.active)
+                await asyncio.sleep(0)
+                self.active -= 1
+                return url
+
+        resolver = ShortLinkResolver(SlowBackend(), concurrency=2)
+        resolver.resolve([f"https://t.co/{i}" for i in range(10)])
+        assert max(in_flight) == 2
+
+    def test_resolve_inside_running_loop(self):
+        resolver = ShortLinkResolver(DictResolver(TARGETS))
+
+        async def main():
+            return resolver.resolve(["https://t.co/abc"])
+
+        assert asyncio.run(main()) == {
+            "https://t.co/abc": "https://twitter.com/karllorey",
+        }
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError, match="concurrency"):
+            ShortLinkResolver(DictResolver({}), concurrency=0)
+
+
+class TestExtractor:
+    @pytest.fixture
+    def backend(self):
+        return DictResolver(TARGETS)
+
+    def test_without_resolver(self):
+        assert Extractor().parse("https://t.co/abc") is None
+
+    def test_parse_resolves_target(self, backend):
+        ext = Extractor(resolver=ShortLinkResolver(backend))
+        result = ext.parse("https://t.co/abc")
+        assert result.platform == "twitter"
+        assert result.url == "https://twitter.com/karllorey"
+
+    def test_batch_resolves_once(self, backend):
+        resolver = ShortLinkResolver(backend)
+        ext = Extractor(resolver=resolver, unwrap_redirects=True)
+        urls = [
+            "https://t.co/abc",
+            "https://github.com/lorey",
+            "https://lnkd.in/xyz",
+            "https://bit.ly/wrapped",
+            "https://t.co/abc",
+            "https://t.co/unknown",
+        ]
+        batch = ext.parse_batch(iter(urls))
+        assert [r.platform if r else None for r in batch] == [
+            "twitter",
+            "github",
+            "linkedin",
+            "github",
+            "twitter",
+            None,
+        ]
+        assert batch.failures[0].reason == "no_parser"
+        assert sorted(backend.calls) == sorted(
+            [
+                "https://t.co/abc",
+                "https://lnkd.in/xyz",
+                "https://bit.ly/wrapped",
+                "https://t.co/unknown",
+            ],
+        )
+
+    @pytest.mark.parametrize("intern_results", [False, True])
+    def test_failed_resolution_is_not_cached(self, intern_results):
+        resolver = ShortLinkResolver(FlakyBackend(TARGETS))
+        ext = Extractor(
+            cache=LRUCache(),
+            resolver=resolver,
+            intern_results=intern_results,
+        )
+        urls = ["https://t.co/abc", "https://github.com/lorey"]
+        first = ext.parse_batch(urls)
+        assert first[0] is None
+        assert first.failures[0].reason == "no_parser"
+        second = ext.parse_batch(urls)
+        assert second.ok
+        assert second[0].platform == "twitter"
+        assert "https://t.co/abc" not in ext.cache
+        assert "https://github.com/lorey" in ext.cache
+
+    @pytest.mark.parametrize("intern_results", [False, True])
+    def test_short_link_inside_redirect_wrapper(self, intern_results):
+        backend = FlakyBackend(TARGETS)
+        ext = Extractor(
+            cache=LRUCache(),
+            resolver=ShortLinkResolver(backend),
+            unwrap_redirects=True,
+            intern_results=intern_results,
+        )
+        url = "https://www.google.com/url?q=https://t.co/abc"
+        assert ext.parse_batch([url])[0] is None
+        assert backend.failed == {"https://t.co/abc"}
+        assert url not in ext.cache
+        assert ext.parse(url).platform == "twitter"
+
+    def test_short_link_behind_short_link(self):
+        targets = {**TARGETS, "https://bit.ly/outer": "https://t.co/abc"}
+        backend = DictResolver(targets)
+        ext = Extractor(cache=LRUCache(), resolver=ShortLinkResolver(backend))
+        assert ext.parse("https://bit.ly/outer").platform == "twitter"
+        assert backend.calls == ["https://bit.ly/outer", "https://t.co/abc"]
+        assert len(ext.cache) == 0
+
+    def test_expired_target_is_resolved_again(self):
+        clock = FakeClock()
+        backend = DictResolver(TARGETS)
+        resolver = ShortLinkResolver(backend, ttl=60, clock=clock)
+        ext = Extractor(cache=LRUCache(), resolver=resolver)
+        assert ext.parse("https://t.co/abc").platform == "twitter"
+        backend.targets["https://t.co/abc"] = "https://github.com/lorey"
+        assert ext.parse("https://t.co/abc").platform == "twitter"
+        clock.now = 60
+        assert ext.parse("https://t.co/abc").platform == "github"
+
+    def test_threaded_and_compact(self, backend):
+        ext = Extractor(resolver=ShortLinkResolver(backend))
+        urls = ["https://t.co/abc", "https://lnkd.in/xyz"]
+        assert len(ext.extract(urls, threads=2)) == 2
+        assert len(ext.extract_compact(urls)) == 2
+        assert len(backend.calls) == 2
+
+    def test_explain_follows_short_link(self, backend):
+        explanation = Extractor(resolver=ShortLinkResolver(backend)).explain(
+            "https://lnkd.in/xyz",
+        )
+        assert explanation.hostname == "www.linkedin.com"
+        assert explanation.result.username == "karllorey"
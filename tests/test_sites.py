@@ -0,0 +1,134 @@
+"""Tests for per-website account aggregation."""
+
+import pytest
+
+from socials.cache import LRUCache
+from socials.extractor import Extractor
+from socials.shortlinks import DictResolver, ShortLinkResolver
+from socials.sites import SiteAggregator, aggregate_sites, site_domain
+
+
+@pytest.mark.parametrize(
+    ("source_url", "domain"),
+    [
+        ("https://www.Example.com/about", "example.com"),
+        ("http://blog.example.com:8080/", "blog.example.com"),
+        ("example.com/contact", "example.com"),
+        ("", ""),
+        ("http://[::1", ""),
+    ],
+)
+def test_site_domain(source_url, domain):
+    assert site_domain(source_url) == domain
+
+
+class TestSiteAggregator:
+    def test_groups_by_source_domain(self):
+        sites = aggregate_sites(
+            [
+                ("https://a.com/", "https://github.com/alice"),
+                ("https://www.a.com/x", "https://example.com"),
+                ("https://b.com/", "https://github.com/bob"),
+            ],
+        )
+        assert len(sites) == 2
+        assert [site.domain for site in sites] == ["a.com", "b.com"]
+        assert sites["a.com"].links == 2
+        assert [a.result.url for a in sites["a.com"].accounts()] == [
+            "https://github.com/alice",
+        ]
+
+    def test_counts_links_pages_and_first_seen(self):
+        sites = aggregate_sites(
+            [
+                ("https://a.com/", "https://example.com"),
+                ("https://a.com/", "https://twitter.com/alice"),
+                ("https://a.com/", "https://x.com/alice"),
+                ("https://a.com/b", "https://twitter.com/alice"),
+            ],
+        )
+        (account,) = sites["a.com"].accounts()
+        assert (account.count, account.pages, account.first_seen) == (3, 2, 1)
+
+    def test_official_prefers_domain_match(self):
+        sites = aggregate_sites(
+            [
+                ("https://acme.io/", "https://twitter.com/someone"),
+                ("https://acme.io/b", "https://twitter.com/someone"),
+                ("https://acme.io/c", "https://twitter.com/acme_hq"),
+            ],
+        )
+        assert sites["acme.io"].official()["twitter"].username == "acme_hq"
+
+    def test_short_handle_does_not_match_domain(self):
+        sites = aggregate_sites(
+            [
+                ("https://example.com/", "https://twitter.com/ex"),
+                ("https://example.com/a", "https://twitter.com/acmeofficial"),
+                ("https://example.com/b", "https://twitter.com/acmeofficial"),
+            ],
+        )
+        assert sites["example.com"].official()["twitter"].username == "acmeofficial"
+
+    def test_official_prefers_pages_then_count_then_position(self):
+        sites = aggregate_sites(
+            [
+                ("https://a.com/1", "https://github.com/first"),
+                ("https://a.com/1", "https://github.com/footer"),
+                ("https://a.com/1", "https://github.com/first"),
+                ("https://a.com/2", "https://github.com/footer"),
+            ],
+        )
+        ranked = sites["a.com"].ranked("github")
+        assert [a.result.username for a in ranked] == ["footer", "first"]
+
+    def test_official_ignores_non_account_types(self):
+        sites = aggregate_sites(
+            [
+                ("https://a.com/", "https://github.com/lorey/socials"),
+                ("https://a.com/", "mailto:hi@a.com"),
+            ],
+        )
+        site = sites["a.com"]
+        assert site.official() == {}
+        assert len(site.extraction().all()) == 2
+
+    def test_streaming_add(self):
+        extractor = Extractor(cache=LRUCache())
+        sites = SiteAggregator(extractor)
+        assert sites.add("https://a.com/", "https://github.com/alice") is not None
+        assert sites.add("https://a.com/", "https://example.com") is None
+        sites.add_pairs([("https://a.com/b", "https://github.com/alice")])
+        assert sites["a.com"].accounts()[0].pages == 2
+        assert extractor.cache.hits == 1
+        assert sites.official() == {
+            "a.com": {"github": sites["a.com"].accounts()[0].result},
+        }
+
+    def test_pages_are_parsed_as_batches(self):
+        backend = DictResolver(
+            {
+                "https://t.co/a": "https://twitter.com/acme",
+                "https://t.co/b": "https://github.com/acme",
+            },
+        )
+        extractor = Extractor(strict=True, resolver=ShortLinkResolver(backend))
+        sites = aggregate_sites(
+            [
+                ("https://acme.io/", "https://t.co/a"),
+                ("https://acme.io/", "https://example.com"),
+                ("https://acme.io/", "https://t.co/b"),
+            ],
+            extractor=extractor,
+        )
+        assert sites["acme.io"].links == 3
+        assert set(sites["acme.io"].official()) == {"twitter", "github"}
+        assert sorted(backend.calls) == ["https://t.co/a", "https://t.co/b"]
+
+    def test_add_with_strict_extractor(self):
+        sites = SiteAggregator(Extractor(strict=True))
+        assert sites.add("https://a.com/", "https://example.com") is None
+        assert (
+            sites.add_page("https://a.com/", ["https://github.com/a", "x"])[1] is None
+        )
+        assert sites["a.com"].links == 3
@@ -34,6 +34,63 @@ def test_cli_check():
     assert result.exit_code == 1
 
 
+def test_cli_check_batch(tmp_path):
+    """Test CLI check command with several URLs."""
+    result = runner.invoke(
+        app,
+        ["check", "https://github.com/lorey", "https://github.com/lorey/socials"],
+    )
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ["github\tprofile", "github\trepo"]
+
+    urls = tmp_path / "urls.txt"
+    urls.write_text("https://twitter.com/karllorey\n\nhttps://example.com\n")
+    result = runner.invoke(app, ["check", "--file", str(urls), "--null", "null"])
+    assert result.exit_code == 1
+    assert result.output.splitlines() == ["twitter\tprofile", "null", "null"]
+
+
+def test_cli_check_stdin_summary():
+    """Test CLI check command reading stdin with a summary."""
+    result = runner.invoke(
+        app,
+        ["check", "--summary"],
+        input="https://github.com/lorey\nhttps://x.com/karllorey\nnope\n",
+    )
+    assert result.exit_code == 1
+    assert result.stdout.splitlines() == ["github\tprofile", "twitter\tprofile", "-"]
+    assert "3 checked, 2 recognized, 1 unknown" in result.stderr
+
+
+def test_cli_explain():
+    """Test CLI explain command."""
+    result = runner.invoke(app, ["explain", "https://github.com/lorey"])
+    assert result.exit_code == 0
+    assert "parser:   github" in result.output
+    assert "result:   github profile" in result.output
+
+    result = runner.invoke(app, ["explain", "https://github.com/settings"])
+    assert result.exit_code == 1
+    assert "rejected" in result.output
+
+
+def test_cli_explain_normalize():
+    """Test CLI explain command with normalization."""
+    url = "https://twitter.com/karllorey?utm_source=x"
+    result = runner.invoke(app, ["explain", "--normalize", url])
+    assert result.exit_code == 0
+    assert "tried:    https://twitter.com/karllorey" in result.output
+
+
+def test_cli_explain_unwrap():
+    """Test CLI explain command with redirect unwrapping."""
+    url = "https://l.facebook.com/l.php?u=https%3A%2F%2Fgithub.com%2Florey"
+    assert runner.invoke(app, ["explain", url]).exit_code == 1
+    result = runner.invoke(app, ["explain", "--unwrap", url])
+    assert result.exit_code == 0
+    assert "parser:   github" in result.output
+
+
 def test_cli_extract():
     """Test CLI extract command."""
     result = runner.invoke(
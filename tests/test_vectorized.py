@@ -0,0 +1,148 @@
+"""Tests for vectorized parsing of Series and arrays."""
+
+import pytest
+
+import socials
+from socials.extractor import Extractor
+from socials.shortlinks import DictResolver, ShortLinkResolver
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+URLS = [
+    "https://github.com/lorey",
+    "https://example.com/page",
+    "https://github.com/lorey/socials",
+    None,
+    "https://twitter.com/karllorey",
+    "https://github.com/lorey",
+    "mailto:test@example.com",
+    "not a url",
+]
+
+
+class TestParseArray:
+    def test_columns_align_with_input(self):
+        columns = socials.parse_array(np.array(URLS, dtype=object))
+        assert list(columns["platform"]) == [
+            "github",
+            None,
+            "github",
+            None,
+            "twitter",
+            "github",
+            "email",
+            None,
+        ]
+        assert columns["entity_type"][2] == "repo"
+        assert columns["username"][0] == "lorey"
+        assert columns["owner"][2] == "lorey"
+        assert columns["repo"][2] == "socials"
+        assert columns["email"][6] == "test@example.com"
+        assert all(len(column) == len(URLS) for column in columns.values())
+
+    def test_matches_scalar_parse(self):
+        columns = socials.parse_array(URLS)
+        for i, url in enumerate(URLS):
+            result = socials.parse(url) if url is not None else None
+            expected = result.platform if result is not None else None
+            assert columns["platform"][i] == expected
+
+    def test_parses_each_distinct_value_once(self):
+        calls = []
+
+        class CountingExtractor(Extractor):
+            def parse_batch(self, urls, **kwargs):
+                urls = list(urls)
+                calls.extend(urls)
+                return super().parse_batch(urls, **kwargs)
+
+        socials.parse_array(URLS * 10, extractor=CountingExtractor())
+        assert len(calls) == len(set(calls))
+        # Unroutable hosts are filtered before parsing
+        assert "https://example.com/page" not in calls
+
+    def test_strict_extractor_does_not_raise(self):
+        columns = socials.parse_array(URLS, extractor=Extractor(strict=True))
+        assert columns["platform"][1] is None
+
+    def test_normalizing_extractor_adds_column(self):
+        urls = [" https://twitter.com/karllorey?s=20", "https://example.com"]
+        columns = socials.parse_array(urls, extractor=Extractor(normalize=True))
+        assert list(columns["normalized_url"]) == [
+            "https://twitter.com/karllorey",
+            None,
+        ]
+        assert "normalized_url" not in socials.parse_array(urls)
+
+    def test_ports_and_userinfo_are_routed_by_hostname(self):
+        urls = ["https://github.com:443/lorey", "https://someone@GitHub.com./lorey"]
+        columns = socials.parse_array(urls, extractor=Extractor(normalize=True))
+        assert list(columns["username"]) == ["lorey", "lorey"]
+
+    def test_redirects_and_short_links_match_scalar_parse(self):
+        urls = [
+            "https://www.google.com/url?q=https%3A%2F%2Fgithub.com%2Florey",
+            "https://t.umblr.com/redirect?z=https%3A%2F%2Ftwitter.com%2Fkarllorey",
+            "https://t.co/abc",
+            "https://t.co/unknown",
+            "https://example.com/page",
+        ]
+        backend = DictResolver({"https://t.co/abc": "https://github.com/lorey"})
+        extractor = Extractor(
+            unwrap_redirects=True,
+            resolver=ShortLinkResolver(backend),
+        )
+        columns = socials.parse_array(urls, extractor=extractor)
+        expected = [extractor.parse(url) for url in urls]
+        assert list(columns["platform"]) == [
+            result.platform if result is not None else None for result in expected
+        ]
+        assert list(columns["platform"]) == [
+            "github",
+            "twitter",
+            "github",
+            None,
+            None,
+        ]
+
+    def test_empty_input(self):
+        columns = socials.parse_array([])
+        assert len(columns["platform"]) == 0
+
+
+class TestParseSeries:
+    def test_returns_aligned_dataframe(self):
+        series = pd.Series(URLS, index=range(10, 10 + len(URLS)))
+        df = socials.parse_series(series)
+        assert list(df.index) == list(series.index)
+        assert df.loc[10, "platform"] == "github"
+        assert df.loc[12, "repo"] == "socials"
+        assert pd.isna(df.loc[11, "platform"])
+
+    def test_categorical_columns(self):
+        df = socials.parse_series(pd.Series(URLS))
+        assert isinstance(df["platform"].dtype, pd.CategoricalDtype)
+        assert isinstance(df["entity_type"].dtype, pd.CategoricalDtype)
+        assert set(df["platform"].cat.categories) == {"email", "github", "twitter"}
+
+    def test_value_counts(self):
+        df = socials.parse_series(pd.Series(URLS))
+        assert df["platform"].value_counts()["github"] == 3
+
+    def test_platform_filter(self):
+        df = socials.parse_series(
+            pd.Series(URLS),
+            extractor=Extractor(platforms=["twitter"]),
+        )
+        assert df["platform"].notna().sum() == 1
+
+
+class TestWithoutPandas:
+    def test_parse_array_falls_back_to_numpy(self, monkeypatch):
+        import sys  # noqa: PLC0415
+
+        monkeypatch.setitem(sys.modules, "pandas", None)
+        columns = socials.parse_array(URLS)
+        assert columns["platform"][0] == "github"
+        assert columns["platform"][3] is None
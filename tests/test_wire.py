@@ -0,0 +1,116 @@
+"""Tests for the compact wire format."""
+
+import pickle
+
+import pytest
+from pydantic import BaseModel
+
+import socials
+from socials import wire
+from socials.extractor import Extraction
+
+URLS = [
+    "https://github.com/lorey",
+    "https://github.com/lorey/socials",
+    "https://twitter.com/karllorey",
+    "https://linkedin.com/in/karllorey",
+    "https://linkedin.com/company/acme",
+    "https://facebook.com/peterparker",
+    "https://facebook.com/profile.php?id=123456",
+    "https://instagram.com/lorey",
+    "https://youtube.com/channel/UCxyz123",
+    "https://youtube.com/@lorey",
+    "mailto:test@example.com",
+    "tel:+1234567890",
+]
+
+
+class TestRoundTrip:
+    @pytest.mark.parametrize("url", URLS)
+    def test_single_result(self, url):
+        result = socials.parse(url)
+        decoded = wire.loads(wire.dumps(result))
+        assert decoded == result
+        assert type(decoded) is type(result)
+
+    @pytest.mark.parametrize("url", URLS)
+    def test_tuple(self, url):
+        result = socials.parse(url)
+        row = wire.to_tuple(result)
+        assert isinstance(row[0], int)
+        assert result.url in row
+        assert wire.from_tuple(list(row)) == result
+
+    def test_extraction(self):
+        extraction = socials.parse_all(URLS)
+        decoded = wire.loads_extraction(wire.dumps_extraction(extraction))
+        assert isinstance(decoded, Extraction)
+        assert decoded.all() == extraction.all()
+
+    def test_empty_extraction(self):
+        decoded = wire.loads_extraction(wire.dumps_extraction(Extraction([])))
+        assert decoded.all() == []
+
+    def test_decoded_hierarchy_works(self):
+        result = wire.loads(wire.dumps(socials.parse(URLS[1])))
+        assert result.get_parent().username == "lorey"
+
+    def test_smaller_than_pickle(self):
+        extraction = socials.parse_all(URLS)
+        assert len(wire.dumps_extraction(extraction)) < len(pickle.dumps(extraction))
+
+
+class TestErrors:
+    def test_version_mismatch(self, monkeypatch):
+        data = wire.dumps(socials.parse(URLS[0]))
+        monkeypatch.setattr(wire, "WIRE_VERSION", wire.WIRE_VERSION + 1)
+        with pytest.raises(ValueError, match="Unsupported wire version"):
+            wire.loads(data)
+
+    def test_unknown_code(self):
+        with pytest.raises(ValueError, match="Unknown wire type code"):
+            wire.from_tuple((999, "https://example.com"))
+
+    def test_unregistered_type(self):
+        class CustomURL(BaseModel, frozen=True):
+            url: str
+
+        with pytest.raises(ValueError, match="No wire type code"):
+            wire.to_tuple(CustomURL(url="https://example.com"))
+
+
+class TestRegisterType:
+    def test_plugin_type_round_trip(self):
+        class MastodonProfileURL(BaseModel, frozen=True):
+            url: str
+            platform: str = "mastodon"
+            entity_type: str = "profile"
+            username: str
+
+        wire.register_type(200, MastodonProfileURL)
+        result = MastodonProfileURL(url="https://mastodon.social/@a", username="a")
+        assert wire.to_tuple(result) == (200, "https://mastodon.social/@a", "a")
+        assert wire.loads(wire.dumps(result)) == result
+
+    def test_reserved_code(self):
+        class CustomURL(BaseModel, frozen=True):
+            url: str
+
+        with pytest.raises(ValueError, match="reserved"):
+            wire.register_type(5, CustomURL)
+
+    def test_code_taken(self):
+        class FirstURL(BaseModel, frozen=True):
+            url: str
+
+        class SecondURL(BaseModel, frozen=True):
+            url: str
+
+        wire.register_type(201, FirstURL)
+        with pytest.raises(ValueError, match="already used"):
+            wire.register_type(201, SecondURL)
+
+    def test_fields(self):
+        from socials.platforms.github import GitHubRepoURL  # noqa: PLC0415
+
+        assert wire.fields(GitHubRepoURL) == ("url", "owner", "repo", "normalized_url")